@@ -6,6 +6,8 @@ Tezgah duruş analizi için genel ayarlar.
 DATA_PATHS = {
     "raw_data": "data/raw",
     "processed_data": "data/processed",
+    "cache": "data/cache",
+    "history": "data/history",
     "reports": "reports"
 }
 
@@ -13,9 +15,27 @@ DATA_PATHS = {
 VISUALIZATION_SETTINGS = {
     "dpi": 300,
     "default_figsize": (12, 8),
-    "default_threshold": 3.0  # Pasta grafik için eşik değeri (%)
+    "default_threshold": 3.0,  # Pasta grafik için eşik değeri (%)
+    "output_profile": "print",  # Varsayılan çıktı profili (OUTPUT_PROFILES anahtarı)
+    "family_profiles": {},  # Grafik ailesine özel profil, ör. {"oee_card": "print"}
+    "thumbnail_dpi": 30,  # Küçük resimlerin çözünürlüğü
+    "thumbnail_folder": "Raporlar/Küçük Resimler"
 }
 
+# Grafik çıktı profilleri
+# format: dosya biçimi (png, webp, svg, pdf), dpi: çözünürlük,
+# pil_kwargs: raster biçimler için kodlayıcı ayarları, thumbnail: küçük resim üretilsin mi,
+# capture: grafik dosyaya yazılmak yerine çok sayfalı PDF raporuna sayfa olarak aktarılsın mı
+OUTPUT_PROFILES = {
+    "preview": {"format": "webp", "dpi": 100, "pil_kwargs": {"quality": 90, "method": 4}, "thumbnail": False},
+    "print": {"format": "png", "dpi": VISUALIZATION_SETTINGS["dpi"], "thumbnail": False},
+    "vector": {"format": "svg", "dpi": 72, "thumbnail": True},
+    "pdf": {"format": "pdf", "dpi": 150, "thumbnail": False, "capture": True}
+}
+
+# Profil seçilebilen grafik aileleri
+CHART_FAMILIES = ["pie", "bar", "top_bottom", "machine_bar", "weekly_comparison", "oee_card", "machine_grid"]
+
 # Duruş kategorileri
 STOP_CATEGORIES = {
     "yemek": ["YEMEK MOLASI"],
@@ -24,6 +44,20 @@ STOP_CATEGORIES = {
     "ariza": ["ARIZA", "BOZULMA", "TAMIR"]
 }
 
+# Raporlarda tek satırda birleştirilen duruş kategorilerinin etiketleri
+# (etiketi olmayan kategorilerdeki duruşlar kendi adlarıyla raporlanır)
+STOP_CATEGORY_LABELS = {
+    "yemek": "YEMEK MOLASI",
+    "tasarim": "TASARIM DURUŞLARI",
+    "ayar": "AYAR"
+}
+
+# Birleştirmede STOP_CATEGORIES yerine kullanılan anahtar kelimeler; raporların önceki
+# sürümlerle aynı kalması için ayar satırında yalnızca SMED duruşları birleştirilir
+STOP_CATEGORY_MERGE_KEYWORDS = {
+    "ayar": ["SMED"]
+}
+
 # Excel sütun isimleri (Orijinal dosyadan farklı olması durumunda)
 COLUMN_MAPPINGS = {
     "makine_kodu": "İş Merkezi Kodu ",
@@ -4,6 +4,10 @@ Tezgah duruş analizi ana modülü.
 
 import os
 import time
+
+# Modül yükleme süresi ölçümü (--timings) için başlangıç zamanı
+_import_start = time.perf_counter()
+
 import argparse
 import logging
 import pandas as pd
@@ -11,25 +15,23 @@ import sys
 from typing import Dict, List, Tuple, Optional
 
 # Modülleri içe aktar
-from config.tezgah_listesi import KISIMLAR_DICT
 from src.data_processing import prepare_data_for_analysis, get_latest_week_data
+from config.settings import OUTPUT_PROFILES, CHART_FAMILIES
 from src.calculations import (
+    build_stop_cube,
     calculate_stop_time_sum,
     calculate_part_machine_average_time,
     calculate_machine_stop_times,
     calculate_machine_stop_type_times,
-    filter_sort_top_stops,
-    calculate_part_average_stop_times
-)
-from src.visualization import (
-    visualize_pie,
-    visualize_weekly_comparison,
-    visualize_bar,
-    plot_bar,
-    visualize_top_bottom_machines,
-    generate_oee_visuals
+    select_top_stops,
+    calculate_all_part_average_stop_times,
+    calculate_oee_table
 )
 
+# Grafik modülleri (matplotlib, seaborn, PIL) ağır olduğundan yalnızca grafik
+# çizilmeden hemen önce main() içinde yüklenir
+IMPORT_TIMINGS = {"Temel modüller (pandas, veri işleme, hesaplamalar)": time.perf_counter() - _import_start}
+
 # Loglama yapılandırması
 logging.basicConfig(
     level=logging.INFO,
@@ -61,8 +63,61 @@ def parse_arguments() -> argparse.Namespace:
                         help='Grafikleri kaydet')
     parser.add_argument('--export_excel', action='store_true',
                         help='Son haftanın verilerini Excel olarak dışa aktar')
+    parser.add_argument('--no_cache', action='store_true',
+                        help='Temizlenmiş veri önbelleğini kullanma')
+    parser.add_argument('--rebuild_cache', action='store_true',
+                        help='Veri önbelleğini yok sayıp yeniden oluştur')
+    parser.add_argument('--history_dir', type=str, default=None,
+                        help='Haftalık geçmiş deposu dizini (verilirse analiz depodan okunur)')
+    parser.add_argument('--history_weeks', type=int, default=4,
+                        help='Geçmiş deposundan analiz edilecek en son hafta sayısı')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Büyük duruş dosyalarını satır grupları halinde, sınırlı bellekle oku')
+    parser.add_argument('--chunk_size', type=int, default=50000,
+                        help='Akış modunda bir grupta okunacak satır sayısı')
+    parser.add_argument('--parallel_load', action='store_true',
+                        help='Duruş ve çalışma dosyalarını ayrı süreçlerde eşzamanlı yükle')
+    parser.add_argument('--registry_file', type=str, default=None,
+                        help='Harici tezgah kaydı dosyası (CSV/YAML); verilmezse config/tezgah_listesi.py kullanılır')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Grafik üretimi için süreç sayısı (varsayılan: işlemci çekirdeği sayısı, '
+                             '--show_plots ile grafikler sırayla çizilir)')
+    parser.add_argument('--no_render_cache', action='store_true',
+                        help='Grafik önbelleğini kullanma; verisi değişmemiş grafikleri de yeniden çiz')
+    parser.add_argument('--timings', action='store_true',
+                        help='Modül yükleme sürelerini ve duruş küpünün kazandırdığı süreyi raporla')
+    parser.add_argument('--output_profile', type=str, default=None, choices=list(OUTPUT_PROFILES),
+                        help='Grafik çıktı profili (varsayılan: config/settings.py içindeki output_profile)')
+    parser.add_argument('--family_profile', type=str, action='append', default=[], metavar='AİLE=PROFİL',
+                        help=f'Bir grafik ailesi için profil (tekrarlanabilir; aileler: {", ".join(CHART_FAMILIES)})')
+    parser.add_argument('--thumbnails', action='store_true',
+                        help='Grafiklerin küçük resimlerini de üret')
+    parser.add_argument('--oee_sheets', type=str, default=None, choices=['ek', 'yalniz'],
+                        help='Kısım ve tezgah OEE kartlarını hafta başına tek ızgara görselinde de (ek) '
+                             'veya yalnızca ızgara görselinde (yalniz) topla')
+    parser.add_argument('--oee_trends', action='store_true',
+                        help='Her kısım ve tezgah için haftaların OEE kartlarını tek trend şeridinde birleştir')
+    parser.add_argument('--report_format', type=str, default='grafik', choices=['grafik', 'html', 'pdf', 'ikisi'],
+                        help='Rapor biçimi: grafik dosyaları (grafik), tek dosyalık çevrimdışı HTML panosu (html), '
+                             'içindekiler sayfalı tek PDF raporu (pdf; grafik dosyası yazılmaz) veya grafik '
+                             'dosyaları ile HTML panosu (ikisi)')
+    parser.add_argument('--grid', type=str, default=None, choices=['kisim', 'tumu'],
+                        help='Tezgah pasta ve çubuk grafiklerini tezgah başına ayrı dosya yerine kısım başına '
+                             '(kisim) veya tüm tezgahlar için (tumu) ızgara sayfaları olarak çiz')
+    
+    args = parser.parse_args()
+    
+    # Aile profillerini sözlüğe dönüştür
+    family_profiles = {}
+    for entry in args.family_profile:
+        family, _, profile = entry.partition("=")
+        if family not in CHART_FAMILIES or profile not in OUTPUT_PROFILES:
+            parser.error(f"Geçersiz --family_profile değeri: {entry} "
+                         f"(aileler: {', '.join(CHART_FAMILIES)}; profiller: {', '.join(OUTPUT_PROFILES)})")
+        family_profiles[family] = profile
+    args.family_profile = family_profiles
     
-    return parser.parse_args()
+    return args
 
 def check_files_exist(durus_file: str, calisma_file: str, arizali_file: str) -> bool:
     """
@@ -96,6 +151,56 @@ def check_files_exist(durus_file: str, calisma_file: str, arizali_file: str) ->
     
     return True
 
+def select_plot_backend(show_plots: bool) -> None:
+    """
+    Grafikler gösterilmeyecekse pyplot yüklenmeden önce ekransız Agg arka ucunu seçer.
+    
+    Args:
+        show_plots: Grafik gösterme bayrağı
+    """
+    if not show_plots:
+        import matplotlib
+        matplotlib.use("Agg")
+
+def report_import_timings() -> None:
+    """
+    Modül yükleme sürelerini ekrana yazar ve loglar.
+    """
+    print("\nModül yükleme süreleri:")
+    for name, seconds in IMPORT_TIMINGS.items():
+        print(f"  {name}: {seconds:.2f} saniye")
+        logger.info(f"Modül yükleme süresi - {name}: {seconds:.2f} saniye")
+
+def time_raw_stop_calculations(
+    df: pd.DataFrame,
+    latest_week_df: pd.DataFrame,
+    kisim_tezgah_sayilari: Dict[str, int],
+    weeks: List[int]
+) -> float:
+    """
+    Duruş hesaplamalarını küp yerine satır bazlı veri üzerinde çalıştırıp süresini ölçer.
+    
+    Küp öncesi akıştaki gibi her fonksiyon ham satırları yeniden gruplar; sonuçlar
+    kullanılmaz, yalnızca küple kazanılan süreyi raporlamak için ölçülür.
+    
+    Args:
+        df: Analiz veri seti
+        latest_week_df: Son hafta verisi
+        kisim_tezgah_sayilari: Kısımlara göre tezgah sayıları
+        weeks: Sıralanmış hafta numaraları listesi (son hafta ilk sırada)
+    
+    Returns:
+        float: Hesaplamaların saniye cinsinden süresi
+    """
+    start = time.perf_counter()
+    calculate_stop_time_sum(latest_week_df)
+    calculate_part_machine_average_time(latest_week_df, kisim_tezgah_sayilari)
+    calculate_all_part_average_stop_times(latest_week_df, kisim_tezgah_sayilari)
+    calculate_machine_stop_times(latest_week_df)
+    calculate_machine_stop_type_times(latest_week_df)
+    select_top_stops(df, levels=['KISIM', 'İş Merkezi Kodu '], n=10, reference_week=weeks[0])
+    return time.perf_counter() - start
+
 def create_output_directories():
     """
     Çıktı dizinlerini oluşturur.
@@ -152,7 +257,15 @@ def main() -> None:
         df, kisim_tezgah_sayilari, weeks = prepare_data_for_analysis(
             args.durus_file,
             args.calisma_file,
-            args.arizali_file
+            args.arizali_file,
+            use_cache=not args.no_cache,
+            rebuild_cache=args.rebuild_cache,
+            history_dir=args.history_dir,
+            history_weeks=args.history_weeks,
+            streaming=args.streaming,
+            chunk_size=args.chunk_size,
+            parallel=args.parallel_load,
+            registry_file=args.registry_file
         )
         
         # Son hafta verisini al
@@ -167,175 +280,304 @@ def main() -> None:
         
         print("\nVeriler başarıyla yüklendi. Hesaplamalar yapılıyor...")
         
+        # Duruş verisini tek geçişte küpe topla; duruş hesaplamaları ham veri yerine küp dilimlerini kullanır
+        cube_start = time.perf_counter()
+        stop_cube = build_stop_cube(df, kisim_tezgah_sayilari)
+        latest_week_cube = get_latest_week_data(stop_cube, weeks)
+        cube_time = time.perf_counter() - cube_start
+        
+        calc_start = time.perf_counter()
+        
         # Duruş sürelerini hesapla
-        toplam_sureler = calculate_stop_time_sum(latest_week_df)
+        toplam_sureler = calculate_stop_time_sum(latest_week_cube)
         
         # Kısımlara göre tek tezgah için ortalama süreleri hesapla
         tezgah_basina_kisim_sureleri = calculate_part_machine_average_time(
-            latest_week_df, 
+            latest_week_cube, 
+            kisim_tezgah_sayilari
+        )
+        
+        # Her kısım için tezgah başına ortalama duruş sürelerini tek gruplamayla hesapla
+        kisim_ortalama_sureleri = calculate_all_part_average_stop_times(
+            latest_week_cube,
             kisim_tezgah_sayilari
         )
         
         # İş merkezlerinin toplam duruş sürelerini hesapla
-        tezgah_sureleri = calculate_machine_stop_times(latest_week_df)
+        tezgah_sureleri = calculate_machine_stop_times(latest_week_cube)
         
         # İş merkezleri için duruş tipine göre süreleri hesapla
-        tezgah_durus_ozet = calculate_machine_stop_type_times(latest_week_df)
-        
-        # Haftalar boyunca en büyük 10 duruşu hesapla (kısımlara göre)
-        filtered_kisimlar = filter_sort_top_stops(df, weeks[0])
+        tezgah_durus_ozet = calculate_machine_stop_type_times(latest_week_cube)
         
-        # Haftalar boyunca en büyük 10 duruşu hesapla (tezgahlara göre)
-        filtered_machine = filter_sort_top_stops(
-            df, 
-            weeks[0], 
-            gozlemlenecek='İş Merkezi Kodu '
+        # Haftalar boyunca en büyük 10 duruşu kısımlara ve tezgahlara göre birlikte hesapla
+        top_stops = select_top_stops(
+            stop_cube, 
+            levels=['KISIM', 'İş Merkezi Kodu '], 
+            n=10, 
+            reference_week=weeks[0]
         )
+        filtered_kisimlar = top_stops['KISIM']
+        filtered_machine = top_stops['İş Merkezi Kodu ']
         
-        print("\nHesaplamalar tamamlandı. Grafikler oluşturuluyor...")
+        calc_time = time.perf_counter() - calc_start
+        logger.info(f"Duruş küpü {cube_time:.2f} saniyede oluşturuldu ({len(df)} satır -> {len(stop_cube)} satır, "
+                    f"son hafta {len(latest_week_df)} satır -> {len(latest_week_cube)} satır). "
+                    f"Duruş hesaplamaları küp üzerinde {calc_time:.2f} saniye sürdü.")
         
-        # ------ Görselleştirmeler ------
+        # Karşılaştırma için aynı hesaplamaları bir kez satır bazlı veri üzerinde ölç
+        if args.timings:
+            raw_time = time_raw_stop_calculations(df, latest_week_df, kisim_tezgah_sayilari, weeks)
+            saved_time = raw_time - (cube_time + calc_time)
+            logger.info(f"Duruş hesaplamaları satır bazlı veri üzerinde {raw_time:.2f} saniye sürdü. "
+                        f"Küp ile kazanılan süre: {saved_time:.2f} saniye "
+                        f"(küp oluşturma dahil {cube_time + calc_time:.2f} saniye).")
+            print(f"Duruş küpü ile kazanılan süre: {saved_time:.2f} saniye "
+                  f"(satır bazlı: {raw_time:.2f} sn, küp: {cube_time + calc_time:.2f} sn)")
         
-        # Tüm tezgahlar için toplam duruş süreleri - pasta grafik
-        visualize_pie(
-            toplam_sureler, 
-            threshold=3, 
-            baslik="Tüm Tezgahlar Toplam",
-            save=args.save_plots, 
-            show=args.show_plots,
-            category_column="Duruş Adı"
-        )
+        print("\nHesaplamalar tamamlandı. Raporlar oluşturuluyor...")
         
-        # Tezgah başına ortalama duruş süreleri - pasta grafik
-        visualize_pie(
-            tezgah_basina_kisim_sureleri, 
-            baslik="Tüm Bölümler (Tezgah Başına)",
-            save=args.save_plots, 
-            show=args.show_plots,
-            category_column="KISIM"
-        )
+        # OEE ve diğer metrik değerleri (tüm hafta/kısım/tezgah değerleri tek gruplamayla)
+        oee_table = calculate_oee_table(df, weeks)
+        
+        # Tek dosyalık HTML panosu (toplanmış tablolar gömülür, grafikler tarayıcıda çizilir)
+        if args.report_format in ('html', 'ikisi'):
+            from src.dashboard import write_dashboard
+            dashboard_path = write_dashboard(stop_cube, oee_table, weeks, kisim_tezgah_sayilari)
+            print(f"HTML rapor panosu kaydedildi: {dashboard_path}")
         
-        # Her kısım için tezgah başına ortalama duruş süreleri - pasta grafik
-        for kisim in kisim_tezgah_sayilari.keys():
-            kisim_avg_sureler = calculate_part_average_stop_times(
-                latest_week_df,
-                kisim,
-                kisim_tezgah_sayilari
+        if args.report_format in ('grafik', 'pdf', 'ikisi'):
+            # Grafik modüllerini yükle (gösterim kapalıysa Agg arka ucuyla)
+            plot_import_start = time.perf_counter()
+            select_plot_backend(args.show_plots)
+            from src.visualization import (
+                visualize_pie,
+                visualize_bar,
+                visualize_top_bottom_machines,
+                pie_output_path,
+                bar_output_path,
+                TOP_BOTTOM_OUTPUT_PATH,
+                machine_pie_jobs,
+                plot_bar_jobs,
+                machine_grid_jobs,
+                stop_color_map,
+                weekly_comparison_jobs,
+                oee_card_jobs,
+                oee_mosaic_jobs
             )
-            
-            visualize_pie(
-                kisim_avg_sureler, 
-                baslik=f"{kisim} (Tezgah Başına)", 
-                threshold=3,
-                save=args.save_plots, 
-                show=args.show_plots,
-                category_column="Duruş Adı"
+            from src.rendering import (
+                RenderJob,
+                RENDER_MANIFEST_PATH,
+                run_render_jobs,
+                build_output_profiles,
+                profile_output_path
             )
-        
-        # En fazla duruş yapan tezgahlar - çubuk grafik
-        visualize_bar(
-            tezgah_sureleri, 
-            colors="Reds", 
-            bundan=-10, 
-            baslik="En Fazla Duruş Yapan 10 Tezgah",
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-        
-        # En az duruş yapan tezgahlar - çubuk grafik
-        visualize_bar(
-            tezgah_sureleri, 
-            colors="Greens", 
-            bundan=0, 
-            buna=10, 
-            baslik="En Az Duruş Yapan 10 Tezgah",
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-        
-        # En az ve en çok duruş yapan tezgahlar karşılaştırması - çubuk grafik
-        # Her bir tezgah için duruş nedenleri pasta grafikleri
-        print("\nHer tezgah için duruş nedenleri pasta grafikleri oluşturuluyor...")
-        unique_machines = latest_week_df["İş Merkezi Kodu "].unique()
-
-        # Tezgahlar için pasta grafik klasörünü oluştur
-        tezgah_pasta_path = "Raporlar/Tezgahlar/Son Hafta Pasta"
-        os.makedirs(tezgah_pasta_path, exist_ok=True)
-
-        for machine_code in unique_machines:
-            # Her tezgah için veriyi filtrele
-            machine_data = latest_week_df[latest_week_df["İş Merkezi Kodu "] == machine_code]
+            IMPORT_TIMINGS["Grafik modülleri (matplotlib, seaborn, PIL)"] = time.perf_counter() - plot_import_start
             
-            # ÇALIŞMA SÜRESİ dışındaki duruşları filtrele
-            machine_data = machine_data[machine_data["Duruş Adı"] != "ÇALIŞMA SÜRESİ"]
+            # Grafik ailelerinin çıktı profilleri (biçim, çözünürlük, küçük resim)
+            # PDF raporunda tüm aileler sayfa yakalayan "pdf" profiliyle çizilir
+            if args.report_format == 'pdf':
+                profiles = build_output_profiles(
+                    'pdf',
+                    {family: 'pdf' for family in CHART_FAMILIES},
+                    thumbnails=False
+                )
+            else:
+                profiles = build_output_profiles(
+                    args.output_profile,
+                    args.family_profile,
+                    thumbnails=True if args.thumbnails else None
+                )
             
-            # Toplam süreyi kontrol et
-            if machine_data["Süre (Dakika)"].sum() > 0:
-                # Duruş adlarına göre grupla ve süreleri topla
-                machine_stop_summary = machine_data.groupby("Duruş Adı")["Süre (Dakika)"].sum().reset_index()
-                
-                # Pasta grafiğini oluştur ve özel klasöre kaydet
-                visualize_pie(
-                    machine_stop_summary,
+            # ------ Görselleştirmeler ------
+            
+            # Tüm grafikler iş olarak toplanır ve tek süreç havuzunda çizilir
+            render_jobs = []
+            
+            # Tüm tezgahlar için toplam duruş süreleri - pasta grafik
+            render_jobs.append(RenderJob(
+                visualize_pie,
+                dict(
+                    data=toplam_sureler, 
+                    threshold=3, 
+                    baslik="Tüm Tezgahlar Toplam",
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    category_column="Duruş Adı",
+                    profile=profiles["pie"]
+                ),
+                pie_output_path("Tüm Tezgahlar Toplam", profile=profiles["pie"])
+            ))
+            
+            # Tezgah başına ortalama duruş süreleri - pasta grafik
+            render_jobs.append(RenderJob(
+                visualize_pie,
+                dict(
+                    data=tezgah_basina_kisim_sureleri, 
+                    baslik="Tüm Bölümler (Tezgah Başına)",
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    category_column="KISIM",
+                    profile=profiles["pie"]
+                ),
+                pie_output_path("Tüm Bölümler (Tezgah Başına)", profile=profiles["pie"])
+            ))
+            
+            # Her kısım için tezgah başına ortalama duruş süreleri - pasta grafik
+            for kisim, kisim_avg_sureler in kisim_ortalama_sureleri.items():
+                render_jobs.append(RenderJob(
+                    visualize_pie,
+                    dict(
+                        data=kisim_avg_sureler, 
+                        baslik=f"{kisim} (Tezgah Başına)", 
+                        threshold=3,
+                        save=args.save_plots, 
+                        show=args.show_plots,
+                        category_column="Duruş Adı",
+                        profile=profiles["pie"]
+                    ),
+                    pie_output_path(f"{kisim} (Tezgah Başına)", profile=profiles["pie"])
+                ))
+            
+            # En fazla duruş yapan tezgahlar - çubuk grafik
+            render_jobs.append(RenderJob(
+                visualize_bar,
+                dict(
+                    data=tezgah_sureleri, 
+                    colors="Reds", 
+                    bundan=-10, 
+                    baslik="En Fazla Duruş Yapan 10 Tezgah",
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    profile=profiles["bar"]
+                ),
+                bar_output_path("En Fazla Duruş Yapan 10 Tezgah", profiles["bar"])
+            ))
+            
+            # En az duruş yapan tezgahlar - çubuk grafik
+            render_jobs.append(RenderJob(
+                visualize_bar,
+                dict(
+                    data=tezgah_sureleri, 
+                    colors="Greens", 
+                    bundan=0, 
+                    buna=10, 
+                    baslik="En Az Duruş Yapan 10 Tezgah",
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    profile=profiles["bar"]
+                ),
+                bar_output_path("En Az Duruş Yapan 10 Tezgah", profiles["bar"])
+            ))
+            
+            # En az ve en çok duruş yapan tezgahlar karşılaştırması - çubuk grafik
+            render_jobs.append(RenderJob(
+                visualize_top_bottom_machines,
+                dict(
+                    df=tezgah_sureleri,
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    profile=profiles["top_bottom"]
+                ),
+                profile_output_path(TOP_BOTTOM_OUTPUT_PATH, profiles["top_bottom"])
+            ))
+            
+            # Orta seviyede duruş yapan tezgahlar - çubuk grafik
+            render_jobs.append(RenderJob(
+                visualize_bar,
+                dict(
+                    data=tezgah_sureleri, 
+                    bundan=10, 
+                    buna=-10, 
+                    text=0,
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    profile=profiles["bar"]
+                ),
+                bar_output_path("Tüm İş Merkezleri", profiles["bar"])
+            ))
+            
+            if args.grid:
+                # Tezgah pasta ve çubuk grafikleri kısım (veya tüm tezgahlar) başına ızgara sayfalarında;
+                # duruş renkleri tüm sayfalarda aynıdır
+                stop_colors = stop_color_map(latest_week_cube["Duruş Adı"].unique())
+                for kind in ("pie", "bar"):
+                    render_jobs += machine_grid_jobs(
+                        latest_week_cube,
+                        kind=kind,
+                        group_column="KISIM" if args.grid == "kisim" else None,
+                        threshold=3,
+                        colors=stop_colors,
+                        save=args.save_plots,
+                        show=args.show_plots,
+                        profile=profiles["machine_grid"]
+                    )
+            else:
+                # Her bir tezgah için duruş nedenleri pasta grafikleri
+                render_jobs += machine_pie_jobs(
+                    latest_week_cube,
+                    "Raporlar/Tezgahlar/Son Hafta Pasta",
                     threshold=3,  # %3'ten küçük olanları "Diğer" kategorisinde topla
-                    baslik=f"{machine_code} Duruş Nedenleri",
                     save=args.save_plots,
                     show=args.show_plots,
-                    category_column="Duruş Adı",
-                    custom_folder=tezgah_pasta_path  # Özel klasör yolu belirtiyoruz
+                    profile=profiles["pie"]
                 )
                 
-                logger.info(f"{machine_code} tezgahı için duruş nedenleri pasta grafiği oluşturuldu.")
-
-        visualize_top_bottom_machines(
-            tezgah_sureleri,
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-        
-        # Orta seviyede duruş yapan tezgahlar - çubuk grafik
-        visualize_bar(
-            tezgah_sureleri, 
-            bundan=10, 
-            buna=-10, 
-            text=0,
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-        
-        # Her tezgah için duruş nedenleri - çubuk grafik
-        plot_bar(
-            tezgah_durus_ozet,
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-        
-        # 4 haftalık kısımlara göre duruş karşılaştırması - çubuk grafik
-        visualize_weekly_comparison(
-            filtered_kisimlar,
-            egiklik=75,  # Eğiklik değerini 75 olarak ayarla
-            sort_by_last_week=True,
-            target_week=9,
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-
-        # 4 haftalık tezgahlara göre duruş karşılaştırması - çubuk grafik
-        visualize_weekly_comparison(
-            filtered_machine, 
-            gozlem="İş Merkezi Kodu ", 
-            egiklik=75,  # Eğiklik değerini kısım grafikleriyle aynı yap (0 yerine 75)
-            palet="Accent",
-            sort_by_last_week=True,
-            target_week=9,
-            save=args.save_plots, 
-            show=args.show_plots
-        )
-                
-        
-        # OEE ve diğer metrik görselleri
-        generate_oee_visuals(df, weeks)
-        
+                # Her tezgah için duruş nedenleri - çubuk grafik
+                render_jobs += plot_bar_jobs(
+                    tezgah_durus_ozet,
+                    save=args.save_plots, 
+                    show=args.show_plots,
+                    profile=profiles["machine_bar"]
+                )
+            
+            # 4 haftalık kısımlara göre duruş karşılaştırması - çubuk grafik
+            render_jobs += weekly_comparison_jobs(
+                filtered_kisimlar,
+                egiklik=75,  # Eğiklik değerini 75 olarak ayarla
+                sort_by_last_week=True,
+                target_week=9,
+                save=args.save_plots, 
+                show=args.show_plots,
+                profile=profiles["weekly_comparison"]
+            )
+            
+            # 4 haftalık tezgahlara göre duruş karşılaştırması - çubuk grafik
+            render_jobs += weekly_comparison_jobs(
+                filtered_machine, 
+                gozlem="İş Merkezi Kodu ", 
+                egiklik=75,  # Eğiklik değerini kısım grafikleriyle aynı yap (0 yerine 75)
+                palet="Accent",
+                sort_by_last_week=True,
+                target_week=9,
+                save=args.save_plots, 
+                show=args.show_plots,
+                profile=profiles["weekly_comparison"]
+            )
+            
+            # OEE görselleri
+            render_jobs += oee_card_jobs(oee_table, profiles["oee_card"], sheets=args.oee_sheets)
+            
+            # Son iki haftanın genel OEE karşılaştırması ve trend şeritleri (kartlar bellekte çizilir)
+            # (PDF raporunda genel kartlar tüm haftalar için zaten tek sayfada toplanır)
+            if args.report_format != 'pdf':
+                render_jobs += oee_mosaic_jobs(oee_table, weeks, trends=args.oee_trends, profile=profiles["oee_card"])
+            
+            if args.report_format == 'pdf':
+                # Grafikler dosyaya yazılmaz; sayfalar çizildikçe bölüm sırasıyla PDF'e eklenir
+                from src.pdf_report import write_pdf_report
+                pdf_path, render_results = write_pdf_report(render_jobs, workers=1 if args.show_plots else args.workers)
+                print(f"PDF raporu kaydedildi: {pdf_path}")
+            else:
+                # Grafik gösterimi açıksa grafikler bu süreçte sırayla çizilir; verisi değişmemiş grafikler atlanır
+                render_results = run_render_jobs(
+                    render_jobs,
+                    workers=1 if args.show_plots else args.workers,
+                    manifest_path=None if args.no_render_cache else RENDER_MANIFEST_PATH
+                )
+            failed_renders = [result for result in render_results if result.error]
+            if failed_renders:
+                print(f"UYARI: {len(failed_renders)} grafik oluşturulamadı. Ayrıntılar için log dosyasına bakın.")
+            
         # Program tamamlandı
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -347,7 +589,10 @@ def main() -> None:
         logger.info(f"Analiz tamamlandı. Toplam çalışma süresi: {elapsed_time:.2f} saniye.")
         logger.info(f"Tezgah başına işlem süresi: {time_per_machine:.2f} saniye.")
         
-        print("\nGrafikler oluşturuldu ve kaydedildi.")
+        if args.timings:
+            report_import_timings()
+        
+        print("\nRaporlar oluşturuldu ve kaydedildi.")
         print(f"Toplam çalışma süresi: {elapsed_time:.2f} saniye.")
         print(f"Tezgah başına işlem süresi: {time_per_machine:.2f} saniye.")
         print("\nSonuçlar 'Raporlar' klasöründe bulunabilir.")
@@ -0,0 +1,248 @@
+"""
+Ayrıştırılmış Excel girdileri için sütunlu disk önbelleği.
+"""
+
+import os
+import json
+import hashlib
+import pandas as pd
+from typing import Callable, Dict, Optional
+import logging
+
+# Konfigürasyon dosyalarını içe aktar
+from config.settings import DATA_PATHS
+from src.registry import get_registry
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("cache.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Önbellek dosya yapısı değiştiğinde artırılır, eski girdiler geçersiz olur
+CACHE_VERSION = 2
+
+def storage_format() -> str:
+    """
+    Kullanılabilir en hızlı saklama biçimini belirler.
+    
+    Returns:
+        str: "parquet" (pyarrow kuruluysa) veya "pickle"
+    """
+    try:
+        import pyarrow  # noqa: F401
+        return "parquet"
+    except ImportError:
+        logger.warning("pyarrow bulunamadı, önbellek pickle biçiminde saklanacak.")
+        return "pickle"
+
+def file_content_hash(file_path: str, block_size: int = 1 << 20) -> str:
+    """
+    Dosya içeriğinin SHA-256 özetini hesaplar.
+    
+    Args:
+        file_path: Dosya yolu
+        block_size: Okuma blok boyutu (bayt)
+    
+    Returns:
+        str: Onaltılık özet
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def config_hash() -> str:
+    """
+    Kısım/tezgah konfigürasyonunun özetini hesaplar.
+    
+    Returns:
+        str: Etkin tezgah kaydı içeriğinin onaltılık özeti
+    """
+    return get_registry().fingerprint()
+
+def _manifest_path(cache_dir: str, kind: str, source_path: str) -> str:
+    """
+    Kaynak dosyaya ait önbellek kaydının yolunu döndürür.
+    """
+    source_key = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{kind}-{source_key}.json")
+
+def _read_manifest(path: str) -> Dict:
+    """
+    Önbellek kaydını okur, yoksa veya bozuksa boş sözlük döndürür.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_manifest(path: str, manifest: Dict) -> None:
+    """
+    Önbellek kaydını yazar.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+def _resolve_content_hash(source_path: str, manifest: Dict) -> str:
+    """
+    Kaynak dosyanın içerik özetini döndürür.
+    
+    Dosyanın boyutu ve değiştirilme zamanı kayıttakiyle aynıysa kayıtlı özet
+    kullanılır; aksi halde içerik yeniden özetlenir.
+    """
+    stat = os.stat(source_path)
+    if manifest.get("mtime") == stat.st_mtime and manifest.get("size") == stat.st_size:
+        return manifest.get("content_hash", "")
+    return file_content_hash(source_path)
+
+def get_cached_frame(
+    source_path: str,
+    kind: str,
+    cache_dir: Optional[str] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Kaynak dosya ve konfigürasyon değişmediyse önbellekteki DataFrame'i yükler.
+    
+    Args:
+        source_path: Kaynak Excel dosyasının yolu
+        kind: Veri türü (ör. "durus", "calisma")
+        cache_dir: Önbellek dizini (None ise ayarlardaki dizin kullanılır)
+    
+    Returns:
+        Optional[pd.DataFrame]: Geçerli önbellek varsa DataFrame, yoksa None
+    """
+    cache_dir = cache_dir or DATA_PATHS["cache"]
+    manifest_path = _manifest_path(cache_dir, kind, source_path)
+    manifest = _read_manifest(manifest_path)
+    
+    if not manifest or manifest.get("version") != CACHE_VERSION:
+        return None
+    
+    if manifest.get("config_hash") != config_hash():
+        logger.info(f"Tezgah konfigürasyonu değişmiş, {kind} önbelleği geçersiz.")
+        return None
+    
+    content_hash = _resolve_content_hash(source_path, manifest)
+    if content_hash != manifest.get("content_hash"):
+        logger.info(f"Kaynak dosya değişmiş, {kind} önbelleği geçersiz: {source_path}")
+        return None
+    
+    data_path = os.path.join(cache_dir, manifest["data_file"])
+    if not os.path.exists(data_path):
+        return None
+    
+    try:
+        if manifest.get("format") == "parquet":
+            df = pd.read_parquet(data_path)
+        else:
+            df = pd.read_pickle(data_path)
+    except Exception as e:
+        logger.warning(f"Önbellek okunamadı, yeniden oluşturulacak: {str(e)}")
+        return None
+    
+    # İçerik aynı ama dosyaya dokunulmuşsa kaydı güncelle, sonraki çalıştırmada özetleme yapılmasın
+    stat = os.stat(source_path)
+    if manifest.get("mtime") != stat.st_mtime:
+        manifest.update({"mtime": stat.st_mtime, "size": stat.st_size})
+        _write_manifest(manifest_path, manifest)
+    
+    logger.info(f"{kind} verisi önbellekten yüklendi. Satır sayısı: {len(df)}")
+    return df
+
+def store_cached_frame(
+    df: pd.DataFrame,
+    source_path: str,
+    kind: str,
+    cache_dir: Optional[str] = None
+) -> None:
+    """
+    Temizlenmiş DataFrame'i önbelleğe yazar.
+    
+    Args:
+        df: Saklanacak DataFrame
+        source_path: Kaynak Excel dosyasının yolu
+        kind: Veri türü (ör. "durus", "calisma")
+        cache_dir: Önbellek dizini (None ise ayarlardaki dizin kullanılır)
+    """
+    cache_dir = cache_dir or DATA_PATHS["cache"]
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    manifest_path = _manifest_path(cache_dir, kind, source_path)
+    old_manifest = _read_manifest(manifest_path)
+    
+    stat = os.stat(source_path)
+    content_hash = file_content_hash(source_path)
+    cfg_hash = config_hash()
+    fmt = storage_format()
+    extension = "parquet" if fmt == "parquet" else "pkl"
+    data_file = f"{kind}-{content_hash[:16]}-{cfg_hash[:8]}.{extension}"
+    data_path = os.path.join(cache_dir, data_file)
+    
+    try:
+        if fmt == "parquet":
+            df.to_parquet(data_path, index=False)
+        else:
+            df.to_pickle(data_path)
+    except Exception as e:
+        # Önbellek bir hızlandırmadır; yazılamaması analizi durdurmamalı
+        logger.warning(f"{kind} önbelleği yazılamadı: {str(e)}")
+        return
+    
+    # Aynı kaynağa ait eski önbellek dosyasını kaldır
+    old_file = old_manifest.get("data_file")
+    if old_file and old_file != data_file:
+        try:
+            os.remove(os.path.join(cache_dir, old_file))
+        except OSError:
+            pass
+    
+    _write_manifest(manifest_path, {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(source_path),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "content_hash": content_hash,
+        "config_hash": cfg_hash,
+        "format": fmt,
+        "data_file": data_file
+    })
+    logger.info(f"{kind} verisi önbelleğe yazıldı: {data_path}")
+
+def load_with_cache(
+    source_path: str,
+    kind: str,
+    builder: Callable[[str], pd.DataFrame],
+    cache_dir: Optional[str] = None,
+    rebuild: bool = False
+) -> pd.DataFrame:
+    """
+    Veriyi önbellekten yükler; önbellek geçersizse builder ile oluşturup saklar.
+    
+    Args:
+        source_path: Kaynak Excel dosyasının yolu
+        kind: Veri türü (ör. "durus", "calisma")
+        builder: Kaynak dosyadan temizlenmiş DataFrame üreten fonksiyon
+        cache_dir: Önbellek dizini (None ise ayarlardaki dizin kullanılır)
+        rebuild: True ise mevcut önbellek yok sayılır ve yeniden oluşturulur
+    
+    Returns:
+        pd.DataFrame: Temizlenmiş veri
+    """
+    if not rebuild:
+        cached_df = get_cached_frame(source_path, kind, cache_dir)
+        if cached_df is not None:
+            return cached_df
+    else:
+        logger.info(f"{kind} önbelleği yeniden oluşturuluyor.")
+    
+    df = builder(source_path)
+    store_cached_frame(df, source_path, kind, cache_dir)
+    return df
@@ -7,6 +7,10 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 import logging
 
+# Konfigürasyon dosyasını ve duruş kategori tablosunu içe aktar
+from config.settings import STOP_CATEGORY_LABELS
+from src.stop_categories import STOP_CATEGORY_COLUMN, assign_stop_category
+
 # Loglama yapılandırması
 logging.basicConfig(
     level=logging.INFO,
@@ -18,8 +22,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Duruş küpünün toplama anahtarları (küpteki "Duruş Adı" normalleştirilmiş duruş kategorisidir)
+STOP_CUBE_KEYS = ["İş Merkezi Kodu ", "KISIM", "Hafta", "Duruş Adı"]
+
+# Kısım tezgah sayısına satır bazında bölünmüş sürelerin küpteki toplamı
+AVERAGE_SECOND_COLUMN = "Ortalama Süre (Saniye)"
+
+# OEE tablosundaki metrik sütunları
+OEE_COLUMNS = ["Oee", "Performans", "Kullanılabilirlik", "Kalite"]
+
 def second_to_minute(df: pd.DataFrame, second_col: str = "Süre (Saniye)", 
-                    minute_col: str = "Süre (Dakika)") -> pd.DataFrame:
+                    minute_col: str = "Süre (Dakika)", copy: bool = True) -> pd.DataFrame:
     """
     Saniye cinsinden verilen süreleri dakikaya çevirir.
     
@@ -27,64 +40,117 @@ def second_to_minute(df: pd.DataFrame, second_col: str = "Süre (Saniye)",
         df: İşlenecek DataFrame
         second_col: Saniye sütununun adı
         minute_col: Dakika sütununun adı
+        copy: False ise df sahiplenilir ve dakika sütunu yerinde eklenir
         
     Returns:
         pd.DataFrame: Dakika sütunu eklenmiş DataFrame
     """
     # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Saniyeyi dakikaya çevir
     result_df[minute_col] = (result_df[second_col] / 60).astype(int)
     
     return result_df
 
-def calculate_stop_time_sum(df: pd.DataFrame) -> pd.DataFrame:
+def stop_category(df: pd.DataFrame) -> pd.Series:
     """
-    Duruş adlarına göre süreleri toplar ve benzer duruşları birleştirir.
+    Gruplamalarda kullanılacak normalleştirilmiş duruş adlarını döndürür.
+    
+    Veri setinde hazır "Duruş Kategorisi" sütunu varsa o kullanılır, yoksa
+    kategori tablosu duruş adlarından bir kez hesaplanır.
     
     Args:
         df: İşlenecek DataFrame
         
     Returns:
-        pd.DataFrame: Duruş sürelerinin toplamını içeren DataFrame
+        pd.Series: "Duruş Adı" adlı kategorik duruş kategorisi sütunu
     """
-    logger.info("Duruş süreleri hesaplanıyor...")
-    
-    # Duruş adlarına göre süreleri topla
-    toplam_sureler = df.groupby("Duruş Adı")["Süre (Saniye)"].sum().reset_index()
-    toplam_sureler = toplam_sureler.sort_values(by="Süre (Saniye)", ascending=False)
-
-    # Farklı kategorilerde duruşları filtrele
-    yemek_molasi = toplam_sureler[toplam_sureler['Duruş Adı'].str.contains("YEMEK MOLASI", case=False)]
-    tasarim_duruslari = toplam_sureler[toplam_sureler['Duruş Adı'].str.contains("TASARIM", case=False)]
-    smed_duruslari = toplam_sureler[toplam_sureler['Duruş Adı'].str.contains("SMED", case=False)]
+    if STOP_CATEGORY_COLUMN in df.columns:
+        categories = df[STOP_CATEGORY_COLUMN]
+    else:
+        categories = assign_stop_category(df["Duruş Adı"])
+    return categories.rename("Duruş Adı")
 
-    # Süreleri topla
-    yemek_molasi_toplam = yemek_molasi['Süre (Saniye)'].sum()
-    tasarim_duruslari_toplam = tasarim_duruslari['Süre (Saniye)'].sum()
-    smed_duruslari_toplam = smed_duruslari['Süre (Saniye)'].sum()
-
-    # Birleştirilmiş duruş satırları oluştur
-    new_data = {
-        'Duruş Adı': ['YEMEK MOLASI', 'TASARIM DURUŞLARI', 'AYAR'],
-        'Süre (Saniye)': [yemek_molasi_toplam, tasarim_duruslari_toplam, smed_duruslari_toplam]
-    }
-    new_df = pd.DataFrame(new_data)
-
-    # Yemek molası, tasarım ve SMED duruşlarının eski satırlarını sil
-    toplam_sureler = toplam_sureler[
-        ~toplam_sureler['Duruş Adı'].str.contains("YEMEK MOLASI|TASARIM|SMED", case=False)
-    ]
+def stop_time_table(seconds: pd.Series) -> pd.DataFrame:
+    """
+    Duruş kategorisine göre toplanmış sürelerden sıralı duruş süresi tablosunu oluşturur.
+    
+    Birleşik kategori satırları (yemek, tasarım, ayar) veride olmasa da sıfır süreyle
+    yer alır; önceki hesaplamadaki gibi diğer duruşların arkasına eklenip birlikte
+    sıralanır.
+    
+    Args:
+        seconds: Duruş kategorisi indeksli "Süre (Saniye)" toplamları
+        
+    Returns:
+        pd.DataFrame: Duruş Adı, Süre (Saniye) ve Süre (Dakika) sütunlu tablo
+    """
+    labels = list(STOP_CATEGORY_LABELS.values())
+    seconds = seconds.rename("Süre (Saniye)").rename_axis("Duruş Adı")
+    
+    others = seconds[~seconds.index.astype(object).isin(labels)].reset_index()
+    others = others.sort_values(by="Süre (Saniye)", ascending=False)
+    merged = pd.DataFrame({
+        "Duruş Adı": labels,
+        "Süre (Saniye)": [seconds.get(label, 0) for label in labels]
+    })
+    
+    table = pd.concat([others.astype({"Duruş Adı": object}), merged], ignore_index=True)
+    table = table.sort_values(by="Süre (Saniye)", ascending=False).reset_index(drop=True)
+    return second_to_minute(table, copy=False)
 
-    # Güncellenmiş DataFrame ile yeni satırları birleştir
-    toplam_sureler = pd.concat([toplam_sureler, new_df], ignore_index=True)
+def build_stop_cube(
+    df: pd.DataFrame,
+    kisim_tezgah_sayilari: Optional[Dict[str, int]] = None
+) -> pd.DataFrame:
+    """
+    Duruş hesaplamalarının ortak girdisi olan önceden toplanmış küpü oluşturur.
+    
+    Veri tek geçişte tezgah, kısım, hafta ve duruş kategorisine göre toplanır. Küp aynı
+    sütun adlarını taşıdığından duruş hesaplama fonksiyonları (ve son hafta
+    dilimi) ham veri yerine doğrudan küple çağrılabilir; süreler toplandığı için
+    sonuçlar aynıdır. Kısım tezgah sayıları verilirse, kısım ortalamalarının
+    satır bazlı tamsayı bölmesini koruyan "Ortalama Süre (Saniye)" sütunu da eklenir.
+    
+    Args:
+        df: Hafta ve kısım bilgisi eklenmiş analiz veri seti
+        kisim_tezgah_sayilari: Kısımlara göre tezgah sayıları (opsiyonel)
+        
+    Returns:
+        pd.DataFrame: Toplanmış duruş küpü
+    """
+    value_columns = [col for col in ["Süre (Saniye)", "Süre (Dakika)"] if col in df.columns]
+    cube_df = df[STOP_CUBE_KEYS[:-1] + value_columns].assign(**{"Duruş Adı": stop_category(df)})
+    
+    if kisim_tezgah_sayilari is not None:
+        # calculate_part_average_stop_times'taki gibi önce her satır bölünüp tamsayıya çevrilir
+        tezgah_sayilari = df["KISIM"].astype(object).map(kisim_tezgah_sayilari).fillna(1)
+        cube_df = cube_df.assign(**{
+            AVERAGE_SECOND_COLUMN: (df["Süre (Saniye)"] / tezgah_sayilari).astype(int)
+        })
+    
+    # Eksik duruş adları ham veride olduğu gibi kısım ve tezgah toplamlarına dahil kalır
+    cube_df = cube_df.groupby(STOP_CUBE_KEYS, observed=True, dropna=False).sum().reset_index()
+    cube_df[STOP_CATEGORY_COLUMN] = cube_df["Duruş Adı"]
+    
+    logger.info(f"Duruş küpü oluşturuldu: {len(df)} satır -> {len(cube_df)} satır")
+    return cube_df
 
-    # Süreye göre büyükten küçüğe sırala
-    toplam_sureler = toplam_sureler.sort_values(by="Süre (Saniye)", ascending=False).reset_index(drop=True)
+def calculate_stop_time_sum(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Duruş kategorilerine göre süreleri toplar (benzer duruşlar birleşik raporlanır).
     
-    # Saniyeden dakikaya çevir
-    toplam_sureler = second_to_minute(toplam_sureler)
+    Args:
+        df: İşlenecek DataFrame
+        
+    Returns:
+        pd.DataFrame: Duruş sürelerinin toplamını içeren DataFrame
+    """
+    logger.info("Duruş süreleri hesaplanıyor...")
+    
+    # Duruş kategorilerine göre süreleri topla (yemek, tasarım ve ayar duruşları tek satırda birleşir)
+    toplam_sureler = stop_time_table(df.groupby(stop_category(df), observed=True)["Süre (Saniye)"].sum())
     
     logger.info("Duruş süreleri hesaplaması tamamlandı.")
     return toplam_sureler
@@ -109,14 +175,12 @@ def calculate_part_machine_average_time(
     filtered_df = df[df["Duruş Adı"] != "ÇALIŞMA SÜRESİ"].copy()
     
     # Kısımlara göre toplam süreleri hesapla
-    kisim_sureleri = filtered_df.groupby("KISIM")["Süre (Saniye)"].sum().reset_index()
+    kisim_sureleri = filtered_df.groupby("KISIM", observed=True)["Süre (Saniye)"].sum().reset_index()
     kisim_sureleri = kisim_sureleri.sort_values(by="KISIM", ascending=True)
 
-    # KISIM değerlerini tezgah sayılarına bölerek güncelle
-    for idx, row in kisim_sureleri.iterrows():
-        if row["KISIM"] in kisim_tezgah_sayilari:
-            tezgah_sayisi = kisim_tezgah_sayilari[row["KISIM"]]
-            kisim_sureleri.at[idx, "Süre (Saniye)"] = row["Süre (Saniye)"] / tezgah_sayisi
+    # KISIM değerlerini tezgah sayılarına bölerek güncelle (listede olmayan kısımlar bölünmez)
+    tezgah_sayilari = kisim_sureleri["KISIM"].astype(object).map(kisim_tezgah_sayilari).fillna(1)
+    kisim_sureleri["Süre (Saniye)"] = kisim_sureleri["Süre (Saniye)"] / tezgah_sayilari
 
     # Diğer satırı varsa sil
     kisim_sureleri = kisim_sureleri[kisim_sureleri['KISIM'] != 'Diğer']
@@ -143,10 +207,10 @@ def calculate_machine_stop_times(df: pd.DataFrame) -> pd.DataFrame:
     filtered_df = df[df['Duruş Adı'] != 'ÇALIŞMA SÜRESİ'].copy()
     
     # İş merkezi koduna göre toplam süreleri hesapla
-    tezgah_sureleri = filtered_df.groupby("İş Merkezi Kodu ")["Süre (Saniye)"].sum().reset_index()
+    tezgah_sureleri = filtered_df.groupby("İş Merkezi Kodu ", observed=True)["Süre (Saniye)"].sum().reset_index()
     
     # Saniyeden dakikaya çevir
-    tezgah_sureleri = second_to_minute(tezgah_sureleri)
+    tezgah_sureleri = second_to_minute(tezgah_sureleri, copy=False)
     
     # Süreye göre sırala
     tezgah_sureleri = tezgah_sureleri.sort_values(by="Süre (Dakika)", ascending=True)
@@ -166,136 +230,185 @@ def calculate_machine_stop_type_times(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Tezgah duruş tipi süreleri hesaplanıyor...")
     
-    # Her bir "İş Merkezi Kodu" ve "Duruş Adı" için toplam süreyi hesapla
-    tezgah_durus_ozet = df.groupby(["İş Merkezi Kodu ", "Duruş Adı"])["Süre (Saniye)"].sum().reset_index()
-
-    # "YEMEK MOLASI" ve "TASARIM" ile başlayan satırları bul ve toplam sürelerini al
-    yemek_molasi = tezgah_durus_ozet[tezgah_durus_ozet['Duruş Adı'].str.startswith("YEMEK MOLASI")]
-    tasarim_durusu = tezgah_durus_ozet[tezgah_durus_ozet['Duruş Adı'].str.startswith("TASARIM")]
-    smed_durusu = tezgah_durus_ozet[tezgah_durus_ozet['Duruş Adı'].str.contains("SMED", case=False)]
-
-    # İş Merkezi Kodu bazında toplamları al
-    yemek_molasi_toplam = yemek_molasi.groupby("İş Merkezi Kodu ")['Süre (Saniye)'].sum().reset_index()
-    tasarim_durusu_toplam = tasarim_durusu.groupby("İş Merkezi Kodu ")['Süre (Saniye)'].sum().reset_index()
-    smed_durusu_toplam = smed_durusu.groupby("İş Merkezi Kodu ")['Süre (Saniye)'].sum().reset_index()
-
-    # Yeni isimler vererek dataframe'e eklemek için sütun ekle
-    yemek_molasi_toplam['Duruş Adı'] = "YEMEK MOLASI"
-    tasarim_durusu_toplam['Duruş Adı'] = "TASARIM DURUŞU"
-    smed_durusu_toplam['Duruş Adı'] = "AYAR"
-
-    # Ana df'deki "YEMEK MOLASI", "TASARIM" ve "SMED" ile başlayan satırları filtrele
-    tezgah_durus_ozet = tezgah_durus_ozet[~tezgah_durus_ozet['Duruş Adı'].str.startswith("YEMEK MOLASI")]
-    tezgah_durus_ozet = tezgah_durus_ozet[~tezgah_durus_ozet['Duruş Adı'].str.startswith("TASARIM")]
-    tezgah_durus_ozet = tezgah_durus_ozet[~tezgah_durus_ozet['Duruş Adı'].str.contains("SMED")]
-
-    # Yeni toplamları ana dataframe'e ekle
-    tezgah_durus_ozet = pd.concat([
-        tezgah_durus_ozet, 
-        yemek_molasi_toplam, 
-        tasarim_durusu_toplam, 
-        smed_durusu_toplam
-    ], ignore_index=True)
+    # Her bir "İş Merkezi Kodu" ve duruş kategorisi için toplam süreyi hesapla
+    tezgah_durus_ozet = df.groupby(
+        [df["İş Merkezi Kodu "], stop_category(df)], observed=True
+    )["Süre (Saniye)"].sum().reset_index()
 
     # Saniyeden dakikaya çevir
-    tezgah_durus_ozet = second_to_minute(tezgah_durus_ozet)
+    tezgah_durus_ozet = second_to_minute(tezgah_durus_ozet, copy=False)
     
     logger.info("Tezgah duruş tipi süreleri hesaplaması tamamlandı.")
     return tezgah_durus_ozet
 
-def filter_sort_top_stops(
-    df: pd.DataFrame, 
-    max_week: int = 9,  # Varsayılan değer 9 olarak değiştirildi
-    gozlemlenecek: str = "KISIM"
-) -> pd.DataFrame:
+def select_top_stops(
+    df: pd.DataFrame,
+    levels: List[str] = ("KISIM", "İş Merkezi Kodu "),
+    n: int = 10,
+    reference_week: Optional[int] = None
+) -> Dict[str, pd.DataFrame]:
     """
-    Her bir kısım veya tezgah için en büyük 10 duruşu filtreleyip sıralar.
+    Birden fazla gözlem seviyesi için her varlığın en büyük N duruşunu seçer.
+    
+    Süreler tüm seviyeler için tek gruplamayla toplanır ve her seviyeye bu
+    tablodan indirgenir. Seçim referans haftasında varlık başına kısmi seçimle
+    (nlargest) yapılır; seçilen duruşların tüm haftalardaki değerleri döndürülür.
     
     Args:
-        df: İşlenecek DataFrame
-        max_week: Sıralama için kullanılacak hafta numarası (varsayılan: 9)
-        gozlemlenecek: Gruplandırma için kullanılacak sütun adı (KISIM veya İş Merkezi Kodu)
+        df: İşlenecek DataFrame veya duruş küpü
+        levels: Gözlem seviyeleri (KISIM ve/veya İş Merkezi Kodu)
+        n: Varlık başına seçilecek duruş sayısı
+        reference_week: Seçimin yapılacağı hafta (None veya veride yoksa en büyük hafta)
         
     Returns:
-        pd.DataFrame: Filtrelenmiş ve sıralanmış DataFrame
+        Dict[str, pd.DataFrame]: Seviye -> filtrelenmiş ve sıralanmış DataFrame
     """
-    logger.info(f"{gozlemlenecek} için en büyük 10 duruş hesaplanıyor...")
+    levels = list(levels)
+    logger.info(f"{', '.join(levels)} için en büyük {n} duruş hesaplanıyor...")
     
     # Veri setini kontrol et
     if df.empty:
         logger.warning("Veri seti boş! Filtreleme yapılamıyor.")
-        return pd.DataFrame()
+        return {level: pd.DataFrame() for level in levels}
     
-    # Gerekli sütunları kontrol et
-    required_columns = [gozlemlenecek, 'Hafta', 'Duruş Adı', 'Süre (Saniye)']
-    for col in required_columns:
-        if col not in df.columns:
-            logger.error(f"Gerekli sütun bulunamadı: {col}")
-            empty_df = pd.DataFrame(columns=required_columns)
-            return empty_df
+    results = {}
     
-    try:
-        # 'Gözlemlenecek', 'Hafta' ve 'Duruş Adı' kolonlarına göre gruplandırıp 
-        # 'Süre (Saniye)' kolonunun toplamını hesapla
-        grouped_df = df.groupby([gozlemlenecek, 'Hafta', 'Duruş Adı'])['Süre (Saniye)'].sum().reset_index()
+    # Gerekli sütunları kontrol et
+    valid_levels = []
+    for level in levels:
+        required_columns = [level, 'Hafta', 'Duruş Adı', 'Süre (Saniye)']
+        missing = [col for col in required_columns if col not in df.columns]
+        if missing:
+            logger.error(f"Gerekli sütun bulunamadı: {missing[0]}")
+            results[level] = pd.DataFrame(columns=required_columns)
+        else:
+            valid_levels.append(level)
+    
+    if not valid_levels:
+        return results
+    
+    # Tüm seviyeler için tek gruplama; her seviye bu tablodan toplanır
+    base = df.groupby(
+        [df[level] for level in valid_levels] + [df['Hafta'], stop_category(df)], observed=True
+    )['Süre (Saniye)'].sum()
+    
+    for level in valid_levels:
+        grouped_df = base.groupby(level=[level, 'Hafta', 'Duruş Adı'], observed=True).sum().reset_index()
         
         # 'Diğer' kısmını filtrele (eğer KISIM sütunu varsa)
-        if gozlemlenecek == 'KISIM':
-            grouped_df = grouped_df[grouped_df[gozlemlenecek] != 'Diğer']
-        
-        # 'Duruş Adı' değerlerini yeniden sınıflandır
-        grouped_df['Duruş Adı'] = grouped_df['Duruş Adı'].apply(
-            lambda x: 'YEMEK MOLASI' if 'YEMEK MOLASI' in x 
-            else ('TASARIM DURUŞLARI' if 'TASARIM' in x else x)
-        )
+        if level == 'KISIM':
+            grouped_df = grouped_df[grouped_df[level] != 'Diğer']
         
-        # Aynı gözlemlenecek, hafta ve duruş adı altında gruplandırıp, 'Süre (Saniye)' kolonunu topla
-        grouped_df = grouped_df.groupby([gozlemlenecek, 'Hafta', 'Duruş Adı'], as_index=False)['Süre (Saniye)'].sum()
-        
-        # max_week değerinin geçerli olup olmadığını kontrol et
+        # Referans haftanın geçerli olup olmadığını kontrol et
         valid_weeks = grouped_df['Hafta'].unique()
-        if max_week not in valid_weeks:
-            logger.warning(f"max_week ({max_week}) geçerli hafta değerleri ({valid_weeks}) içinde değil!")
-            if len(valid_weeks) > 0:
-                # En büyük haftayı kullan
-                max_week = max(valid_weeks)
-                logger.info(f"En büyük hafta ({max_week}) kullanılıyor.")
-            else:
+        level_week = reference_week
+        if level_week not in valid_weeks:
+            if len(valid_weeks) == 0:
                 logger.error("Geçerli hafta değeri bulunamadı!")
-                return pd.DataFrame()
-        
-        # Maksimum hafta değerine göre filtreleme
-        latest_week_df = grouped_df[grouped_df['Hafta'] == max_week]
+                results[level] = pd.DataFrame()
+                continue
+            if level_week is not None:
+                logger.warning(f"Referans hafta ({level_week}) geçerli hafta değerleri ({valid_weeks}) içinde değil!")
+            # En büyük haftayı kullan
+            level_week = max(valid_weeks)
+            logger.info(f"En büyük hafta ({level_week}) kullanılıyor.")
         
-        if latest_week_df.empty:
-            logger.warning(f"Hafta {max_week} için veri bulunamadı!")
-            return pd.DataFrame()
+        reference_df = grouped_df[grouped_df['Hafta'] == level_week]
         
-        # Her gözlemlenecek için en büyük 10 duruşu al
-        top10 = (
-            latest_week_df.sort_values([gozlemlenecek, 'Süre (Saniye)'], ascending=[True, False])
-            .groupby(gozlemlenecek)
-            .head(10)
-            .reset_index(drop=True)
+        # Her varlık için en büyük N duruşu tam sıralama yapmadan seç
+        top_index = (
+            reference_df.groupby(level, observed=True)['Süre (Saniye)']
+            .nlargest(n)
+            .index.get_level_values(-1)
         )
+        top_keys = pd.MultiIndex.from_frame(reference_df.loc[top_index, [level, 'Duruş Adı']])
         
-        # top_10_duruslar veri setindeki gözlemlenecek ve Duruş Adı sütunlarına göre grouped_df'yi filtrele
-        filtered_df = grouped_df.merge(top10[[gozlemlenecek, 'Duruş Adı']], on=[gozlemlenecek, 'Duruş Adı'])
+        # Seçilen varlık/duruş çiftlerinin tüm haftalardaki değerlerini al
+        in_top = pd.MultiIndex.from_frame(grouped_df[[level, 'Duruş Adı']]).isin(top_keys)
+        filtered_df = grouped_df[in_top]
         
         # Veriyi Süre (Saniye) sütununa göre azalan sırada sırala
         filtered_df = filtered_df.sort_values(by='Süre (Saniye)', ascending=False)
         
         # Saniyeden dakikaya çevir
-        filtered_df = second_to_minute(filtered_df)
+        results[level] = second_to_minute(filtered_df)
         
-        # Sonuç bilgilerini log dosyasına yaz
-        logger.info(f"{gozlemlenecek} için en büyük 10 duruş hesaplaması tamamlandı. Satır sayısı: {len(filtered_df)}")
-        return filtered_df
+        logger.info(f"{level} için en büyük {n} duruş hesaplaması tamamlandı. Satır sayısı: {len(filtered_df)}")
+    
+    return results
+
+def filter_sort_top_stops(
+    df: pd.DataFrame, 
+    max_week: int = 9,  # Varsayılan değer 9 olarak değiştirildi
+    gozlemlenecek: str = "KISIM"
+) -> pd.DataFrame:
+    """
+    Her bir kısım veya tezgah için en büyük 10 duruşu filtreleyip sıralar.
+    
+    Her iki seviye birlikte gerekiyorsa select_top_stops tek çağrıda hesaplar.
     
+    Args:
+        df: İşlenecek DataFrame
+        max_week: Sıralama için kullanılacak hafta numarası (varsayılan: 9)
+        gozlemlenecek: Gruplandırma için kullanılacak sütun adı (KISIM veya İş Merkezi Kodu)
+        
+    Returns:
+        pd.DataFrame: Filtrelenmiş ve sıralanmış DataFrame
+    """
+    try:
+        return select_top_stops(df, [gozlemlenecek], n=10, reference_week=max_week)[gozlemlenecek]
     except Exception as e:
         logger.error(f"filter_sort_top_stops fonksiyonunda hata: {str(e)}", exc_info=True)
         return pd.DataFrame()
     
+def calculate_all_part_average_stop_times(
+    df: pd.DataFrame,
+    kisim_tezgah_sayilari: Dict[str, int],
+    kisimlar: Optional[List[str]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tüm kısımlar için tezgah başına ortalama duruş sürelerini tek gruplamayla hesaplar.
+    
+    Her satırın süresi kısmının tezgah sayısına bölünüp tamsayıya çevrilir (küpte
+    bu değer "Ortalama Süre (Saniye)" sütununda hazırdır), ardından kısım ve duruş
+    kategorisine göre bir kez toplanıp kısımlara ayrılır.
+    
+    Args:
+        df: İşlenecek DataFrame veya duruş küpü
+        kisim_tezgah_sayilari: Kısımlara göre tezgah sayıları
+        kisimlar: Sonuç istenen kısımlar (None ise kisim_tezgah_sayilari'ndaki tüm kısımlar)
+        
+    Returns:
+        Dict[str, pd.DataFrame]: Kısım adı -> tezgah başına ortalama duruş süreleri
+    """
+    logger.info("Tüm kısımlar için tezgah başına ortalama duruş süreleri hesaplanıyor...")
+    
+    if kisimlar is None:
+        kisimlar = list(kisim_tezgah_sayilari)
+    
+    if AVERAGE_SECOND_COLUMN in df.columns:
+        # Küpte satır bazlı bölme sonuçları zaten toplanmıştır
+        average_seconds = df[AVERAGE_SECOND_COLUMN]
+    else:
+        tezgah_sayilari = df["KISIM"].astype(object).map(kisim_tezgah_sayilari).fillna(1)
+        average_seconds = (df["Süre (Saniye)"] / tezgah_sayilari).astype(int)
+    
+    # Kısım ve duruş kategorisine göre tek gruplama
+    grouped = average_seconds.rename("Süre (Saniye)").groupby(
+        [df["KISIM"], stop_category(df)], observed=True
+    ).sum()
+    part_sums = {
+        kisim: part.droplevel("KISIM")
+        for kisim, part in grouped.groupby(level="KISIM", observed=True)
+    }
+    
+    # Verisi olmayan kısımlarda yalnızca sıfır süreli birleşik kategori satırları kalır
+    empty = pd.Series([], dtype="int64")
+    results = {kisim: stop_time_table(part_sums.get(kisim, empty)) for kisim in kisimlar}
+    
+    logger.info(f"{len(results)} kısım için tezgah başına ortalama duruş süreleri hesaplaması tamamlandı.")
+    return results
+
 def calculate_part_average_stop_times(
     df: pd.DataFrame,
     kisim: str,
@@ -304,6 +417,8 @@ def calculate_part_average_stop_times(
     """
     Belirli bir kısım için tezgah başına ortalama duruş sürelerini hesaplar.
     
+    Birden fazla kısım için calculate_all_part_average_stop_times tercih edilmelidir.
+    
     Args:
         df: İşlenecek DataFrame
         kisim: Hesaplama yapılacak kısım adı
@@ -312,26 +427,80 @@ def calculate_part_average_stop_times(
     Returns:
         pd.DataFrame: Tezgah başına ortalama duruş sürelerini içeren DataFrame
     """
-    logger.info(f"{kisim} için tezgah başına ortalama duruş süreleri hesaplanıyor...")
-    
-    # Belirli kısım için veri filtrele
-    kisim_for_avg = df[df["KISIM"] == kisim].copy()
-    
-    # Tezgah sayısı
-    tezgah_sayisi = kisim_tezgah_sayilari.get(kisim, 1)
-    
-    # Süreleri tezgah sayısına böl
-    kisim_for_avg['Süre (Saniye)'] = (kisim_for_avg['Süre (Saniye)'] / tezgah_sayisi).astype(int)
+    return calculate_all_part_average_stop_times(df, kisim_tezgah_sayilari, [kisim])[kisim]
+
+def calculate_oee_table(
+    df: pd.DataFrame,
+    weeks: Optional[List[int]] = None,
+    weighted: bool = False
+) -> pd.DataFrame:
+    """
+    OEE, performans, kullanılabilirlik ve kalite ortalamalarını tüm haftalar ve
+    seviyeler (genel, kısım, tezgah) için tek bir gruplamayla hesaplar.
     
-    # Duruş adlarına göre süreleri topla ve benzer duruşları birleştir
-    result = calculate_stop_time_sum(kisim_for_avg)
+    Veri hafta/kısım/tezgah bazında bir kez toplanır (değer toplamı ve değer
+    sayısı); kısım ve genel ortalamalar bu küçük tablodan türetilir. "Diğer"
+    kısmı kısım seviyesinde raporlanmaz.
     
-    logger.info(f"{kisim} için tezgah başına ortalama duruş süreleri hesaplaması tamamlandı.")
-    return result
+    Args:
+        df: İşlenecek DataFrame
+        weeks: Hafta numaraları listesi (None ise tüm haftalar; sonuç bu sırayla döner)
+        weighted: True ise ortalamalar satırların "Süre (Dakika)" değerleriyle ağırlıklandırılır
+        
+    Returns:
+        pd.DataFrame: Hafta, Seviye, Varlık ve metrik sütunlarını içeren uzun tablo
+    """
+    logger.info("OEE tablosu hesaplanıyor...")
+    
+    if weeks is not None:
+        df = df[df["Hafta"].isin(weeks)]
+    
+    # Eksik değerler ortalamaya katılmaz (pandas .mean() davranışı)
+    values = df[OEE_COLUMNS].astype("float64")
+    counts = values.notna().astype("float64")
+    if weighted:
+        weights = df["Süre (Dakika)"].astype("float64")
+        counts = counts.mul(weights, axis=0)
+        values = values.mul(weights, axis=0)
+    
+    count_columns = [f"{col} (Sayı)" for col in OEE_COLUMNS]
+    totals = pd.concat([values.fillna(0), counts.set_axis(count_columns, axis=1)], axis=1)
+    for col in ["Hafta", "KISIM", "İş Merkezi Kodu "]:
+        totals[col] = df[col]
+    
+    # Tek gruplama: hafta/kısım/tezgah bazında toplamlar
+    totals = totals.groupby(["Hafta", "KISIM", "İş Merkezi Kodu "], observed=True, dropna=False).sum()
+    
+    levels = [
+        ("Genel", ["Hafta"]),
+        ("KISIM", ["Hafta", "KISIM"]),
+        ("Tezgah", ["Hafta", "İş Merkezi Kodu "])
+    ]
+    level_tables = []
+    for seviye, keys in levels:
+        level_df = totals.groupby(level=keys, observed=True).sum()
+        # 0 / 0 -> NaN: değeri olmayan gruplar için ortalama tanımsızdır
+        means = level_df[OEE_COLUMNS] / level_df[count_columns].to_numpy()
+        means = means.reset_index()
+        means["Varlık"] = means.pop(keys[-1]).astype(object) if len(keys) > 1 else "Genel"
+        means["Seviye"] = seviye
+        level_tables.append(means)
+    
+    oee_table = pd.concat(level_tables, ignore_index=True)
+    oee_table = oee_table[~((oee_table["Seviye"] == "KISIM") & (oee_table["Varlık"] == "Diğer"))]
+    
+    # Haftaları istenen sıraya, seviyeleri genel -> kısım -> tezgah sırasına diz
+    week_order = {week: i for i, week in enumerate(weeks if weeks is not None else sorted(oee_table["Hafta"].unique()))}
+    oee_table = oee_table.sort_values(by="Hafta", key=lambda col: col.map(week_order), kind="stable")
+    oee_table = oee_table[["Hafta", "Seviye", "Varlık"] + OEE_COLUMNS].reset_index(drop=True)
+    
+    logger.info(f"OEE tablosu hesaplaması tamamlandı. Satır sayısı: {len(oee_table)}")
+    return oee_table
 
 def calculate_oee_data(
     df: pd.DataFrame, 
-    weeks: List[int]
+    weeks: List[int],
+    weighted: bool = False
 ) -> Dict[str, Dict]:
     """
     OEE, performans, kullanılabilirlik ve kalite değerlerini hesaplar.
@@ -339,6 +508,7 @@ def calculate_oee_data(
     Args:
         df: İşlenecek DataFrame
         weeks: Hafta numaraları listesi
+        weighted: True ise ortalamalar "Süre (Dakika)" ile ağırlıklandırılır
         
     Returns:
         Dict[str, Dict]: Haftalara ve kısımlara göre OEE verileri
@@ -346,58 +516,13 @@ def calculate_oee_data(
     logger.info("OEE verileri hesaplanıyor...")
     
     oee_data = {}
-    
-    # Her hafta için hesapla
-    for week in weeks:
-        week_df = df[df["Hafta"] == week]
-        
-        # Genel ortalama
-        oee_general = week_df["Oee"].mean()
-        performans_general = week_df["Performans"].mean()
-        kullanilabilirlik_general = week_df["Kullanılabilirlik"].mean()
-        kalite_general = week_df["Kalite"].mean()
-        
-        oee_data[f"Genel_{week}"] = {
-            "oee": oee_general,
-            "performans": performans_general,
-            "kullanilabilirlik": kullanilabilirlik_general,
-            "kalite": kalite_general
+    for row in calculate_oee_table(df, weeks, weighted=weighted).to_dict("records"):
+        oee_data[f"{row['Varlık']}_{row['Hafta']}"] = {
+            "oee": row["Oee"],
+            "performans": row["Performans"],
+            "kullanilabilirlik": row["Kullanılabilirlik"],
+            "kalite": row["Kalite"]
         }
-        
-        # Kısımlara göre
-        for kisim in week_df["KISIM"].unique():
-            if kisim == "Diğer":
-                continue
-                
-            kisim_df = week_df[week_df["KISIM"] == kisim]
-            
-            oee_part = kisim_df["Oee"].mean()
-            performans_part = kisim_df["Performans"].mean()
-            kullanilabilirlik_part = kisim_df["Kullanılabilirlik"].mean()
-            kalite_part = kisim_df["Kalite"].mean()
-            
-            oee_data[f"{kisim}_{week}"] = {
-                "oee": oee_part,
-                "performans": performans_part,
-                "kullanilabilirlik": kullanilabilirlik_part,
-                "kalite": kalite_part
-            }
-        
-        # Tezgahlara göre
-        for machine in week_df["İş Merkezi Kodu "].unique():
-            machine_df = week_df[week_df["İş Merkezi Kodu "] == machine]
-            
-            oee_machine = machine_df["Oee"].mean()
-            performans_machine = machine_df["Performans"].mean()
-            kullanilabilirlik_machine = machine_df["Kullanılabilirlik"].mean()
-            kalite_machine = machine_df["Kalite"].mean()
-            
-            oee_data[f"{machine}_{week}"] = {
-                "oee": oee_machine,
-                "performans": performans_machine,
-                "kullanilabilirlik": kullanilabilirlik_machine,
-                "kalite": kalite_machine
-            }
     
     logger.info("OEE verileri hesaplaması tamamlandı.")
-    return oee_data
\ No newline at end of file
+    return oee_data
@@ -0,0 +1,368 @@
+"""
+Grafik dosyaları yerine tek dosyalık, çevrimdışı açılan HTML rapor panosu oluşturan fonksiyonlar.
+
+Toplanmış duruş ve OEE tabloları sıkıştırılmış JSON olarak sayfaya gömülür; grafikler
+tarayıcıda SVG olarak çizilir. Harici kütüphane veya ağ bağlantısı gerekmez.
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+import pandas as pd
+from typing import Any, Dict, List, Optional
+import logging
+
+from src.calculations import OEE_COLUMNS
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("dashboard.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Panonun varsayılan dosya yolu
+DASHBOARD_PATH = "Raporlar/Rapor Panosu.html"
+
+# Eksik kısım ve diğer eksik adlar (tezgah, duruş) için etiketler
+MISSING_KISIM_LABEL = "Diğer"
+MISSING_STOP_LABEL = "Belirtilmemiş"
+
+def _labels(values: pd.Series, missing_label: str) -> pd.Series:
+    """
+    Kategorik veya metin sütununu eksik değerleri etiketlenmiş metin sütununa dönüştürür.
+    
+    Args:
+        values: Dönüştürülecek sütun
+        missing_label: Eksik değerlerin etiketi
+    
+    Returns:
+        pd.Series: Metin sütunu
+    """
+    return values.astype(object).where(values.notna(), missing_label).astype(str)
+
+def _metric(value: Any) -> Optional[float]:
+    """
+    OEE metriğini JSON için yuvarlar (eksik değerler None olur).
+    
+    Args:
+        value: Metrik değeri (0-1 aralığında)
+    
+    Returns:
+        Optional[float]: Dört basamağa yuvarlanmış değer
+    """
+    return None if pd.isna(value) else round(float(value), 4)
+
+def build_dashboard_data(
+    stop_cube: pd.DataFrame,
+    oee_table: pd.DataFrame,
+    weeks: List[int],
+    kisim_tezgah_sayilari: Optional[Dict[str, int]] = None,
+    title: str = "Tezgah Duruş Analizi"
+) -> Dict[str, Any]:
+    """
+    Panoya gömülecek sıkıştırılmış veri yapısını oluşturur.
+    
+    Kısım, tezgah ve duruş adları birer kez listelenir; duruş satırları bu listelere
+    indeks veren [hafta, tezgah, duruş, dakika] dizileri olarak tutulur. OEE
+    değerleri seviye ve varlık başına hafta sırasıyla [oee, performans,
+    kullanılabilirlik, kalite] dizileridir.
+    
+    Args:
+        stop_cube: build_stop_cube çıktısı (tüm haftalar)
+        oee_table: calculate_oee_table çıktısı
+        weeks: Sıralanmış hafta numaraları listesi (son hafta ilk sırada)
+        kisim_tezgah_sayilari: Kısımlara göre tezgah sayıları (opsiyonel)
+        title: Pano başlığı
+    
+    Returns:
+        Dict[str, Any]: JSON'a dönüştürülebilir pano verisi
+    """
+    # Haftalar eskiden yeniye
+    week_list = [int(week) for week in reversed(weeks)]
+    week_index = {week: i for i, week in enumerate(week_list)}
+    
+    # Çalışma süreleri duruş grafiklerinde olduğu gibi panoya alınmaz
+    cube = stop_cube[stop_cube["Hafta"].isin(week_list) & (stop_cube["Duruş Adı"] != "ÇALIŞMA SÜRESİ")]
+    tezgah_codes, tezgahlar = pd.factorize(_labels(cube["İş Merkezi Kodu "], MISSING_STOP_LABEL), sort=True)
+    kisim_labels = _labels(cube["KISIM"], MISSING_KISIM_LABEL)
+    kisimlar = sorted(kisim_labels.unique())
+    kisim_index = {kisim: i for i, kisim in enumerate(kisimlar)}
+    durus_codes, duruslar = pd.factorize(_labels(cube["Duruş Adı"], MISSING_STOP_LABEL), sort=True)
+    
+    # Her tezgah için kısım indeksi (tezgahın en çok duruş süresi olan kısmı)
+    kisim_of = (
+        pd.DataFrame({"tezgah": tezgah_codes, "kisim": kisim_labels.map(kisim_index).to_numpy(),
+                      "sure": cube["Süre (Saniye)"].to_numpy()})
+        .groupby(["tezgah", "kisim"]).sum()
+        .sort_values("sure", ascending=False)
+        .reset_index()
+        .drop_duplicates("tezgah")
+        .set_index("tezgah")["kisim"]
+    )
+    
+    # Aynı tezgah/hafta/duruş için birden çok kısım satırı varsa toplanır
+    stops = (
+        pd.DataFrame({
+            "hafta": cube["Hafta"].map(week_index).to_numpy(),
+            "tezgah": tezgah_codes,
+            "durus": durus_codes,
+            "dakika": cube["Süre (Saniye)"].to_numpy() / 60
+        })
+        .groupby(["hafta", "tezgah", "durus"], sort=True).sum()
+        .reset_index()
+    )
+    stops["dakika"] = stops["dakika"].round(1)
+    stops = stops[stops["dakika"] > 0]
+    
+    # OEE: seviye -> varlık -> hafta sırasıyla metrik dizileri
+    oee: Dict[str, Dict[str, List[Optional[List[Optional[float]]]]]] = {}
+    for row in oee_table[oee_table["Hafta"].isin(week_list)].to_dict("records"):
+        entity_weeks = oee.setdefault(row["Seviye"], {}).setdefault(
+            str(row["Varlık"]), [None] * len(week_list)
+        )
+        entity_weeks[week_index[row["Hafta"]]] = [_metric(row[col]) for col in OEE_COLUMNS]
+    
+    return {
+        "baslik": title,
+        "olusturulma": datetime.now().strftime("%d.%m.%Y %H:%M"),
+        "haftalar": week_list,
+        "kisimlar": kisimlar,
+        "tezgahlar": [[str(code), int(kisim_of.get(i, 0))] for i, code in enumerate(tezgahlar)],
+        "duruslar": [str(name) for name in duruslar],
+        "tezgah_sayilari": {str(k): int(v) for k, v in (kisim_tezgah_sayilari or {}).items()},
+        "duruslar_veri": stops[["hafta", "tezgah", "durus"]].astype(int).assign(
+            dakika=stops["dakika"]
+        ).to_numpy(dtype=object).tolist(),
+        "oee": oee
+    }
+
+def render_dashboard_html(data: Dict[str, Any]) -> str:
+    """
+    Pano verisini tek dosyalık HTML sayfasına yerleştirir.
+    
+    Args:
+        data: build_dashboard_data çıktısı
+    
+    Returns:
+        str: HTML içeriği
+    """
+    # "</script>" dizisi gömülü JSON'u erken kapatmasın
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    title = str(data.get("baslik", "")).replace("&", "&amp;").replace("<", "&lt;")
+    return DASHBOARD_TEMPLATE.replace("__BASLIK__", title).replace("__VERI__", payload)
+
+def write_dashboard(
+    stop_cube: pd.DataFrame,
+    oee_table: pd.DataFrame,
+    weeks: List[int],
+    kisim_tezgah_sayilari: Optional[Dict[str, int]] = None,
+    output_path: str = DASHBOARD_PATH
+) -> str:
+    """
+    Duruş ve OEE tablolarından HTML rapor panosunu oluşturup kaydeder.
+    
+    Args:
+        stop_cube: build_stop_cube çıktısı (tüm haftalar)
+        oee_table: calculate_oee_table çıktısı
+        weeks: Sıralanmış hafta numaraları listesi (son hafta ilk sırada)
+        kisim_tezgah_sayilari: Kısımlara göre tezgah sayıları (opsiyonel)
+        output_path: Kaydedilecek dosya yolu
+    
+    Returns:
+        str: Kaydedilen dosyanın yolu
+    """
+    start = time.perf_counter()
+    data = build_dashboard_data(stop_cube, oee_table, weeks, kisim_tezgah_sayilari)
+    html = render_dashboard_html(data)
+    
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    
+    logger.info(f"Rapor panosu kaydedildi: {output_path} ({len(html.encode('utf-8')) / 1024:.0f} KB, "
+                f"{len(data['duruslar_veri'])} duruş satırı, {time.perf_counter() - start:.2f} saniye)")
+    return output_path
+
+# Pano sayfası şablonu (__BASLIK__ ve __VERI__ yer tutucuları doldurulur)
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="tr">
+<head>
+<meta charset="utf-8">
+<title>__BASLIK__</title>
+<style>
+body{font-family:Arial,Helvetica,sans-serif;margin:0;background:#f3f4f6;color:#222}
+header{background:#1f3b57;color:#fff;padding:12px 20px;display:flex;align-items:center;gap:20px;flex-wrap:wrap}
+header h1{font-size:20px;margin:0;flex:1}
+header select{font-size:14px;padding:3px}
+#yol{padding:10px 20px;font-size:15px}
+#yol a{color:#1f5f9f;cursor:pointer;text-decoration:underline}
+main{display:grid;grid-template-columns:repeat(auto-fit,minmax(460px,1fr));gap:14px;padding:0 20px 20px}
+section{background:#fff;border-radius:6px;padding:12px 16px;box-shadow:0 1px 3px rgba(0,0,0,.12)}
+section h2{font-size:15px;margin:0 0 8px}
+.kartlar{display:grid;grid-template-columns:repeat(4,1fr);gap:8px}
+.kart{border:1px solid #ddd;border-radius:4px;padding:8px;text-align:center}
+.kart b{display:block;font-size:24px;margin-top:4px}
+.kart.ana b{color:#1f5f9f}
+svg text{font-size:11px}
+.tikla{cursor:pointer}
+.tikla:hover rect{opacity:.75}
+footer{padding:0 20px 16px;font-size:12px;color:#777}
+</style>
+</head>
+<body>
+<header><h1>__BASLIK__</h1><label>Hafta <select id="hafta"></select></label></header>
+<div id="yol"></div>
+<main>
+<section><h2 id="oee-baslik">TEE</h2><div class="kartlar" id="oee"></div></section>
+<section><h2>Haftalık toplam duruş (dakika)</h2><div id="trend"></div></section>
+<section><h2 id="dagilim-baslik">Duruş dağılımı (dakika)</h2><div id="dagilim"></div></section>
+<section><h2 id="alt-baslik"></h2><div id="alt"></div></section>
+</main>
+<footer id="alt-bilgi"></footer>
+<script type="application/json" id="veri">__VERI__</script>
+<script>
+"use strict";
+const V = JSON.parse(document.getElementById("veri").textContent);
+const S = {hafta: V.haftalar.length - 1, kisim: null, tezgah: null};
+const RENK = ["#4e79a7","#f28e2b","#e15759","#76b7b2","#59a14f","#edc948","#b07aa1","#ff9da7","#9c755f","#bab0ac"];
+const NS = "http://www.w3.org/2000/svg";
+
+function el(tag, attrs, parent, ns) {
+  const e = ns ? document.createElementNS(NS, tag) : document.createElement(tag);
+  for (const k in attrs || {}) {
+    if (k === "text") e.textContent = attrs[k]; else e.setAttribute(k, attrs[k]);
+  }
+  if (parent) parent.appendChild(e);
+  return e;
+}
+
+function fmt(x) { return x.toLocaleString("tr-TR", {maximumFractionDigits: 0}); }
+
+// Seçili kapsamdaki duruş satırları
+function kapsamda(r) {
+  if (S.tezgah !== null) return r[1] === S.tezgah;
+  if (S.kisim !== null) return V.tezgahlar[r[1]][1] === S.kisim;
+  return true;
+}
+
+function topla(anahtar, filtre) {
+  const t = new Map();
+  for (const r of V.duruslar_veri) {
+    if (!kapsamda(r) || (filtre && !filtre(r))) continue;
+    const k = anahtar(r);
+    t.set(k, (t.get(k) || 0) + r[3]);
+  }
+  return t;
+}
+
+// Yatay çubuk grafik: [{ad, deger, tikla}]
+function yatayCubuk(kap, ogeler, enFazla) {
+  kap.innerHTML = "";
+  if (!ogeler.length) { el("p", {text: "Bu hafta için duruş kaydı yok."}, kap); return; }
+  ogeler.sort((a, b) => b.deger - a.deger);
+  if (enFazla && ogeler.length > enFazla) {
+    const kalan = ogeler.splice(enFazla - 1);
+    ogeler.push({ad: "Diğer (" + kalan.length + ")", deger: kalan.reduce((s, o) => s + o.deger, 0)});
+  }
+  const satir = 20, sol = 190, gen = 440;
+  const svg = el("svg", {width: "100%", viewBox: "0 0 " + (sol + gen + 70) + " " + ogeler.length * satir}, kap, true);
+  const mx = Math.max(...ogeler.map(o => o.deger)) || 1;
+  ogeler.forEach((o, i) => {
+    const g = el("g", o.tikla ? {"class": "tikla"} : {}, svg, true);
+    if (o.tikla) g.addEventListener("click", o.tikla);
+    el("text", {x: sol - 6, y: i * satir + 14, "text-anchor": "end", text: o.ad.length > 30 ? o.ad.slice(0, 29) + "…" : o.ad}, g, true);
+    el("rect", {x: sol, y: i * satir + 3, width: Math.max(1, gen * o.deger / mx), height: satir - 6, fill: RENK[i % RENK.length]}, g, true);
+    el("text", {x: sol + gen * o.deger / mx + 4, y: i * satir + 14, text: fmt(o.deger)}, g, true);
+  });
+}
+
+function trendCiz() {
+  const kap = document.getElementById("trend");
+  kap.innerHTML = "";
+  const t = topla(r => r[0]);
+  const degerler = V.haftalar.map((_, i) => t.get(i) || 0);
+  const mx = Math.max(...degerler) || 1, gen = 600, yuk = 180, adim = gen / degerler.length;
+  const svg = el("svg", {width: "100%", viewBox: "0 0 " + gen + " " + (yuk + 36)}, kap, true);
+  degerler.forEach((d, i) => {
+    const h = (yuk - 16) * d / mx;
+    const g = el("g", {"class": "tikla"}, svg, true);
+    g.addEventListener("click", () => { S.hafta = i; ciz(); });
+    el("rect", {x: i * adim + adim * 0.2, y: yuk - h, width: adim * 0.6, height: h, fill: i === S.hafta ? "#1f5f9f" : "#9db7d1"}, g, true);
+    el("text", {x: i * adim + adim / 2, y: yuk - h - 4, "text-anchor": "middle", text: fmt(d)}, g, true);
+    el("text", {x: i * adim + adim / 2, y: yuk + 16, "text-anchor": "middle", text: V.haftalar[i] + ". Hafta"}, g, true);
+  });
+}
+
+function oeeCiz() {
+  const seviye = S.tezgah !== null ? "Tezgah" : S.kisim !== null ? "KISIM" : "Genel";
+  const varlik = S.tezgah !== null ? V.tezgahlar[S.tezgah][0] : S.kisim !== null ? V.kisimlar[S.kisim] : "Genel";
+  const haftalar = (V.oee[seviye] || {})[varlik] || [];
+  const m = haftalar[S.hafta];
+  const kap = document.getElementById("oee");
+  kap.innerHTML = "";
+  document.getElementById("oee-baslik").textContent = "TEE - " + V.haftalar[S.hafta] + ". Hafta";
+  ["Toplam TEE", "Performans", "Kullanılabilirlik", "Kalite"].forEach((ad, i) => {
+    const k = el("div", {"class": i === 0 ? "kart ana" : "kart"}, kap);
+    el("span", {text: ad}, k);
+    el("b", {text: m && m[i] !== null ? "%" + Math.round(m[i] * 100) : "-"}, k);
+  });
+}
+
+function yolCiz() {
+  const kap = document.getElementById("yol");
+  kap.innerHTML = "";
+  const parcalar = [["Tüm Tesis", () => { S.kisim = null; S.tezgah = null; ciz(); }]];
+  if (S.kisim !== null) parcalar.push([V.kisimlar[S.kisim], () => { S.tezgah = null; ciz(); }]);
+  if (S.tezgah !== null) parcalar.push([V.tezgahlar[S.tezgah][0], null]);
+  parcalar.forEach(([ad, f], i) => {
+    if (i) kap.appendChild(document.createTextNode(" › "));
+    if (f && i < parcalar.length - 1) el("a", {text: ad}, kap).addEventListener("click", f);
+    else el("b", {text: ad}, kap);
+  });
+}
+
+function ciz() {
+  document.getElementById("hafta").value = S.hafta;
+  yolCiz();
+  oeeCiz();
+  trendCiz();
+  const buHafta = r => r[0] === S.hafta;
+  yatayCubuk(document.getElementById("dagilim"),
+    [...topla(r => r[2], buHafta)].map(([k, d]) => ({ad: V.duruslar[k], deger: d})), 15);
+  const altBaslik = document.getElementById("alt-baslik");
+  if (S.tezgah !== null) {
+    altBaslik.textContent = "Duruşların haftalara göre dağılımı (dakika)";
+    yatayCubuk(document.getElementById("alt"),
+      [...topla(r => r[0])].map(([k, d]) => ({ad: V.haftalar[k] + ". Hafta", deger: d, tikla: () => { S.hafta = k; ciz(); }})));
+  } else if (S.kisim !== null) {
+    altBaslik.textContent = "Tezgahlar - " + V.haftalar[S.hafta] + ". Hafta (dakika, tıklayarak ayrıntıya inin)";
+    yatayCubuk(document.getElementById("alt"),
+      [...topla(r => r[1], buHafta)].map(([k, d]) => ({ad: V.tezgahlar[k][0], deger: d, tikla: () => { S.tezgah = k; ciz(); }})));
+  } else {
+    altBaslik.textContent = "Kısımlar - " + V.haftalar[S.hafta] + ". Hafta (dakika, tıklayarak ayrıntıya inin)";
+    yatayCubuk(document.getElementById("alt"),
+      [...topla(r => V.tezgahlar[r[1]][1], buHafta)].map(([k, d]) => {
+        const n = V.tezgah_sayilari[V.kisimlar[k]];
+        return {ad: V.kisimlar[k] + (n ? " (" + n + " tezgah)" : ""), deger: d, tikla: () => { S.kisim = k; ciz(); }};
+      }));
+  }
+}
+
+const secim = document.getElementById("hafta");
+V.haftalar.forEach((h, i) => el("option", {value: i, text: h + ". Hafta"}, secim));
+secim.addEventListener("change", () => { S.hafta = +secim.value; ciz(); });
+document.getElementById("alt-bilgi").textContent = "Oluşturulma: " + V.olusturulma +
+  " · " + V.kisimlar.length + " kısım, " + V.tezgahlar.length + " tezgah, " + V.duruslar_veri.length + " duruş satırı";
+ciz();
+</script>
+</body>
+</html>
+"""
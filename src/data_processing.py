@@ -3,13 +3,20 @@ Veri yükleme, temizleme ve dönüştürme işlemleri için fonksiyonlar.
 """
 
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Optional, Union
 import logging
 
-# Konfigürasyon dosyasını içe aktar
-from config.tezgah_listesi import KISIMLAR_DICT
+# Tezgah kaydı ve yardımcı modülleri içe aktar
+from src.registry import get_registry
+from src.cache import load_with_cache
+from src.history import HISTORY_START_COLUMN, update_history_store, load_history_window
+from src.date_parsing import parse_date_column
+from src.stop_categories import STOP_CATEGORY_COLUMN, assign_stop_category
 
 # Loglama yapılandırması
 logging.basicConfig(
@@ -22,6 +29,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Duruş dosyasından okunan sütunlar
+DURUS_COLUMNS = ["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]
+
+# Analiz veri setinde kategorik koda dönüştürülen sütunlar
+CATEGORICAL_COLUMNS = ["İş Merkezi Kodu ", "Duruş Adı", "KISIM", "YılHafta"]
+DURATION_COLUMNS = ["Süre (Saniye)", "Süre (Dakika)"]
+RATIO_COLUMNS = ["Oee", "Performans", "Kullanılabilirlik", "Kalite"]
+
+# Akış modunda satırların toplandığı anahtar sütunlar (gün bazında); kısım ve hafta
+# bilgisi satır bazlı yüklemede olduğu gibi birleştirme sonrasında eklenir
+STREAM_GROUP_COLUMNS = ["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih"]
+
+# Akış modunda ara toplamların tek tabloda birleştirildiği grup sayısı
+STREAM_MERGE_CHUNKS = 16
+
+# Dosya sonunda tezgaha ait olmayan girişler için kontrol edilen satır sayısı
+CLEAN_TAIL_ROWS = 5
+
 def assign_kisim(makina_kodu: str) -> str:
     """
     Makina koduna göre kısım atar.
@@ -32,10 +57,7 @@ def assign_kisim(makina_kodu: str) -> str:
     Returns:
         str: Kısım adı
     """
-    for kisim, tezgahlar in KISIMLAR_DICT.items():
-        if makina_kodu in tezgahlar:
-            return kisim
-    return "Diğer"
+    return get_registry().kisim_of(makina_kodu)
 
 def load_durus_data(file_path: str) -> pd.DataFrame:
     """
@@ -51,7 +73,7 @@ def load_durus_data(file_path: str) -> pd.DataFrame:
         logger.info(f"Duruş verisi yükleniyor: {file_path}")
         df = pd.read_excel(
             file_path, 
-            usecols=["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]
+            usecols=DURUS_COLUMNS
         )
         logger.info(f"Duruş verisi yüklendi. Satır sayısı: {len(df)}")
         return df
@@ -102,59 +124,64 @@ def load_arizali_tezgahlar(file_path: str) -> List[str]:
         logger.error(f"Arızalı tezgah listesi yükleme hatası: {str(e)}")
         return []
 
-def clean_last_rows(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
+def clean_last_rows(df: pd.DataFrame, column_name: str, copy: bool = True) -> pd.DataFrame:
     """
     Son satırlardaki verileri temizler (tezgahlara ait olmayan girişleri kaldırır).
     
     Args:
         df: Temizlenecek DataFrame
         column_name: Kontrol edilecek sütun adı
+        copy: False ise df sahiplenilir ve satırlar yerinde silinir
         
     Returns:
         pd.DataFrame: Temizlenmiş DataFrame
     """
-    # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
-    cleaned_df = df.copy()
-    
-    for _ in range(5):  # En fazla 5 kez kontrol et
-        if len(cleaned_df) == 0:
-            break
-            
-        tezgah = cleaned_df[column_name].iloc[-1]
-        found = False
-        
-        for kisim_tezgahlar in KISIMLAR_DICT.values():
-            if tezgah in kisim_tezgahlar:
-                found = True
-                break
-                
-        if not found:
-            cleaned_df = cleaned_df.iloc[:-1]
-        else:
+    registry = get_registry()
+    
+    # Sondan geriye doğru en fazla CLEAN_TAIL_ROWS geçersiz satır say
+    rows_removed = 0
+    for tezgah in df[column_name].iloc[-CLEAN_TAIL_ROWS:][::-1]:
+        if tezgah in registry:
             break  # Son satır geçerliyse döngüden çık
+        rows_removed += 1
     
-    rows_removed = len(df) - len(cleaned_df)
     if rows_removed > 0:
         logger.info(f"{rows_removed} geçersiz satır temizlendi.")
     
-    return cleaned_df
+    if not copy:
+        if rows_removed > 0:
+            df.drop(index=df.index[-rows_removed:], inplace=True)
+        return df
+    
+    # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
+    return df.iloc[:len(df) - rows_removed].copy()
 
-def calculate_durations(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_durations(df: pd.DataFrame, copy: bool = True, source: Optional[str] = None) -> pd.DataFrame:
     """
     Duruş başlangıç ve bitiş tarihlerine göre süreleri hesaplar.
     
+    Tarihi ayrıştırılamayan satırlar loglanır ve çıkarılır.
+    
     Args:
         df: İşlenecek DataFrame
+        copy: False ise df sahiplenilir ve sütunlar yerinde eklenir
+        source: Kaynak dosya yolu (tarih biçimi dosya başına bir kez algılanır)
         
     Returns:
         pd.DataFrame: Süre sütunları eklenmiş DataFrame
     """
     # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Tarih sütunlarını datetime formatına dönüştür
-    result_df['Duruş Başlangıç Tarih'] = pd.to_datetime(result_df['Duruş Başlangıç Tarih'])
-    result_df['Duruş Bitiş Tarih'] = pd.to_datetime(result_df['Duruş Bitiş Tarih'])
+    for col in ['Duruş Başlangıç Tarih', 'Duruş Bitiş Tarih']:
+        result_df[col] = parse_date_column(result_df[col], col, source)
+    
+    # Başlangıç veya bitişi olmayan satırların süresi hesaplanamaz
+    invalid = result_df['Duruş Başlangıç Tarih'].isna() | result_df['Duruş Bitiş Tarih'].isna()
+    if invalid.any():
+        logger.warning(f"Tarihi eksik veya geçersiz {invalid.sum()} duruş satırı çıkarıldı.")
+        result_df.drop(index=result_df.index[invalid], inplace=True)
     
     # Saniye farkını hesapla
     result_df['Süre (Saniye)'] = (
@@ -166,29 +193,34 @@ def calculate_durations(df: pd.DataFrame) -> pd.DataFrame:
     
     return result_df
 
-def process_calisma_data(df: pd.DataFrame) -> pd.DataFrame:
+def process_calisma_data(df: pd.DataFrame, copy: bool = True, source: Optional[str] = None) -> pd.DataFrame:
     """
     Çalışma süresi verilerini işler.
     
     Args:
         df: İşlenecek çalışma süresi DataFrame'i
+        copy: False ise df sahiplenilir; sütunlar yerinde eklenir, yeniden adlandırılır ve silinir
+        source: Kaynak dosya yolu (tarih biçimi dosya başına bir kez algılanır)
         
     Returns:
         pd.DataFrame: İşlenmiş DataFrame
     """
     # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Çalışma süresi hesapla
     result_df['Süre (Dakika)'] = (
         result_df['Çalışma Zamanı'] - result_df['Planlı Duruş'] - result_df['Plansız Duruş']
     ).astype(int)
     
+    # Tarih sütununu bir kez datetime formatına dönüştür
+    result_df['Tarih'] = parse_date_column(result_df['Tarih'], 'Tarih', source)
+    
     # Sütun isimlerini standardize et
-    result_df = result_df.rename(columns={
+    result_df.rename(columns={
         'Tarih': 'Duruş Başlangıç Tarih',
         'Makina Kodu': 'İş Merkezi Kodu '
-    })
+    }, inplace=True)
     
     # Çalışma süresi sütununu ekle
     result_df['Duruş Adı'] = "ÇALIŞMA SÜRESİ"
@@ -198,39 +230,37 @@ def process_calisma_data(df: pd.DataFrame) -> pd.DataFrame:
         'İş Merkezi Kodu ', 'Duruş Adı', 'Duruş Başlangıç Tarih', 
         'Süre (Dakika)', 'Oee', 'Performans', 'Kullanılabilirlik', 'Kalite'
     ]
-    result_df = result_df[columns_to_keep]
+    result_df.drop(columns=[col for col in result_df.columns if col not in columns_to_keep], inplace=True)
     
     return result_df
 
-def add_week_info(df: pd.DataFrame) -> pd.DataFrame:
+def add_week_info(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     DataFrame'e hafta bilgisini ekler.
+    
+    Args:
+        df: İşlenecek DataFrame
+        copy: False ise df sahiplenilir; satırlar ve sütunlar yerinde güncellenir
+        
+    Returns:
+        pd.DataFrame: Hafta, Yıl ve YılHafta sütunları eklenmiş DataFrame
     """
     # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
-    result_df = df.copy()
-    
-    # NaN değerlerini filtrele
-    result_df = result_df.dropna(subset=['Duruş Başlangıç Tarih'])
+    result_df = df.copy() if copy else df
     
-    # Tarih sütununu datetime formatına dönüştür (eğer değilse)
+    # Tarih sütununu datetime formatına dönüştür (birleştirme sonrası zaten datetime64'tür)
     if not pd.api.types.is_datetime64_any_dtype(result_df['Duruş Başlangıç Tarih']):
-        try:
-            # Farklı tarih formatlarını deneyerek dönüştürmeyi dene
-            result_df['Duruş Başlangıç Tarih'] = pd.to_datetime(
-                result_df['Duruş Başlangıç Tarih'], 
-                errors='coerce',
-                format=None  # Otomatik format algılama
-            )
-            # NaN oluşmuş satırları temizle
-            result_df = result_df.dropna(subset=['Duruş Başlangıç Tarih'])
-        except Exception as e:
-            logger.error(f"Tarih dönüşümü hatası: {str(e)}")
+        result_df['Duruş Başlangıç Tarih'] = parse_date_column(result_df['Duruş Başlangıç Tarih'])
+    
+    # NaN ve ayrıştırılamamış (NaT) değerleri filtrele
+    result_df.dropna(subset=['Duruş Başlangıç Tarih'], inplace=True)
     
     # Hafta bilgisini ekle
     try:
-        result_df['Hafta'] = result_df['Duruş Başlangıç Tarih'].dt.isocalendar().week
+        iso = result_df['Duruş Başlangıç Tarih'].dt.isocalendar()
+        result_df['Hafta'] = iso['week']
         # Yıl bilgisini de ekleyelim, farklı yıllar varsa hafta numaraları karışabilir
-        result_df['Yıl'] = result_df['Duruş Başlangıç Tarih'].dt.isocalendar().year
+        result_df['Yıl'] = iso['year']
         # Yıl-Hafta birleşik anahtarı oluştur
         result_df['YılHafta'] = result_df['Yıl'].astype(str) + "-" + result_df['Hafta'].astype(str)
     except Exception as e:
@@ -244,7 +274,8 @@ def add_week_info(df: pd.DataFrame) -> pd.DataFrame:
 def filter_by_arizali_tezgahlar(
     df: pd.DataFrame, 
     arizali_tezgahlar: List[str], 
-    machine_col: str = 'İş Merkezi Kodu '
+    machine_col: str = 'İş Merkezi Kodu ',
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Arızalı tezgahları veri setinden filtreler.
@@ -253,16 +284,17 @@ def filter_by_arizali_tezgahlar(
         df: Filtrelenecek DataFrame
         arizali_tezgahlar: Arızalı tezgah kodları listesi
         machine_col: Makine kodu sütunu adı
+        copy: False ise df sahiplenilir ve satırlar yerinde silinir
         
     Returns:
         pd.DataFrame: Filtrelenmiş DataFrame
     """
     # Orijinal DataFrame'i değiştirmemek için kopyasını oluştur
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     if arizali_tezgahlar:
         logger.info(f"{len(arizali_tezgahlar)} arızalı tezgah filtreleniyor.")
-        result_df = result_df[~result_df[machine_col].isin(arizali_tezgahlar)]
+        result_df.drop(index=result_df.index[result_df[machine_col].isin(arizali_tezgahlar)], inplace=True)
         logger.info(f"Filtreleme sonrası satır sayısı: {len(result_df)}")
     
     return result_df
@@ -274,6 +306,10 @@ def merge_durus_calisma_data(
     """
     Duruş ve çalışma verilerini birleştirir.
     
+    Girdilerin tarih sütunları yerinde güne indirgenir (datetime64 olarak kalır,
+    böylece add_week_info yeniden ayrıştırma yapmaz); çağıran girdileri
+    sahiplenmiş olmalı veya kopyasını vermelidir.
+    
     Args:
         durus_df: Duruş verileri DataFrame'i
         calisma_df: Çalışma verileri DataFrame'i
@@ -282,8 +318,8 @@ def merge_durus_calisma_data(
         pd.DataFrame: Birleştirilmiş DataFrame
     """
     # Tarih formatlarını standardize et (sadece tarih, saat olmadan)
-    durus_df['Duruş Başlangıç Tarih'] = pd.to_datetime(durus_df['Duruş Başlangıç Tarih']).dt.date
-    calisma_df['Duruş Başlangıç Tarih'] = pd.to_datetime(calisma_df['Duruş Başlangıç Tarih']).dt.date
+    for df in (durus_df, calisma_df):
+        df['Duruş Başlangıç Tarih'] = parse_date_column(df['Duruş Başlangıç Tarih']).dt.normalize()
     
     # Duruş verilerindeki eşsiz tarih ve makine kodlarını al
     unique_dates = durus_df['Duruş Başlangıç Tarih'].unique()
@@ -298,8 +334,9 @@ def merge_durus_calisma_data(
     # Verileri birleştir
     merged_df = pd.concat([durus_df, filtered_calisma], ignore_index=True)
     
-    # Süre değeri 0 olan veya NaN olan satırları filtrele
-    merged_df = merged_df[(merged_df['Süre (Dakika)'] != 0) & (merged_df['Süre (Dakika)'].notna())]
+    # Süre değeri 0 olan veya NaN olan satırları filtrele (birleşik veri bu fonksiyona ait)
+    invalid = (merged_df['Süre (Dakika)'] == 0) | (merged_df['Süre (Dakika)'].isna())
+    merged_df.drop(index=merged_df.index[invalid], inplace=True)
     
     # ÇALIŞMA SÜRESİ kayıtları için eksik saniye değerlerini hesapla
     mask = (merged_df['Duruş Adı'] == 'ÇALIŞMA SÜRESİ') & (merged_df['Süre (Saniye)'].isna())
@@ -307,72 +344,355 @@ def merge_durus_calisma_data(
     
     return merged_df
 
+def load_arizali_if_present(file_path: Optional[str]) -> List[str]:
+    """
+    Arızalı tezgah listesi dosyası varsa ve boş değilse yükler.
+    
+    Args:
+        file_path: Arızalı tezgah listesi dosya yolu (opsiyonel)
+        
+    Returns:
+        List[str]: Arızalı tezgah kodları listesi (dosya yoksa boş liste)
+    """
+    if file_path and os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+        return load_arizali_tezgahlar(file_path)
+    return []
+
+def _timed_call(func: Callable[[], Any]) -> Tuple[Any, float]:
+    """
+    Fonksiyonu çağırır ve sonucu ile geçen süreyi döndürür.
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def load_clean_durus_data(file_path: str) -> pd.DataFrame:
+    """
+    Duruş verilerini yükler, son satırları temizler ve süreleri hesaplar.
+    
+    Args:
+        file_path: Excel dosyasının yolu
+        
+    Returns:
+        pd.DataFrame: Süre sütunları eklenmiş temiz duruş verisi
+    """
+    durus_df = load_durus_data(file_path)
+    
+    # Gerekli sütunları kontrol et
+    for col in DURUS_COLUMNS:
+        if col not in durus_df.columns:
+            logger.error(f"Gerekli sütun bulunamadı: {col}")
+            raise ValueError(f"Duruş verilerinde gerekli sütun bulunamadı: {col}")
+    
+    # Son satırları temizle (yeni yüklenen veri bu fonksiyona ait, kopya gerekmez)
+    durus_df = clean_last_rows(durus_df, "İş Merkezi Kodu ", copy=False)
+    
+    # Süreleri hesapla
+    return calculate_durations(durus_df, copy=False, source=file_path)
+
+def load_clean_calisma_data(file_path: str) -> pd.DataFrame:
+    """
+    Çalışma süresi verilerini yükler, son satırları temizler ve işler.
+    
+    Args:
+        file_path: Excel dosyasının yolu
+        
+    Returns:
+        pd.DataFrame: İşlenmiş çalışma süresi verisi
+    """
+    calisma_df = load_calisma_data(file_path)
+    
+    # Son satırları temizle (yeni yüklenen veri bu fonksiyona ait, kopya gerekmez)
+    calisma_df = clean_last_rows(calisma_df, "Makina Kodu", copy=False)
+    
+    # Çalışma verilerini işle
+    return process_calisma_data(calisma_df, copy=False, source=file_path)
+
+def _process_durus_chunk(chunk_df: pd.DataFrame, source: Optional[str] = None) -> pd.DataFrame:
+    """
+    Tek bir satır grubunun sürelerini hesaplayıp tezgah/duruş/gün bazında toplar.
+    
+    Args:
+        chunk_df: Ham duruş satırları
+        source: Kaynak dosya yolu (tarih biçimi ilk grupta algılanıp sonraki gruplarda kullanılır)
+        
+    Returns:
+        pd.DataFrame: Gün bazında toplanmış, küçültülmüş satır grubu
+    """
+    # Tezgaha veya tarihe sahip olmayan satırlar (toplam/alt bilgi satırları) atlanır
+    chunk_df = chunk_df.dropna(subset=DURUS_COLUMNS[:1] + DURUS_COLUMNS[2:])
+    if chunk_df.empty:
+        return chunk_df
+    
+    start = parse_date_column(chunk_df['Duruş Başlangıç Tarih'], 'Duruş Başlangıç Tarih', source)
+    end = parse_date_column(chunk_df['Duruş Bitiş Tarih'], 'Duruş Bitiş Tarih', source)
+    valid = start.notna() & end.notna()
+    seconds = (end - start).dt.total_seconds().fillna(0).astype(int)
+    minutes = (seconds / 60).astype(int)
+    
+    # Birleştirme adımında elenecek sıfır dakikalık ve tarihi ayrıştırılamayan duruşları baştan at
+    keep = (minutes != 0) & valid
+    
+    compact_df = pd.DataFrame({
+        'İş Merkezi Kodu ': chunk_df['İş Merkezi Kodu '][keep],
+        'Duruş Adı': chunk_df['Duruş Adı'][keep],
+        'Duruş Başlangıç Tarih': start[keep].dt.normalize(),
+        'Süre (Saniye)': seconds[keep],
+        'Süre (Dakika)': minutes[keep]
+    })
+    
+    return compact_df.groupby(STREAM_GROUP_COLUMNS, as_index=False, sort=False)[
+        ['Süre (Saniye)', 'Süre (Dakika)']
+    ].sum()
+
+def iter_durus_chunks(file_path: str, chunk_size: int = 50000) -> Iterator[pd.DataFrame]:
+    """
+    Duruş Excel dosyasını salt okunur modda satır grupları halinde okur ve her grubu
+    işlenmiş, gün bazında toplanmış olarak üretir.
+    
+    Son satırlar dosyanın sonu olabileceğinden bir sonraki gruba bırakılır; dosyanın
+    son satırları satır bazlı yüklemedeki gibi clean_last_rows ile temizlenir.
+    
+    Args:
+        file_path: Excel dosyasının yolu
+        chunk_size: Bir grupta okunacak satır sayısı
+        
+    Yields:
+        pd.DataFrame: Gün bazında toplanmış satır grubu
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = list(next(rows, ()))
+        
+        missing = [col for col in DURUS_COLUMNS if col not in header]
+        if missing:
+            logger.error(f"Gerekli sütun bulunamadı: {missing[0]}")
+            raise ValueError(f"Duruş verilerinde gerekli sütun bulunamadı: {missing[0]}")
+        indices = [header.index(col) for col in DURUS_COLUMNS]
+        
+        buffer = []
+        for row in rows:
+            buffer.append([row[i] for i in indices])
+            if len(buffer) >= chunk_size + CLEAN_TAIL_ROWS:
+                yield _process_durus_chunk(pd.DataFrame(buffer[:-CLEAN_TAIL_ROWS], columns=DURUS_COLUMNS), file_path)
+                buffer = buffer[-CLEAN_TAIL_ROWS:]
+        if buffer:
+            tail_df = clean_last_rows(pd.DataFrame(buffer, columns=DURUS_COLUMNS), "İş Merkezi Kodu ", copy=False)
+            yield _process_durus_chunk(tail_df, file_path)
+    finally:
+        workbook.close()
+
+def _sum_stream_groups(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Gün bazında toplanmış satır gruplarını tek bir toplamda birleştirir.
+    """
+    return pd.concat(frames, ignore_index=True).groupby(STREAM_GROUP_COLUMNS, as_index=False, sort=False)[
+        ['Süre (Saniye)', 'Süre (Dakika)']
+    ].sum()
+
+def load_durus_data_streaming(file_path: str, chunk_size: int = 50000) -> pd.DataFrame:
+    """
+    Duruş verilerini bellek kullanımı satır grubu boyutuyla sınırlı kalacak şekilde yükler.
+    
+    Çıktı, tezgah/duruş/gün bazında toplanmış sürelerden oluşur; hesaplama
+    fonksiyonları süreleri topladığı için sonuçlar satır bazlı yüklemeyle aynıdır.
+    Toplama nedeniyle 'Duruş Bitiş Tarih' sütunu ve başlangıcın saat bilgisi
+    tutulmaz (analiz adımları bunları kullanmaz; geçmiş deposu bu satırları
+    tezgah + duruş + gün ile tanır).
+    
+    Args:
+        file_path: Excel dosyasının yolu
+        chunk_size: Bir grupta okunacak satır sayısı
+        
+    Returns:
+        pd.DataFrame: Gün bazında toplanmış duruş verisi
+    """
+    logger.info(f"Duruş verisi akış modunda yükleniyor: {file_path} (grup boyutu: {chunk_size})")
+    
+    partials = []
+    chunk_count = 0
+    for chunk_df in iter_durus_chunks(file_path, chunk_size):
+        chunk_count += 1
+        if not chunk_df.empty:
+            partials.append(chunk_df)
+        # Grup toplamları biriktirilir ve yalnızca STREAM_MERGE_CHUNKS grupta bir birleştirilir;
+        # böylece her grup için tüm ara toplam kopyalanmaz ve liste sınırlı kalır
+        if len(partials) >= STREAM_MERGE_CHUNKS:
+            partials = [_sum_stream_groups(partials)]
+    
+    if partials:
+        aggregated = _sum_stream_groups(partials)
+    else:
+        aggregated = pd.DataFrame(columns=STREAM_GROUP_COLUMNS + ['Süre (Saniye)', 'Süre (Dakika)'])
+    
+    logger.info(f"Duruş verisi akış modunda yüklendi. Grup sayısı: {chunk_count}, "
+                f"toplanmış satır sayısı: {len(aggregated)}")
+    return aggregated
+
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Analiz veri setini kompakt veri tiplerine dönüştürür.
+    
+    Tekrarlayan metin sütunları kategorik kodlara, süreler int32'ye, OEE oranları
+    float32'ye indirgenir. Kategorik sütunlar üzerindeki gruplamalar metin yerine
+    tamsayı kodlarıyla çalışır.
+    
+    Args:
+        df: Dönüştürülecek DataFrame
+        
+    Returns:
+        pd.DataFrame: Kompakt veri tipli DataFrame
+    """
+    memory_before = df.memory_usage(deep=True).sum()
+    
+    conversions = {}
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            conversions[col] = 'category'
+    for col in DURATION_COLUMNS:
+        # Eksik değer içeren süre sütunları tamsayıya çevrilemez
+        if col in df.columns and df[col].notna().all():
+            conversions[col] = 'int32'
+    for col in RATIO_COLUMNS:
+        if col in df.columns:
+            conversions[col] = 'float32'
+    for col in ['Hafta', 'Yıl']:
+        if col in df.columns and df[col].notna().all():
+            conversions[col] = 'int16'
+    
+    result_df = df.astype(conversions)
+    
+    memory_after = result_df.memory_usage(deep=True).sum()
+    logger.info(f"Veri tipleri küçültüldü. Bellek kullanımı: {memory_before / 1024 ** 2:.2f} MB -> "
+                f"{memory_after / 1024 ** 2:.2f} MB")
+    return result_df
+
 def prepare_data_for_analysis(
     durus_file: str,
     calisma_file: str,
-    arizali_file: str = None
+    arizali_file: str = None,
+    use_cache: bool = False,
+    rebuild_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    history_dir: Optional[str] = None,
+    history_weeks: Optional[int] = 4,
+    streaming: bool = False,
+    chunk_size: int = 50000,
+    parallel: bool = False,
+    registry_file: Optional[str] = None
 ) -> Tuple[pd.DataFrame, Dict, List[int]]:
     """
     Analiz için veri setini hazırlar.
+    
+    Yüklenen ara veriler bu fonksiyona aittir ve hazırlama adımları bunları
+    kopyalamadan yerinde günceller; dışarıdan gelen hiçbir DataFrame değiştirilmez.
+    
+    Args:
+        durus_file: Duruş verisi Excel dosya yolu
+        calisma_file: Çalışma süresi Excel dosya yolu
+        arizali_file: Arızalı tezgah listesi dosya yolu (opsiyonel)
+        use_cache: Temizlenmiş verileri disk önbelleğinden okuma/yazma bayrağı
+        rebuild_cache: Önbelleği yok sayıp yeniden oluşturma bayrağı
+        cache_dir: Önbellek dizini (None ise ayarlardaki dizin kullanılır)
+        history_dir: Geçmiş deposu dizini (None ise depo kullanılmaz)
+        history_weeks: Depodan okunacak en son hafta sayısı (None ise tüm geçmiş)
+        streaming: Duruş dosyasını satır grupları halinde okuyup gün bazında toplama bayrağı
+        chunk_size: Akış modunda bir grupta okunacak satır sayısı
+        parallel: Duruş ve çalışma dosyalarını ayrı süreçlerde eşzamanlı yükleme bayrağı
+        registry_file: Harici tezgah kaydı dosyası (CSV/YAML, None ise config/tezgah_listesi.py)
     """
     logger.info("Veri hazırlama işlemi başlıyor...")
     
     try:
-        # Duruş verilerini yükle
-        durus_df = load_durus_data(durus_file)
-        logger.info(f"Duruş verileri yüklendi. Satır sayısı: {len(durus_df)}")
-        
-        # Gerekli sütunları kontrol et
-        required_columns = ["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]
-        for col in required_columns:
-            if col not in durus_df.columns:
-                logger.error(f"Gerekli sütun bulunamadı: {col}")
-                raise ValueError(f"Duruş verilerinde gerekli sütun bulunamadı: {col}")
-        
-        # Son satırları temizle
-        durus_df = clean_last_rows(durus_df, "İş Merkezi Kodu ")
+        # Tezgah kaydını yükle (kaynak dosya değiştiyse yeniden derlenir)
+        registry = get_registry(registry_file)
         
-        # Süreleri hesapla
-        durus_df = calculate_durations(durus_df)
+        if streaming:
+            durus_kind = "durus_stream"
+            durus_loader = partial(load_durus_data_streaming, chunk_size=chunk_size)
+        else:
+            durus_kind = "durus"
+            durus_loader = load_clean_durus_data
         
-        # Çalışma verilerini yükle
-        calisma_df = load_calisma_data(calisma_file)
-        logger.info(f"Çalışma verileri yüklendi. Satır sayısı: {len(calisma_df)}")
+        if use_cache:
+            durus_task = partial(load_with_cache, durus_file, durus_kind, durus_loader,
+                                 cache_dir=cache_dir, rebuild=rebuild_cache)
+            calisma_task = partial(load_with_cache, calisma_file, "calisma", load_clean_calisma_data,
+                                   cache_dir=cache_dir, rebuild=rebuild_cache)
+        else:
+            durus_task = partial(durus_loader, durus_file)
+            calisma_task = partial(load_clean_calisma_data, calisma_file)
+        arizali_task = partial(load_arizali_if_present, arizali_file)
         
-        # Son satırları temizle
-        calisma_df = clean_last_rows(calisma_df, "Makina Kodu")
+        load_start = time.perf_counter()
+        if parallel:
+            # Excel ayrıştırma CPU'ya bağlı olduğundan dosyalar ayrı süreçlerde işlenir;
+            # küçük arızalı listesi bu sırada ana süreçte okunur
+            with ProcessPoolExecutor(max_workers=2, initializer=get_registry,
+                                     initargs=(registry_file,)) as executor:
+                durus_future = executor.submit(_timed_call, durus_task)
+                calisma_future = executor.submit(_timed_call, calisma_task)
+                arizali_tezgahlar, arizali_time = _timed_call(arizali_task)
+                durus_df, durus_time = durus_future.result()
+                calisma_df, calisma_time = calisma_future.result()
+        else:
+            durus_df, durus_time = _timed_call(durus_task)
+            calisma_df, calisma_time = _timed_call(calisma_task)
+            arizali_tezgahlar, arizali_time = _timed_call(arizali_task)
+        load_time = time.perf_counter() - load_start
         
-        # Çalışma verilerini işle
-        calisma_df = process_calisma_data(calisma_df)
+        logger.info(f"Duruş verileri hazır. Satır sayısı: {len(durus_df)} ({durus_time:.2f} sn)")
+        logger.info(f"Çalışma verileri hazır. Satır sayısı: {len(calisma_df)} ({calisma_time:.2f} sn)")
+        logger.info(f"Arızalı tezgah listesi hazır. Tezgah sayısı: {len(arizali_tezgahlar)} ({arizali_time:.2f} sn)")
+        logger.info(f"Dosya yükleme süresi: {load_time:.2f} sn "
+                    f"({'paralel' if parallel else 'sıralı'}, dosya süreleri toplamı: "
+                    f"{durus_time + calisma_time + arizali_time:.2f} sn)")
         
-        # Arızalı tezgahları yükle (varsa)
-        arizali_tezgahlar = []
-        if arizali_file and os.path.exists(arizali_file) and os.path.getsize(arizali_file) > 0:
-            arizali_tezgahlar = load_arizali_tezgahlar(arizali_file)
+        # Arızalı tezgahları filtrele (yükleyicilerden gelen veriler bu fonksiyona ait)
+        durus_df = filter_by_arizali_tezgahlar(durus_df, arizali_tezgahlar, copy=False)
+        calisma_df = filter_by_arizali_tezgahlar(calisma_df, arizali_tezgahlar, copy=False)
         
-        # Arızalı tezgahları filtrele
-        durus_df = filter_by_arizali_tezgahlar(durus_df, arizali_tezgahlar)
-        calisma_df = filter_by_arizali_tezgahlar(calisma_df, arizali_tezgahlar)
+        # Geçmiş deposu duruşları gerçek başlangıç anıyla tanır (birleştirme tarihi güne indirger)
+        if history_dir:
+            durus_df[HISTORY_START_COLUMN] = durus_df['Duruş Başlangıç Tarih']
         
         # Verileri birleştir
         merged_df = merge_durus_calisma_data(durus_df, calisma_df)
         logger.info(f"Veriler birleştirildi. Satır sayısı: {len(merged_df)}")
         
         # Kısım bilgisini ekle
-        merged_df['KISIM'] = merged_df['İş Merkezi Kodu '].apply(assign_kisim)
+        merged_df['KISIM'] = registry.assign(merged_df['İş Merkezi Kodu '])
         
         # Hafta bilgisini ekle (hata ayıklama bilgileriyle)
-        merged_df = add_week_info(merged_df)
+        merged_df = add_week_info(merged_df, copy=False)
         logger.info(f"Hafta bilgisi eklendi. Benzersiz hafta sayısı: {merged_df['Hafta'].nunique()}")
         
+        # Geçmiş deposu kullanılıyorsa yeni günleri ekle ve analiz penceresini depodan oku
+        if history_dir:
+            update_history_store(merged_df, history_dir)
+            merged_df = load_history_window(history_dir, n_weeks=history_weeks)
+            if merged_df.empty:
+                raise ValueError(f"Geçmiş deposunda analiz edilecek veri bulunamadı: {history_dir}")
+            # Başlangıç anı yalnızca depo anahtarı içindir, analizde kullanılmaz
+            merged_df.drop(columns=[HISTORY_START_COLUMN], errors='ignore', inplace=True)
+            # Depodaki eski haftalarda bugün arızalı olan tezgahlar bulunabilir
+            merged_df = filter_by_arizali_tezgahlar(merged_df, arizali_tezgahlar, copy=False)
+        
+        # Metin sütunlarını kategorik kodlara, sayısal sütunları küçük tiplere dönüştür
+        merged_df = optimize_dtypes(merged_df)
+        
+        # Duruş adlarını her farklı ad için bir kez normalleştir (hesaplamalar bu sütuna göre gruplar)
+        merged_df[STOP_CATEGORY_COLUMN] = assign_stop_category(merged_df['Duruş Adı'])
+        
         # Hafta numaralarını al ve sırala (son hafta ilk sırada)
         weeks = sorted(merged_df['Hafta'].unique(), key=lambda x: (x < 10, x), reverse=True)
         logger.info(f"Sıralanmış hafta listesi: {weeks}")
         
         # Arızalı tezgahlardan etkilenen kısımlar için tezgah sayılarını güncelle
-        kisim_tezgah_sayilari = {}
-        for kisim, tezgahlar in KISIMLAR_DICT.items():
-            kisim_tezgah_sayilari[kisim] = len([t for t in tezgahlar if t not in arizali_tezgahlar])
+        kisim_tezgah_sayilari = registry.machine_counts(exclude=arizali_tezgahlar)
         
         logger.info("Veri hazırlama işlemi tamamlandı.")
         return merged_df, kisim_tezgah_sayilari, weeks
@@ -382,6 +702,24 @@ def prepare_data_for_analysis(
         # Boş veri döndürmek yerine hata fırlat
         raise
 
+def partition_frame(df: pd.DataFrame, column: str) -> Dict[Any, pd.DataFrame]:
+    """
+    Veri setini bir sütunun değerlerine göre tek geçişte bölümlere ayırır.
+    
+    Grup indeksleri bir kez hesaplanır; her değer için ayrı bir karşılaştırma
+    (df[df[column] == değer]) yapılmadığından tezgah başına çıktı üreten döngüler
+    veri boyutuyla doğrusal çalışır. Bölümler ilk görülme sırasıyla döner, eksik
+    değerli satırlar hiçbir bölüme girmez.
+    
+    Args:
+        df: Bölümlenecek DataFrame
+        column: Bölümleme sütunu (ör. İş Merkezi Kodu)
+        
+    Returns:
+        Dict[Any, pd.DataFrame]: Sütun değeri -> o değere ait satırlar
+    """
+    return {key: part for key, part in df.groupby(column, observed=True, sort=False)}
+
 def get_latest_week_data(df: pd.DataFrame, weeks: List[int]) -> pd.DataFrame:
     """
     En son haftaya ait veriyi filtreler.
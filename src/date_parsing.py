@@ -0,0 +1,142 @@
+"""
+Dışa aktarım dosyalarındaki tarih sütunları için biçim algılayan hızlı ayrıştırma fonksiyonları.
+"""
+
+import os
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+import logging
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("date_parsing.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Dışa aktarımlarda karşılaşılan tarih biçimleri (deneme sırasıyla)
+DATE_FORMAT_CANDIDATES = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%d.%m.%Y %H:%M:%S",
+    "%d.%m.%Y %H:%M",
+    "%d.%m.%Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+]
+
+# (kaynak dosya, değişiklik zamanı, sütun) -> algılanan biçim
+# (None: metin değer yok veya biçim algılanamadı). Dosya değişirse anahtar da değişir.
+_detected_formats: Dict[Tuple[str, float, str], Optional[str]] = {}
+
+def _format_cache_key(source: Optional[str], column: str) -> Optional[Tuple[str, float, str]]:
+    """
+    Biçim önbelleği anahtarını döndürür; kaynak yoksa veya okunamıyorsa None.
+    """
+    if not source:
+        return None
+    try:
+        return (source, os.path.getmtime(source), column)
+    except OSError:
+        return None
+
+def detect_date_format(values: pd.Series, sample_size: int = 200) -> Optional[str]:
+    """
+    Metin tarih değerlerinin biçimini bir örnek üzerinden algılar.
+    
+    Args:
+        values: Tarih değerleri
+        sample_size: Denenecek en fazla değer sayısı
+    
+    Returns:
+        Optional[str]: Örnekte en çok değeri ayrıştıran biçim, hiçbiri uymazsa None
+    """
+    sample = values.dropna().head(sample_size)
+    sample = sample[sample.map(type) == str].str.strip()
+    if sample.empty:
+        return None
+    
+    best_format, best_count = None, 0
+    for fmt in DATE_FORMAT_CANDIDATES:
+        parsed_count = pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum()
+        if parsed_count == len(sample):
+            return fmt
+        # Hatalı birkaç değer biçim algılamayı bozmasın
+        if parsed_count > best_count:
+            best_format, best_count = fmt, parsed_count
+    
+    return best_format
+
+def parse_date_column(
+    values: pd.Series,
+    column: Optional[str] = None,
+    source: Optional[str] = None
+) -> pd.Series:
+    """
+    Tarih sütununu tek seferde datetime64 tipine dönüştürür.
+    
+    Sütun zaten datetime64 ise olduğu gibi döndürülür. Metin değerler için biçim
+    dosya ve sütun başına bir kez algılanıp saklanır; sonraki çağrılar (ör. akış
+    modundaki satır grupları) dosya değişmediği sürece aynı biçimi doğrudan kullanır. Ayrıştırılamayan
+    satırlar NaT olur ve sayılarıyla birlikte loglanır.
+    
+    Args:
+        values: Dönüştürülecek tarih sütunu
+        column: Sütun adı (loglama ve biçim önbelleği için, None ise values.name)
+        source: Kaynak dosya yolu (biçim önbelleği anahtarı)
+    
+    Returns:
+        pd.Series: datetime64 tipinde sütun
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    column = column or str(values.name)
+    cache_key = _format_cache_key(source, column)
+    
+    if cache_key is not None and cache_key in _detected_formats:
+        fmt = _detected_formats[cache_key]
+    else:
+        fmt = detect_date_format(values)
+        if cache_key is not None:
+            _detected_formats[cache_key] = fmt
+        if fmt:
+            logger.info(f"'{column}' sütunu için tarih biçimi algılandı: {fmt}")
+    
+    if fmt:
+        parsed = pd.to_datetime(values, format=fmt, errors='coerce')
+    else:
+        parsed = pd.to_datetime(values, errors='coerce')
+    
+    report_parse_failures(values, parsed, column)
+    return parsed
+
+def report_parse_failures(values: pd.Series, parsed: pd.Series, column: str, limit: int = 5) -> List:
+    """
+    Boş olmadığı halde ayrıştırılamayan satırları loglar.
+    
+    Args:
+        values: Orijinal değerler
+        parsed: Ayrıştırılmış değerler
+        column: Sütun adı
+        limit: Logda gösterilecek en fazla örnek sayısı
+    
+    Returns:
+        List: Ayrıştırılamayan satırların indeksleri
+    """
+    failed = parsed.isna() & values.notna()
+    failed_index = list(values.index[failed])
+    
+    if failed_index:
+        examples = ", ".join(f"{idx}: {values[idx]!r}" for idx in failed_index[:limit])
+        logger.warning(f"'{column}' sütununda {len(failed_index)} satır tarih olarak ayrıştırılamadı "
+                       f"(örnekler: {examples})")
+    
+    return failed_index
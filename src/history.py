@@ -0,0 +1,221 @@
+"""
+Haftalara bölünmüş, yalnızca ekleme yapılan yerel duruş geçmişi deposu.
+"""
+
+import os
+import re
+import json
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+import logging
+
+# Konfigürasyon dosyasını içe aktar
+from config.settings import DATA_PATHS
+from src.cache import storage_format
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("history.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Duruşun güne indirgenmemiş başlangıç anı (birleştirme adımı "Duruş Başlangıç Tarih"
+# sütununu güne indirdiği için depoya ayrıca yazılır)
+HISTORY_START_COLUMN = 'Duruş Başlangıç Zamanı'
+
+# Aynı kaydın tekrar eden dışa aktarımlarda tanınmasını sağlayan sütunlar: tezgah + duruş +
+# başlangıç anı. Bitiş ve süre anahtara girmez; sonraki bir dışa aktarımda düzeltilen
+# duruş eski kaydın yerine geçer. Başlangıç anı olmayan kayıtlar (çalışma süreleri) ve
+# akış modunda gün bazında toplanan duruşlar tezgah + duruş + gün ile tanınır.
+HISTORY_KEY_COLUMNS = ['İş Merkezi Kodu ', 'Duruş Adı', HISTORY_START_COLUMN]
+
+MANIFEST_FILE = "history.json"
+PARTITION_PATTERN = re.compile(r"^YılHafta=(\d+)-(\d+)\.(parquet|pkl)$")
+
+def _partition_file(store_dir: str, yil_hafta: str, fmt: str) -> str:
+    """
+    Bir haftalık bölümün dosya yolunu döndürür.
+    """
+    extension = "parquet" if fmt == "parquet" else "pkl"
+    return os.path.join(store_dir, f"YılHafta={yil_hafta}.{extension}")
+
+def _read_partition(path: str) -> pd.DataFrame:
+    """
+    Bir haftalık bölümü okur.
+    """
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+def _write_partition(df: pd.DataFrame, path: str) -> None:
+    """
+    Bir haftalık bölümü geçici dosya üzerinden atomik olarak yazar.
+    """
+    tmp_path = path + ".tmp"
+    if path.endswith(".parquet"):
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+def _read_manifest(store_dir: str) -> Dict:
+    """
+    Depo kaydını okur, yoksa boş sözlük döndürür.
+    """
+    try:
+        with open(os.path.join(store_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_manifest(store_dir: str, manifest: Dict) -> None:
+    """
+    Depo kaydını yazar.
+    """
+    with open(os.path.join(store_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+def _history_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Satırların tekrar kontrolünde kullanılan anahtar sütunlarını oluşturur.
+    
+    Başlangıç anı HISTORY_START_COLUMN sütunundan alınır. Bu sütun olmadan yazılmış
+    eski bölümlerde an, bitiş zamanından süre çıkarılarak bulunur (süre bitiş ile
+    başlangıç arasındaki farktır); ikisi de yoksa gün kullanılır.
+    
+    Args:
+        df: Bölüm verisi
+    
+    Returns:
+        pd.DataFrame: Satır başına anahtar değerleri
+    """
+    start = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+    if HISTORY_START_COLUMN in df.columns:
+        start = df[HISTORY_START_COLUMN].astype('datetime64[ns]')
+    if 'Duruş Bitiş Tarih' in df.columns and 'Süre (Saniye)' in df.columns:
+        start = start.fillna(df['Duruş Bitiş Tarih'] - pd.to_timedelta(df['Süre (Saniye)'], unit='s'))
+    start = start.fillna(df['Duruş Başlangıç Tarih'].dt.normalize())
+    
+    return pd.DataFrame({
+        'İş Merkezi Kodu ': df['İş Merkezi Kodu '],
+        'Duruş Adı': df['Duruş Adı'],
+        HISTORY_START_COLUMN: start
+    })
+
+def list_history_partitions(store_dir: Optional[str] = None) -> Dict[Tuple[int, int], str]:
+    """
+    Depodaki haftalık bölümleri (yıl, hafta) sırasıyla listeler.
+    
+    Args:
+        store_dir: Depo dizini (None ise ayarlardaki dizin kullanılır)
+    
+    Returns:
+        Dict[Tuple[int, int], str]: (yıl, hafta) -> bölüm dosya yolu
+    """
+    store_dir = store_dir or DATA_PATHS["history"]
+    if not os.path.isdir(store_dir):
+        return {}
+    
+    partitions = {}
+    for name in os.listdir(store_dir):
+        match = PARTITION_PATTERN.match(name)
+        if match:
+            partitions[(int(match.group(1)), int(match.group(2)))] = os.path.join(store_dir, name)
+    
+    return dict(sorted(partitions.items()))
+
+def update_history_store(df: pd.DataFrame, store_dir: Optional[str] = None) -> List[str]:
+    """
+    Hafta bilgisi eklenmiş veriyi depoya ekler.
+    
+    Depoda kayıtlı son günden önceki satırlar daha önce işlendiği için atlanır;
+    son gün ve sonrası, ilgili haftalık bölümlerle birleştirilip tekrar eden
+    kayıtlar ayıklanarak yazılır. Yalnızca etkilenen bölümler yeniden yazılır.
+    
+    Args:
+        df: add_week_info ile hafta bilgisi eklenmiş DataFrame
+        store_dir: Depo dizini (None ise ayarlardaki dizin kullanılır)
+    
+    Returns:
+        List[str]: Güncellenen YılHafta değerleri
+    """
+    store_dir = store_dir or DATA_PATHS["history"]
+    os.makedirs(store_dir, exist_ok=True)
+    
+    manifest = _read_manifest(store_dir)
+    new_df = df
+    
+    # Önceki çalıştırmalarda işlenmiş günleri atla (son gün eksik olabileceği için tekrar işlenir)
+    last_date = manifest.get("last_date")
+    if last_date:
+        new_df = df[df['Duruş Başlangıç Tarih'] >= pd.Timestamp(last_date)]
+        logger.info(f"Geçmiş deposunda kayıtlı {len(df) - len(new_df)} satır atlandı, "
+                    f"{len(new_df)} satır işlenecek.")
+    
+    if new_df.empty:
+        logger.info("Geçmiş deposuna eklenecek yeni veri yok.")
+        return []
+    
+    existing = {f"{yil}-{hafta}": path for (yil, hafta), path in list_history_partitions(store_dir).items()}
+    fmt = storage_format()
+    updated_weeks = []
+    
+    for yil_hafta, week_df in new_df.groupby('YılHafta', sort=False):
+        if yil_hafta in existing:
+            old_df = _read_partition(existing[yil_hafta])
+            week_df = pd.concat([old_df, week_df], ignore_index=True)
+            # Aynı kayıt tekrar gelirse en yeni dışa aktarımdaki değer geçerli olur
+            week_df = week_df[~_history_keys(week_df).duplicated(keep='last')]
+        
+        path = _partition_file(store_dir, yil_hafta, fmt)
+        _write_partition(week_df.reset_index(drop=True), path)
+        if yil_hafta in existing and existing[yil_hafta] != path:
+            os.remove(existing[yil_hafta])
+        updated_weeks.append(yil_hafta)
+    
+    max_date = new_df['Duruş Başlangıç Tarih'].max()
+    if not last_date or max_date > pd.Timestamp(last_date):
+        manifest["last_date"] = max_date.isoformat()
+    _write_manifest(store_dir, manifest)
+    
+    logger.info(f"Geçmiş deposu güncellendi. Güncellenen haftalar: {updated_weeks}")
+    return updated_weeks
+
+def load_history_window(
+    store_dir: Optional[str] = None,
+    n_weeks: Optional[int] = None,
+    year_weeks: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Depodan istenen hafta aralığını okur.
+    
+    Args:
+        store_dir: Depo dizini (None ise ayarlardaki dizin kullanılır)
+        n_weeks: Okunacak en son hafta sayısı (None ise tüm haftalar, 0 ise hiçbiri)
+        year_weeks: Okunacak YılHafta değerleri (verilirse n_weeks yok sayılır)
+    
+    Returns:
+        pd.DataFrame: Seçilen haftaların verisi
+    """
+    partitions = list_history_partitions(store_dir)
+    
+    if year_weeks is not None:
+        selected = [path for (yil, hafta), path in partitions.items() if f"{yil}-{hafta}" in year_weeks]
+    elif n_weeks is not None:
+        # [-0:] tüm listeyi döndüreceği için sıfır ve negatif değerler hiçbir hafta seçmez
+        selected = list(partitions.values())[-n_weeks:] if n_weeks > 0 else []
+    else:
+        selected = list(partitions.values())
+    
+    if not selected:
+        logger.warning("Geçmiş deposunda istenen haftalara ait veri bulunamadı.")
+        return pd.DataFrame()
+    
+    window_df = pd.concat([_read_partition(path) for path in selected], ignore_index=True)
+    logger.info(f"Geçmiş deposundan {len(selected)} hafta okundu. Satır sayısı: {len(window_df)}")
+    return window_df
@@ -1,9 +1,21 @@
 """
 Tezgah duruş analizi kaynak kod paketi.
+
+Not: Bu dosya __init__.py değil init.py olarak adlandırıldığından Python
+tarafından paket başlatıcısı olarak çalıştırılmaz; src bir ad alanı paketi
+olarak yüklenir. Yeniden adlandırılırsa da alt modüller (özellikle ağır grafik
+bağımlılıkları olan visualization) paket içe aktarılırken değil, ilk
+erişildiklerinde yüklenir.
 """
 
-from . import data_processing
-from . import calculations
-from . import visualization
+import importlib
+
+__all__ = ['data_processing', 'calculations', 'visualization']
 
-__all__ = ['data_processing', 'calculations', 'visualization']
\ No newline at end of file
+def __getattr__(name: str):
+    """
+    Alt modülleri ilk erişimde yükler.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
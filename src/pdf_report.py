@@ -0,0 +1,233 @@
+"""
+Grafik işlerini tek bir çok sayfalı PDF raporuna sayfa sayfa yazan fonksiyonlar.
+"""
+
+import os
+import math
+import pickle
+import time
+from datetime import datetime
+import numpy as np
+from typing import Any, List, Optional, Tuple
+import logging
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
+
+from src.rendering import RenderJob, RenderResult, run_render_jobs
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("pdf_report.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Raporun varsayılan dosya yolu
+PDF_REPORT_PATH = "Raporlar/Haftalık Rapor.pdf"
+
+# Rapor bölümleri (sayfa sırası)
+REPORT_SECTIONS = ["Genel", "Kısımlar", "Tezgahlar"]
+
+# İçindekiler sayfası başına satır sayısı ve sayfa boyutu (A4 dikey, inç)
+TOC_LINES_PER_PAGE = 48
+TOC_PAGE_SIZE = (8.27, 11.69)
+
+# PIL görsellerinin (OEE kartları) sayfaya yerleştirilme çözünürlüğü
+IMAGE_PAGE_DPI = 100
+
+def report_section(output_path: str) -> str:
+    """
+    Grafiğin dosya yolundan rapor bölümünü belirler.
+    
+    Raporlar altındaki ilk klasör (OEE görsellerinde Tee altındaki) bölüm adıdır;
+    bölümlerden biri değilse grafik genel bölüme alınır.
+    
+    Args:
+        output_path: Grafik dosyasının yolu
+    
+    Returns:
+        str: REPORT_SECTIONS elemanı
+    """
+    parts = os.path.normpath(os.path.relpath(output_path, "Raporlar")).split(os.sep)
+    if parts[0] == "Tee" and len(parts) > 1:
+        parts = parts[1:]
+    return parts[0] if parts[0] in REPORT_SECTIONS else REPORT_SECTIONS[0]
+
+def entry_title(output_path: str) -> str:
+    """
+    İçindekiler satırı için grafiğin başlığını dosya yolundan üretir.
+    
+    Args:
+        output_path: Grafik dosyasının yolu
+    
+    Returns:
+        str: Raporlar klasörüne göre uzantısız yol
+    """
+    return os.path.splitext(os.path.relpath(output_path, "Raporlar"))[0].replace(os.sep, " / ")
+
+def order_report_jobs(jobs: List[RenderJob]) -> List[Tuple[str, RenderJob]]:
+    """
+    İşleri rapor bölümlerine göre (Genel -> Kısımlar -> Tezgahlar) sıralar.
+    
+    Bölüm içinde işlerin verildiği sıra korunur.
+    
+    Args:
+        jobs: Grafik işleri
+    
+    Returns:
+        List[Tuple[str, RenderJob]]: (bölüm, iş) çiftleri
+    """
+    sections = [(report_section(job.output_path), job) for job in jobs]
+    return sorted(sections, key=lambda item: REPORT_SECTIONS.index(item[0]))
+
+def _toc_lines(entries: List[Tuple[str, RenderJob]], first_page: int) -> List[Tuple[str, str, bool]]:
+    """
+    İçindekiler satırlarını (metin, sayfa, bölüm başlığı mı) oluşturur.
+    
+    Args:
+        entries: order_report_jobs çıktısı
+        first_page: İlk grafik sayfasının numarası
+    
+    Returns:
+        List[Tuple[str, str, bool]]: İçindekiler satırları
+    """
+    lines = []
+    current = None
+    for index, (section, job) in enumerate(entries):
+        if section != current:
+            lines.append((section, str(first_page + index), True))
+            current = section
+        lines.append((entry_title(job.output_path), str(first_page + index), False))
+    return lines
+
+def _toc_page_count(entries: List[Tuple[str, RenderJob]]) -> int:
+    """
+    İçindekiler için gereken sayfa sayısını döndürür.
+    """
+    line_count = len(entries) + len({section for section, _ in entries})
+    return max(1, math.ceil(line_count / TOC_LINES_PER_PAGE))
+
+def write_toc_pages(pdf: PdfPages, entries: List[Tuple[str, RenderJob]], title: str) -> int:
+    """
+    İçindekiler sayfalarını rapora yazar.
+    
+    Her iş rapora tek sayfa eklediğinden sayfa numaraları grafikler çizilmeden önce bilinir.
+    
+    Args:
+        pdf: Açık PDF dosyası
+        entries: order_report_jobs çıktısı
+        title: Rapor başlığı
+    
+    Returns:
+        int: Yazılan içindekiler sayfası sayısı
+    """
+    page_count = _toc_page_count(entries)
+    lines = _toc_lines(entries, first_page=page_count + 1)
+    
+    for page in range(page_count):
+        fig = Figure(figsize=TOC_PAGE_SIZE)
+        if page == 0:
+            fig.text(0.08, 0.95, title, fontsize=16, fontweight='bold')
+            fig.text(0.08, 0.925, f"Oluşturulma: {datetime.now().strftime('%d.%m.%Y %H:%M')}", fontsize=9)
+        fig.text(0.08, 0.89, "İçindekiler" if page == 0 else "İçindekiler (devam)", fontsize=13, fontweight='bold')
+        
+        for row, (text, page_number, is_section) in enumerate(
+            lines[page * TOC_LINES_PER_PAGE:(page + 1) * TOC_LINES_PER_PAGE]
+        ):
+            y = 0.86 - row * 0.0165
+            fig.text(0.08 if is_section else 0.11, y, text, fontsize=9,
+                     fontweight='bold' if is_section else 'normal')
+            if not is_section:
+                fig.text(0.92, y, page_number, fontsize=9, ha='right')
+        
+        fig.text(0.5, 0.03, f"Sayfa {page + 1}", fontsize=8, ha='center')
+        pdf.savefig(fig)
+    
+    return page_count
+
+def _page_figure(page: Any) -> Figure:
+    """
+    Yakalanan sayfayı PDF'e yazılabilir şekle dönüştürür.
+    
+    Args:
+        page: Serileştirmesi çözülmüş matplotlib şekli veya PIL görseli
+    
+    Returns:
+        Figure: Sayfa şekli
+    """
+    if isinstance(page, Figure):
+        return page
+    
+    # PIL görselleri (OEE kartları) özgün piksel boyutuyla yerleştirilir
+    fig = Figure(figsize=(page.width / IMAGE_PAGE_DPI, page.height / IMAGE_PAGE_DPI), dpi=IMAGE_PAGE_DPI)
+    fig.figimage(np.asarray(page.convert("RGB")), 0, 0)
+    return fig
+
+def _placeholder_figure(title: str, message: str) -> Figure:
+    """
+    Çizilemeyen grafik için içindekiler numaralarını koruyan yer tutucu sayfa oluşturur.
+    """
+    fig = Figure(figsize=(11.69, 8.27))
+    fig.text(0.5, 0.55, title, fontsize=14, ha='center')
+    fig.text(0.5, 0.45, message, fontsize=10, ha='center', color='gray')
+    return fig
+
+def write_pdf_report(
+    jobs: List[RenderJob],
+    output_path: str = PDF_REPORT_PATH,
+    workers: Optional[int] = None,
+    title: str = "Tezgah Duruş Analizi - Haftalık Rapor"
+) -> Tuple[str, List[RenderResult]]:
+    """
+    Grafik işlerini çalıştırıp sonuçlarını tek bir çok sayfalı PDF raporuna yazar.
+    
+    İşler sayfa yakalayan (capture) profille oluşturulmuş olmalıdır; grafikler
+    dosyaya yazılmaz, her iş rapora bir sayfa ekler. Sayfalar bölüm sırasıyla
+    (Genel -> Kısımlar -> Tezgahlar) ve işler tamamlandıkça yazılır; şekiller
+    bellekte biriktirilmez. İlk sayfalar içindekiler tablosudur.
+    
+    Args:
+        jobs: Grafik işleri
+        output_path: PDF dosyasının yolu
+        workers: Süreç sayısı (None ise işlemci çekirdeği sayısı)
+        title: Rapor başlığı
+    
+    Returns:
+        Tuple[str, List[RenderResult]]: Kaydedilen PDF dosyasının yolu ve rapor
+            sırasındaki iş sonuçları (sayfaları çıkarılmış)
+    """
+    start = time.perf_counter()
+    entries = order_report_jobs(jobs)
+    ordered_jobs = [job for _, job in entries]
+    
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    with PdfPages(output_path, metadata={"Title": title, "Creator": "Tezgah Duruş Analizi"}) as pdf:
+        toc_pages = write_toc_pages(pdf, entries, title)
+        
+        def write_page(index: int, result: RenderResult) -> None:
+            page_number = toc_pages + index + 1
+            if result.error or not result.pages:
+                fig = _placeholder_figure(entry_title(result.output_path),
+                                          result.error or "Bu grafik için çizilecek veri yok.")
+            else:
+                if len(result.pages) > 1:
+                    logger.warning(f"{result.output_path} birden çok sayfa üretti; yalnızca ilki rapora eklendi.")
+                fig = _page_figure(pickle.loads(result.pages[0]))
+            fig.text(0.99, 0.005, f"Sayfa {page_number}", fontsize=7, ha='right', va='bottom')
+            pdf.savefig(fig, bbox_inches='tight')
+        
+        results = run_render_jobs(ordered_jobs, workers=workers, on_result=write_page)
+        page_count = toc_pages + len(results)
+    
+    failures = sum(1 for result in results if result.error)
+    logger.info(f"PDF raporu kaydedildi: {output_path} ({page_count} sayfa, başarısız grafik: {failures}, "
+                f"{time.perf_counter() - start:.2f} saniye)")
+    return output_path, results
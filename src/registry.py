@@ -0,0 +1,245 @@
+"""
+Tezgah → kısım eşlemesini bir kez derleyip sabit zamanlı sorgular sunan tezgah kaydı.
+"""
+
+import os
+import csv
+import json
+import hashlib
+import time
+import importlib
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional
+import logging
+
+# Konfigürasyon dosyasını içe aktar
+import config.tezgah_listesi as tezgah_listesi
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("registry.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Hiçbir kısma ait olmayan tezgahlar için kullanılan kısım adı
+UNKNOWN_KISIM = "Diğer"
+
+# Kısım listesinin tek fabrika altında tutulduğu durumlarda kullanılan fabrika adı
+DEFAULT_PLANT = "Genel"
+
+class MachineRegistry:
+    """
+    Tezgah → kısım (ve fabrika) eşlemesini tutan kayıt.
+    
+    Kaynak olarak config/tezgah_listesi.py (varsayılan) veya harici bir CSV/YAML
+    dosyası kullanılabilir. CSV dosyası "Tezgah", "KISIM" ve isteğe bağlı "Fabrika"
+    sütunlarını; YAML dosyası {KISIM: [tezgahlar]} ya da
+    {Fabrika: {KISIM: [tezgahlar]}} yapısını içermelidir.
+    """
+    
+    def __init__(self, source: Optional[str] = None):
+        """
+        Args:
+            source: Harici kayıt dosyası yolu (None ise config/tezgah_listesi.py kullanılır)
+        """
+        self.source = source
+        self._mtime = None
+        self._last_check = 0.0
+        self.load()
+    
+    @property
+    def source_path(self) -> str:
+        """
+        Değişiklikleri izlenen kaynak dosyanın yolu.
+        """
+        return self.source or tezgah_listesi.__file__
+    
+    def load(self) -> None:
+        """
+        Kaynağı okuyup eşleme tablolarını yeniden derler.
+        """
+        if self.source is None:
+            importlib.reload(tezgah_listesi)
+            plants = {DEFAULT_PLANT: tezgah_listesi.KISIMLAR_DICT}
+        elif self.source.lower().endswith(".csv"):
+            plants = self._read_csv(self.source)
+        elif self.source.lower().endswith((".yaml", ".yml")):
+            plants = self._read_yaml(self.source)
+        else:
+            raise ValueError(f"Desteklenmeyen tezgah kaydı dosyası: {self.source}")
+        
+        self.kisimlar: Dict[str, List[str]] = {}
+        self.machine_to_kisim: Dict[str, str] = {}
+        self.machine_to_plant: Dict[str, str] = {}
+        
+        for plant, kisimlar in plants.items():
+            for kisim, tezgahlar in kisimlar.items():
+                self.kisimlar.setdefault(kisim, [])
+                for tezgah in tezgahlar:
+                    if tezgah in self.machine_to_kisim:
+                        logger.warning(f"{tezgah} tezgahı birden fazla kez tanımlanmış, ilk tanım kullanılıyor.")
+                        continue
+                    self.kisimlar[kisim].append(tezgah)
+                    self.machine_to_kisim[tezgah] = kisim
+                    self.machine_to_plant[tezgah] = plant
+        
+        self.machines = frozenset(self.machine_to_kisim)
+        self._mtime = os.path.getmtime(self.source_path)
+        logger.info(f"Tezgah kaydı yüklendi: {len(self.machines)} tezgah, {len(self.kisimlar)} kısım "
+                    f"({self.source_path})")
+    
+    @staticmethod
+    def _read_csv(path: str) -> Dict[str, Dict[str, List[str]]]:
+        """
+        CSV kayıt dosyasını fabrika → kısım → tezgah yapısına dönüştürür.
+        """
+        plants: Dict[str, Dict[str, List[str]]] = {}
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                plant = (row.get("Fabrika") or DEFAULT_PLANT).strip()
+                plants.setdefault(plant, {}).setdefault(row["KISIM"].strip(), []).append(row["Tezgah"].strip())
+        return plants
+    
+    @staticmethod
+    def _read_yaml(path: str) -> Dict[str, Dict[str, List[str]]]:
+        """
+        YAML kayıt dosyasını fabrika → kısım → tezgah yapısına dönüştürür.
+        """
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("YAML tezgah kaydı için PyYAML paketi gerekli (pip install pyyaml).")
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            content = yaml.safe_load(f) or {}
+        
+        # Tek seviyeli yapı ({KISIM: [tezgahlar]}) tek bir fabrika olarak kabul edilir
+        if all(isinstance(value, list) for value in content.values()):
+            return {DEFAULT_PLANT: content}
+        return content
+    
+    def reload_if_changed(self, min_interval: float = 1.0) -> bool:
+        """
+        Kaynak dosya değiştiyse kaydı yeniden yükler.
+        
+        Args:
+            min_interval: İki dosya kontrolü arasındaki en kısa süre (saniye)
+        
+        Returns:
+            bool: Kayıt yeniden yüklendiyse True
+        """
+        now = time.monotonic()
+        if now - self._last_check < min_interval:
+            return False
+        self._last_check = now
+        
+        try:
+            mtime = os.path.getmtime(self.source_path)
+        except OSError:
+            return False
+        
+        if mtime == self._mtime:
+            return False
+        
+        logger.info(f"Tezgah kaydı değişmiş, yeniden yükleniyor: {self.source_path}")
+        self.load()
+        return True
+    
+    def __contains__(self, machine: str) -> bool:
+        return machine in self.machines
+    
+    def kisim_of(self, machine: str) -> str:
+        """
+        Tezgahın kısmını döndürür.
+        
+        Args:
+            machine: Tezgah kodu
+        
+        Returns:
+            str: Kısım adı (bilinmeyen tezgahlar için "Diğer")
+        """
+        return self.machine_to_kisim.get(machine, UNKNOWN_KISIM)
+    
+    def assign(self, machines: pd.Series) -> pd.Series:
+        """
+        Tezgah kodu sütununa kısım atar.
+        
+        Eşleme her farklı tezgah kodu için bir kez yapılır; kategorik sütunlarda
+        yalnızca kategoriler eşlenir ve satırlara kodlar üzerinden dağıtılır.
+        
+        Args:
+            machines: Tezgah kodu sütunu
+        
+        Returns:
+            pd.Series: Kısım sütunu
+        """
+        if isinstance(machines.dtype, pd.CategoricalDtype):
+            # Son eleman, eksik değerlerin kodu olan -1 ile seçilir
+            kisim_by_code = np.array(
+                [self.kisim_of(machine) for machine in machines.cat.categories] + [UNKNOWN_KISIM],
+                dtype=object
+            )
+            return pd.Series(kisim_by_code[machines.cat.codes], index=machines.index,
+                             name="KISIM", dtype="category")
+        return machines.map(self.machine_to_kisim).fillna(UNKNOWN_KISIM).rename("KISIM")
+    
+    def machine_counts(self, exclude: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Kısımlara göre tezgah sayılarını döndürür.
+        
+        Args:
+            exclude: Sayıma katılmayacak tezgahlar (ör. arızalı tezgahlar)
+        
+        Returns:
+            Dict[str, int]: Kısım adı -> tezgah sayısı
+        """
+        excluded = set(exclude or [])
+        return {
+            kisim: sum(1 for tezgah in tezgahlar if tezgah not in excluded)
+            for kisim, tezgahlar in self.kisimlar.items()
+        }
+    
+    def plants(self) -> Dict[str, List[str]]:
+        """
+        Fabrikalara göre tezgah listelerini döndürür.
+        """
+        result: Dict[str, List[str]] = {}
+        for tezgah, plant in self.machine_to_plant.items():
+            result.setdefault(plant, []).append(tezgah)
+        return result
+    
+    def fingerprint(self) -> str:
+        """
+        Kayıt içeriğinin özetini döndürür (önbellek geçersizleştirme için).
+        """
+        payload = json.dumps(self.kisimlar, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+# Süreç genelinde kullanılan etkin kayıt
+_active_registry: Optional[MachineRegistry] = None
+
+def get_registry(source: Optional[str] = None) -> MachineRegistry:
+    """
+    Etkin tezgah kaydını döndürür; kaynak dosya değiştiyse yeniden yükler.
+    
+    Args:
+        source: Harici kayıt dosyası yolu. Verilirse ve etkin kaydın kaynağından
+            farklıysa bu dosyadan yeni bir kayıt oluşturulup etkin yapılır.
+    
+    Returns:
+        MachineRegistry: Etkin tezgah kaydı
+    """
+    global _active_registry
+    
+    if _active_registry is None or (source is not None and source != _active_registry.source):
+        _active_registry = MachineRegistry(source)
+    else:
+        _active_registry.reload_if_changed()
+    
+    return _active_registry
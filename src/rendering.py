@@ -0,0 +1,437 @@
+"""
+Grafik üretim işlerini süreç havuzunda paralel çalıştıran fonksiyonlar.
+"""
+
+import os
+import json
+import time
+import pickle
+import hashlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import logging
+
+import pandas as pd
+
+# Konfigürasyon dosyasını içe aktar
+from config.settings import VISUALIZATION_SETTINGS, OUTPUT_PROFILES, CHART_FAMILIES
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("rendering.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Grafik parmak izlerinin tutulduğu manifest dosyası
+RENDER_MANIFEST_PATH = "Raporlar/.render_manifest.json"
+
+# Grafik fonksiyonlarının çizimi değiştiğinde artırılır; eski önbellek kayıtlarını geçersiz kılar
+RENDER_CACHE_VERSION = 2
+
+# Süreç havuzunda süreç başına aynı anda bekleyebilecek en fazla iş sayısı
+MAX_PENDING_JOBS_PER_WORKER = 2
+
+class RenderJob(NamedTuple):
+    """
+    Tek bir grafiğin üretim işi.
+    
+    Alanlar süreçler arasında aktarılabilmelidir: func modül düzeyinde tanımlı bir
+    grafik fonksiyonu, kwargs grafiğin veri dilimi ve ayarlarıdır. outputs, birden
+    çok dosya yazan işlerin output_path dışındaki dosyalarıdır; önbellekten
+    kullanılabilmesi için işin tüm dosyaları mevcut olmalıdır.
+    """
+    func: Callable[..., Any]
+    kwargs: Dict[str, Any]
+    output_path: str
+    outputs: Tuple[str, ...] = ()
+
+class RenderResult(NamedTuple):
+    """
+    Bir üretim işinin sonucu.
+    
+    pages, sayfa yakalayan (capture) profillerle çizilen şekillerin ve görsellerin
+    pickle ile serileştirilmiş halleridir.
+    """
+    output_path: str
+    seconds: float
+    error: Optional[str]
+    cached: bool = False
+    pages: Tuple[bytes, ...] = ()
+
+# Çalışan işin yakaladığı sayfalar (_execute_job her işten önce ve sonra temizler)
+_captured_pages: List[bytes] = []
+
+def get_output_profile(
+    family: Optional[str],
+    name: Optional[str] = None,
+    overrides: Optional[Dict[str, str]] = None,
+    thumbnails: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Grafik ailesi için çıktı profilini döndürür.
+    
+    Profil adı sırasıyla overrides, VISUALIZATION_SETTINGS["family_profiles"],
+    name ve VISUALIZATION_SETTINGS["output_profile"] değerlerinden ilk dolu olanıdır.
+    
+    Args:
+        family: Grafik ailesi (CHART_FAMILIES elemanı; None ise aile ayarı uygulanmaz)
+        name: Çalıştırma için seçilen profil adı
+        overrides: Aile -> profil adı (komut satırından)
+        thumbnails: Verilirse profilin küçük resim ayarını geçersiz kılar
+    
+    Returns:
+        Dict[str, Any]: Profil ayarları (adı "name" anahtarında)
+    """
+    profile_name = ((overrides or {}).get(family)
+                    or VISUALIZATION_SETTINGS.get("family_profiles", {}).get(family)
+                    or name
+                    or VISUALIZATION_SETTINGS["output_profile"])
+    if profile_name not in OUTPUT_PROFILES:
+        raise ValueError(f"Bilinmeyen çıktı profili: {profile_name} "
+                         f"(geçerli profiller: {', '.join(OUTPUT_PROFILES)})")
+    
+    profile = dict(OUTPUT_PROFILES[profile_name], name=profile_name)
+    if thumbnails is not None:
+        profile["thumbnail"] = thumbnails
+    return profile
+
+def build_output_profiles(
+    name: Optional[str] = None,
+    overrides: Optional[Dict[str, str]] = None,
+    thumbnails: Optional[bool] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Tüm grafik aileleri için çıktı profillerini döndürür.
+    
+    Profiller grafik işlerine parametre olarak verilir; böylece havuz süreçleri
+    ek bir duruma ihtiyaç duymaz ve profil grafik parmak izine dahil olur.
+    
+    Args:
+        name: Çalıştırma için seçilen profil adı
+        overrides: Aile -> profil adı
+        thumbnails: Verilirse tüm profillerin küçük resim ayarını geçersiz kılar
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: Aile -> profil ayarları
+    """
+    return {family: get_output_profile(family, name, overrides, thumbnails) for family in CHART_FAMILIES}
+
+def profile_output_path(output_path: str, profile: Dict[str, Any]) -> str:
+    """
+    Dosya yolunun uzantısını profilin biçimine göre değiştirir.
+    
+    Args:
+        output_path: Grafik dosyasının yolu
+        profile: Çıktı profili
+    
+    Returns:
+        str: Profil biçimindeki dosya yolu
+    """
+    return f"{os.path.splitext(output_path)[0]}.{profile['format']}"
+
+# Piksel tabanlı görsellerin (OEE kartları) profil biçiminde kaydedilebildiği biçimler
+RASTER_FORMATS = ("png", "webp")
+
+def image_output_path(output_path: str, profile: Dict[str, Any]) -> str:
+    """
+    PIL ile çizilen görselin dosya yolunu profilin biçimine göre döndürür.
+    
+    Raster profillerde profilin biçimi kullanılır; vektör profillerde görsel PNG kalır.
+    
+    Args:
+        output_path: Görsel dosyasının yolu
+        profile: Çıktı profili
+    
+    Returns:
+        str: Görselin kaydedileceği yol
+    """
+    if profile["format"] in RASTER_FORMATS:
+        return profile_output_path(output_path, profile)
+    return f"{os.path.splitext(output_path)[0]}.png"
+
+def thumbnail_path(output_path: str) -> str:
+    """
+    Grafiğin küçük resminin yolunu döndürür.
+    
+    Küçük resimler Raporlar altındaki klasör yapısını thumbnail_folder altında tekrarlar.
+    
+    Args:
+        output_path: Grafik dosyasının yolu
+    
+    Returns:
+        str: Küçük resmin (PNG) yolu
+    """
+    relative = os.path.relpath(output_path, "Raporlar")
+    return os.path.join(VISUALIZATION_SETTINGS["thumbnail_folder"], f"{os.path.splitext(relative)[0]}.png")
+
+def default_workers() -> int:
+    """
+    Varsayılan süreç sayısını (işlemci çekirdeği sayısı) döndürür.
+    """
+    return os.cpu_count() or 1
+
+def _init_worker() -> None:
+    """
+    Havuz süreçlerinde ekransız (Agg) matplotlib arka ucunu seçer.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+def capture_page(page: Any) -> None:
+    """
+    Şekli veya görseli dosyaya yazmak yerine çalışan işin sonucuna sayfa olarak ekler.
+    
+    Sayfa hemen serileştirilir; şablon şekiller sonraki grafikte yeniden
+    kullanılabilir ve sayfa süreç havuzundan ana sürece aktarılabilir.
+    
+    Args:
+        page: matplotlib şekli veya PIL görseli
+    """
+    _captured_pages.append(pickle.dumps(page, protocol=pickle.HIGHEST_PROTOCOL))
+
+def _execute_job(job: RenderJob) -> RenderResult:
+    """
+    İşi çalıştırır; hata olursa yükseltmek yerine sonuca yazar.
+    """
+    start = time.perf_counter()
+    _captured_pages.clear()
+    try:
+        job.func(**job.kwargs)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    pages = tuple(_captured_pages)
+    _captured_pages.clear()
+    return RenderResult(job.output_path, time.perf_counter() - start, error, pages=pages)
+
+def _hash_value(digest: "hashlib._Hash", value: Any) -> None:
+    """
+    Bir iş parametresini parmak izine ekler.
+    
+    DataFrame ve Series değerleri içerikleriyle (indeks, sütunlar ve tipler dahil),
+    liste, demet ve sözlükler elemanlarıyla, diğer değerler repr ile eklenir.
+    """
+    if isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[{len(value)}]".encode())
+        for item in value:
+            _hash_value(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict[{len(value)}]".encode())
+        for key, item in value.items():
+            digest.update(repr(key).encode())
+            _hash_value(digest, item)
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode())
+            digest.update(repr(value.dtypes.astype(str).tolist()).encode())
+        else:
+            digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+def job_fingerprint(job: RenderJob) -> str:
+    """
+    Grafiğin veri dilimi, parametreleri ve çıktı ayarlarından parmak izi üretir.
+    
+    Args:
+        job: Grafik işi
+    
+    Returns:
+        str: SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{RENDER_CACHE_VERSION}|{job.func.__module__}.{job.func.__qualname__}|"
+                  f"{job.output_path}|dpi={VISUALIZATION_SETTINGS['dpi']}".encode())
+    for key in sorted(job.kwargs):
+        digest.update(f"|{key}=".encode())
+        _hash_value(digest, job.kwargs[key])
+    return digest.hexdigest()
+
+def is_cacheable(job: RenderJob) -> bool:
+    """
+    İşin çıktısının önbellekten kullanılıp kullanılamayacağını döndürür.
+    
+    Gösterilen, kaydedilmeyen veya sayfa olarak yakalanan grafikler her zaman çizilir.
+    """
+    profile = job.kwargs.get("profile") or {}
+    return (job.kwargs.get("save", True) and not job.kwargs.get("show", False)
+            and not profile.get("capture"))
+
+def job_outputs(job: RenderJob) -> List[str]:
+    """
+    İşin yazdığı tüm dosyaları döndürür.
+    
+    Args:
+        job: Grafik işi
+    
+    Returns:
+        List[str]: output_path ve outputs (tekrarsız)
+    """
+    return list(dict.fromkeys((job.output_path,) + tuple(job.outputs)))
+
+def outputs_exist(job: RenderJob) -> bool:
+    """
+    İşin yazdığı dosyaların hepsinin mevcut olup olmadığını döndürür.
+    """
+    return all(os.path.exists(path) for path in job_outputs(job))
+
+def load_render_manifest(manifest_path: str) -> Dict[str, str]:
+    """
+    Grafik manifestini yükler.
+    
+    Args:
+        manifest_path: Manifest dosyasının yolu
+    
+    Returns:
+        Dict[str, str]: Çıktı yolu -> parmak izi (dosya yoksa veya okunamazsa boş)
+    """
+    if not os.path.exists(manifest_path):
+        return {}
+    
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Grafik manifesti okunamadı, tüm grafikler yeniden çizilecek: {str(e)}")
+        return {}
+
+def save_render_manifest(manifest_path: str, manifest: Dict[str, str]) -> None:
+    """
+    Grafik manifestini geçici dosya üzerinden atomik olarak kaydeder.
+    
+    Args:
+        manifest_path: Manifest dosyasının yolu
+        manifest: Çıktı yolu -> parmak izi
+    """
+    directory = os.path.dirname(manifest_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    temp_path = f"{manifest_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+def run_render_jobs(
+    jobs: List[RenderJob],
+    workers: Optional[int] = None,
+    manifest_path: Optional[str] = None,
+    on_result: Optional[Callable[[int, RenderResult], None]] = None
+) -> List[RenderResult]:
+    """
+    Grafik işlerini çalıştırır ve süre/hata özetini loglar.
+    
+    workers 1 ise işler bu süreçte sırayla çalışır (grafik gösterimi gerektiğinde
+    bu mod kullanılmalıdır). Aksi halde işler Agg arka uçlu bir süreç havuzuna
+    dağıtılır. Başarısız işler diğerlerini durdurmaz.
+    
+    manifest_path verilirse her işin parmak izi manifestteki kayıtla karşılaştırılır;
+    tüm çıktı dosyaları mevcut ve parmak izi aynı olan işler çalıştırılmaz. Başarılı işlerin
+    parmak izleri manifeste yazılır.
+    
+    on_result verilirse çalıştırılan her işin sonucuyla iş sırasında, sonuç hazır
+    olur olmaz çağrılır (ör. PDF raporuna sayfa yazmak için). Yakalanan sayfalar
+    çağrıdan sonra sonuçtan çıkarılır; havuza aynı anda en fazla
+    workers * MAX_PENDING_JOBS_PER_WORKER iş gönderildiğinden sıradaki işi bekleyen
+    tamamlanmış sonuçlar da bellekte birikmez.
+    
+    Args:
+        jobs: Çalıştırılacak işler
+        workers: Süreç sayısı (None ise işlemci çekirdeği sayısı)
+        manifest_path: Grafik manifesti (None ise önbellek kullanılmaz)
+        on_result: (iş indeksi, sonuç) ile çağrılacak fonksiyon
+    
+    Returns:
+        List[RenderResult]: İşlerle aynı sırada sonuçlar
+    """
+    if not jobs:
+        return []
+    
+    start = time.perf_counter()
+    
+    # Verisi ve parametreleri değişmemiş grafikleri ayıkla
+    results: List[Optional[RenderResult]] = [None] * len(jobs)
+    fingerprints: Dict[int, str] = {}
+    manifest = load_render_manifest(manifest_path) if manifest_path else {}
+    if manifest_path:
+        for i, job in enumerate(jobs):
+            if not is_cacheable(job):
+                continue
+            fingerprints[i] = job_fingerprint(job)
+            if manifest.get(job.output_path) == fingerprints[i] and outputs_exist(job):
+                results[i] = RenderResult(job.output_path, 0.0, None, cached=True)
+    
+    pending = [i for i, result in enumerate(results) if result is None]
+    cached_count = len(jobs) - len(pending)
+    if cached_count:
+        logger.info(f"{cached_count} grafiğin verisi değişmediği için yeniden çizilmeyecek.")
+    
+    if pending:
+        workers = default_workers() if workers is None else max(1, workers)
+        workers = min(workers, len(pending))
+        logger.info(f"{len(pending)} grafik işi {workers} süreçle çalıştırılıyor...")
+        
+        def deliver(i: int, result: RenderResult) -> None:
+            if on_result is not None:
+                on_result(i, result)
+            results[i] = result._replace(pages=())
+        
+        if workers == 1:
+            for i in pending:
+                deliver(i, _execute_job(jobs[i]))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                queue = iter(pending)
+                futures: Dict[int, Future] = {}
+                
+                def submit_next() -> None:
+                    i = next(queue, None)
+                    if i is not None:
+                        futures[i] = executor.submit(_execute_job, jobs[i])
+                
+                for _ in range(workers * MAX_PENDING_JOBS_PER_WORKER):
+                    submit_next()
+                
+                for i in pending:
+                    # Teslim edilen işin Future nesnesi (ve sayfaları) bırakılır
+                    future = futures.pop(i)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # İş havuza aktarılamadıysa veya süreç çöktüyse
+                        result = RenderResult(jobs[i].output_path, 0.0, f"{type(e).__name__}: {e}")
+                    del future
+                    submit_next()
+                    deliver(i, result)
+        
+        for i in pending:
+            result = results[i]
+            if result.error:
+                logger.error(f"Grafik oluşturulamadı: {result.output_path} ({result.error})")
+            else:
+                logger.info(f"Grafik süresi: {result.output_path} - {result.seconds:.2f} saniye")
+    
+    # Manifesti güncelle: başarısız veya artık önbelleklenemeyen grafiklerin kaydı silinir
+    if manifest_path:
+        for i in pending:
+            output_path = results[i].output_path
+            if i in fingerprints and not results[i].error and outputs_exist(jobs[i]):
+                manifest[output_path] = fingerprints[i]
+            else:
+                manifest.pop(output_path, None)
+        save_render_manifest(manifest_path, manifest)
+    
+    elapsed = time.perf_counter() - start
+    failures = sum(1 for result in results if result.error)
+    job_total = sum(result.seconds for result in results)
+    logger.info(f"{len(jobs)} grafik işi {elapsed:.2f} saniyede tamamlandı "
+                f"(toplam iş süresi: {job_total:.2f} saniye, önbellekten: {cached_count}, başarısız: {failures}).")
+    return results
@@ -0,0 +1,92 @@
+"""
+Duruş adlarını config/settings.py'deki STOP_CATEGORIES tanımına göre normalleştiren fonksiyonlar.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Optional
+import logging
+
+# Konfigürasyon dosyasını içe aktar
+from config.settings import STOP_CATEGORIES, STOP_CATEGORY_LABELS, STOP_CATEGORY_MERGE_KEYWORDS
+
+# Loglama yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("stop_categories.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Normalleştirilmiş duruş adının tutulduğu sütun
+STOP_CATEGORY_COLUMN = "Duruş Kategorisi"
+
+def normalize_stop_name(name: str) -> str:
+    """
+    Tek bir duruş adını kategori etiketine dönüştürür.
+    
+    Ad, etiketi tanımlı kategorilerden birinin anahtar kelimesini (büyük/küçük harf
+    duyarsız) içeriyorsa kategori etiketi, aksi halde adın kendisi döndürülür.
+    Kategoriler STOP_CATEGORIES'teki sırayla denenir; STOP_CATEGORY_MERGE_KEYWORDS'te
+    tanımlı kategoriler için oradaki anahtar kelimeler kullanılır (ör. "AYAR" satırında
+    yalnızca SMED duruşları toplanır).
+    
+    Args:
+        name: Duruş adı
+    
+    Returns:
+        str: Kategori etiketi veya duruş adı
+    """
+    folded = str(name).casefold()
+    for category, keywords in STOP_CATEGORIES.items():
+        label = STOP_CATEGORY_LABELS.get(category)
+        keywords = STOP_CATEGORY_MERGE_KEYWORDS.get(category, keywords)
+        if label and any(keyword.casefold() in folded for keyword in keywords):
+            return label
+    return name
+
+def build_stop_category_table(names: Iterable[str]) -> Dict[str, str]:
+    """
+    Eşsiz duruş adları için normalleştirme tablosunu oluşturur.
+    
+    Args:
+        names: Duruş adları (tekrar edebilir)
+    
+    Returns:
+        Dict[str, str]: Duruş adı -> kategori etiketi
+    """
+    table = {name: normalize_stop_name(name) for name in set(names) if pd.notna(name)}
+    merged = sum(1 for name, label in table.items() if name != label)
+    logger.info(f"Duruş kategori tablosu oluşturuldu: {len(table)} duruş adı, {merged} ad birleştirildi.")
+    return table
+
+def assign_stop_category(stop_names: pd.Series, table: Optional[Dict[str, str]] = None) -> pd.Series:
+    """
+    Duruş adı sütunundan kategorik duruş kategorisi sütunu üretir.
+    
+    Normalleştirme her farklı duruş adı için bir kez yapılır. Kategorik sütunlarda
+    yalnızca kategoriler eşlenir ve sonuç satırlara kodlar üzerinden dağıtılır;
+    diğer sütunlarda eşsiz adlardan oluşturulan tablo satırlara uygulanır.
+    
+    Args:
+        stop_names: Duruş adı sütunu
+        table: Hazır normalleştirme tablosu (None ise sütundaki adlardan oluşturulur)
+    
+    Returns:
+        pd.Series: Kategorik "Duruş Kategorisi" sütunu
+    """
+    if isinstance(stop_names.dtype, pd.CategoricalDtype):
+        table = table or build_stop_category_table(stop_names.cat.categories)
+        # Son eleman, eksik değerlerin kodu olan -1 ile seçilir
+        label_by_code = np.array(
+            [table.get(name, name) for name in stop_names.cat.categories] + [np.nan],
+            dtype=object
+        )
+        return pd.Series(label_by_code[stop_names.cat.codes], index=stop_names.index,
+                         name=STOP_CATEGORY_COLUMN, dtype="category")
+    
+    table = table or build_stop_category_table(stop_names.dropna().unique())
+    return stop_names.map(table).astype("category").rename(STOP_CATEGORY_COLUMN)
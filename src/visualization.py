@@ -3,14 +3,32 @@ Tezgah duruş analizleri için görselleştirme fonksiyonları.
 """
 
 import os
+import threading
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 import seaborn as sns
 from PIL import Image, ImageDraw, ImageFont
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Any, Dict, Iterable, List, Tuple, Optional, Union
 import logging
 
+# OEE tablosu hesaplamasını ve bölümleme yardımcısını içe aktar
+from src.calculations import calculate_oee_table, second_to_minute
+from src.data_processing import partition_frame
+from src.rendering import (
+    RenderJob, run_render_jobs, get_output_profile, profile_output_path, image_output_path, thumbnail_path,
+    capture_page
+)
+
+# Konfigürasyon dosyasını içe aktar
+from config.settings import VISUALIZATION_SETTINGS
+
 # Loglama yapılandırması
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +40,131 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Grafik türü başına yeniden kullanılan şekil şablonları (iş parçacığı başına ayrı)
+_figure_templates = threading.local()
+
+# Izgara grafiklerinde "Diğer" diliminin rengi
+OTHER_COLOR = (0.8, 0.8, 0.8)
+
+# Şablon şekillerin her grafikten önce döndürüldüğü kenar boşlukları (subplots_adjust)
+SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+def _reset_figure(fig: Figure) -> None:
+    """
+    Şablon şeklin eksen dışındaki durumunu yeni bir şekildeki haline döndürür.
+    
+    ax.clear() yalnızca ekseni temizler; şekle eklenen açıklamalar (fig.legend),
+    metinler (suptitle dahil) ve subplots_adjust/tight_layout ile değişen kenar
+    boşlukları sonraki grafiğe taşınmamalıdır.
+    
+    Args:
+        fig: Şablon şekil
+    """
+    for artist in list(fig.legends) + list(fig.texts):
+        artist.remove()
+    fig.subplots_adjust(**{name: mpl.rcParams[f"figure.subplot.{name}"] for name in SUBPLOT_PARAMS})
+
+def chart_figure(kind: str, figsize: Tuple[float, float], show: bool = False) -> Tuple[Figure, Axes]:
+    """
+    Grafik türü için çizime hazır şekil ve eksen döndürür.
+    
+    Kaydedilecek grafikler için her tür ve boyut için bir kez oluşturulan, pyplot
+    durumuna bağlı olmayan Agg şekli yeniden kullanılır; ekseni temizlenir ve
+    şekil düzeyindeki durum sıfırlanır. Gösterilecek grafikler pyplot üzerinden
+    oluşturulur.
+    
+    Args:
+        kind: Grafik türü (şablon anahtarı)
+        figsize: Şekil boyutu (inç)
+        show: Grafik gösterilecekse True
+        
+    Returns:
+        Tuple[Figure, Axes]: Şekil ve eksen
+    """
+    if show:
+        fig = plt.figure(figsize=figsize)
+        return fig, fig.add_subplot()
+    
+    templates = getattr(_figure_templates, "figures", None)
+    if templates is None:
+        templates = _figure_templates.figures = {}
+    
+    key = (kind, tuple(figsize))
+    fig = templates.get(key)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        templates[key] = fig
+        return fig, fig.add_subplot()
+    
+    # finish_chart'a ulaşmadan hata veren grafiğin bıraktığı durum da temizlenir
+    _reset_figure(fig)
+    ax = fig.axes[0]
+    ax.clear()
+    return fig, ax
+
+def save_figure(fig: Figure, output_path: str, profile: Dict[str, Any]) -> str:
+    """
+    Şekli çıktı profilinin biçimi ve çözünürlüğüyle kaydeder.
+    
+    Profil istiyorsa grafiğin küçük resmi de (PNG) thumbnail_folder altına kaydedilir.
+    Sayfa yakalayan (capture) profillerde şekil dosyaya yazılmaz, PDF raporu için
+    işin sonucuna eklenir.
+    
+    Args:
+        fig: Kaydedilecek şekil
+        output_path: Grafik dosyasının yolu (uzantısı profile göre değiştirilir)
+        profile: Çıktı profili
+        
+    Returns:
+        str: Kaydedilen dosyanın yolu
+    """
+    output_path = profile_output_path(output_path, profile)
+    if profile.get("capture"):
+        capture_page(fig)
+        return output_path
+    
+    save_kwargs = dict(dpi=profile["dpi"], format=profile["format"], bbox_inches='tight')
+    if profile.get("pil_kwargs"):
+        save_kwargs["pil_kwargs"] = profile["pil_kwargs"]
+    fig.savefig(output_path, **save_kwargs)
+    
+    if profile.get("thumbnail"):
+        thumb_path = thumbnail_path(output_path)
+        ensure_dir(os.path.dirname(thumb_path))
+        fig.savefig(thumb_path, dpi=VISUALIZATION_SETTINGS["thumbnail_dpi"], format="png",
+                    bbox_inches='tight', pil_kwargs={"compress_level": 1})
+    
+    return output_path
+
+def finish_chart(
+    fig: Figure,
+    output_path: str,
+    save: bool = True,
+    show: bool = False,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Grafiği kaydeder ve gösterir; şablon şekiller şekil düzeyindeki durumları
+    sıfırlanarak sonraki grafik için açık kalır.
+    
+    Args:
+        fig: chart_figure ile alınan şekil
+        output_path: Grafik dosyasının yolu
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise varsayılan profil)
+    """
+    if save:
+        output_path = save_figure(fig, output_path, profile or get_output_profile(None))
+        logger.info(f"Grafik kaydedildi: {output_path}")
+    
+    if show:
+        plt.show()
+        plt.close(fig)
+    else:
+        _reset_figure(fig)
+
 def ensure_dir(directory: str) -> None:
     """
     Belirtilen dizinin var olduğundan emin olur, yoksa oluşturur.
@@ -30,9 +173,54 @@ def ensure_dir(directory: str) -> None:
         directory: Oluşturulacak dizin yolu
     """
     if not os.path.exists(directory):
-        os.makedirs(directory)
+        # Paralel grafik süreçleri aynı dizini aynı anda oluşturabilir
+        os.makedirs(directory, exist_ok=True)
         logger.info(f"Dizin oluşturuldu: {directory}")
 
+def pie_output_path(
+    baslik: str,
+    custom_folder: Optional[str] = None,
+    profile: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    visualize_pie grafiğinin kaydedileceği dosya yolunu döndürür.
+    
+    Args:
+        baslik: Grafik başlığı
+        custom_folder: Özel klasör yolu
+        profile: Çıktı profili (verilirse uzantı profilin biçimine göre belirlenir)
+        
+    Returns:
+        str: Grafik dosyasının yolu
+    """
+    if custom_folder is not None:
+        # Özel klasör yolu belirtilmişse onu kullan
+        folder_path = custom_folder
+    elif "KISIM" in baslik:
+        folder_path = 'Raporlar/Kısımlar/Son Hafta'
+    else:
+        folder_path = 'Raporlar/Genel'
+    output_path = os.path.join(folder_path, f"{baslik}.png")
+    return profile_output_path(output_path, profile) if profile else output_path
+
+def bar_output_path(baslik: str, profile: Optional[Dict[str, Any]] = None) -> str:
+    """
+    visualize_bar grafiğinin kaydedileceği dosya yolunu döndürür.
+    
+    Args:
+        baslik: Grafik başlığı
+        profile: Çıktı profili (verilirse uzantı profilin biçimine göre belirlenir)
+        
+    Returns:
+        str: Grafik dosyasının yolu
+    """
+    if " (Tezgah Başına)" in baslik:
+        folder_path = 'Raporlar/Kısımlar/Son Hafta Tezgah Başına Ortalama'
+    else:
+        folder_path = 'Raporlar/Genel'
+    output_path = os.path.join(folder_path, f"{baslik}.png")
+    return profile_output_path(output_path, profile) if profile else output_path
+
 def visualize_pie(
     data: pd.DataFrame, 
     threshold: float = 3.0,
@@ -40,7 +228,8 @@ def visualize_pie(
     save: bool = True, 
     show: bool = True,
     category_column: str = None,
-    custom_folder: str = None  # Yeni parametre: Özel klasör yolu
+    custom_folder: str = None,  # Yeni parametre: Özel klasör yolu
+    profile: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Duruş sürelerini pasta grafik olarak görselleştirir.
@@ -53,17 +242,14 @@ def visualize_pie(
         show: Grafiği gösterme bayrağı
         category_column: Kategori sütunu adı (None ise otomatik tespit edilir)
         custom_folder: Özel klasör yolu (None değilse, varsayılan klasör seçimi yerine bu kullanılır)
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
     """
     logger.info(f"Pasta grafik oluşturuluyor: {baslik}")
     
     # Klasör yolunu belirleme
-    if custom_folder is not None:
-        # Özel klasör yolu belirtilmişse onu kullan
-        folder_path = custom_folder
-    elif "KISIM" in baslik:
-        folder_path = 'Raporlar/Kısımlar/Son Hafta'
-    else:
-        folder_path = 'Raporlar/Genel'
+    profile = profile or get_output_profile("pie")
+    output_path = pie_output_path(baslik, custom_folder, profile)
+    folder_path = os.path.dirname(output_path)
     
     # Klasör oluşturma
     ensure_dir(folder_path)
@@ -117,7 +303,7 @@ def visualize_pie(
     diger_df = diger_df.sort_values("Yüzde", ascending=False)
     
     # Pasta grafik oluşturma
-    plt.figure(figsize=(12, 12))
+    fig, ax = chart_figure("pie", (12, 12), show)
     
     # Renk paleti
     colors = sns.color_palette("Pastel2", len(diger_df))
@@ -133,7 +319,7 @@ def visualize_pie(
             explode[i] = 0.02
     
     # Pasta grafiği
-    wedges, texts, autotexts = plt.pie(
+    wedges, texts, autotexts = ax.pie(
         diger_df["Süre (Dakika)"],
         labels=None,  # Etiketleri kaldırıyoruz, ayrı ekleyeceğiz
         autopct='%1.1f%%',  # Yüzde gösterimi
@@ -172,7 +358,7 @@ def visualize_pie(
             ha = "left"
         
         # Etiketi çiz
-        plt.annotate(
+        ax.annotate(
             etiket,
             xy=(x*0.8, y*0.8),  # Ok başlangıcı
             xytext=(x, y),  # Metin konumu
@@ -184,33 +370,197 @@ def visualize_pie(
         )
     
     # Başlık ve eksen ayarları
-    plt.title(f"{baslik}", fontsize=14, pad=15)
-    plt.axis('equal')
+    ax.set_title(f"{baslik}", fontsize=14, pad=15)
+    ax.axis('equal')
     
-    # Grafiği kaydet
-    if save:
-        plt.savefig(os.path.join(folder_path, f"{baslik}.png"), dpi=300, bbox_inches='tight')
-        logger.info(f"Grafik kaydedildi: {os.path.join(folder_path, f'{baslik}.png')}")
+    # Grafiği kaydet ve göster
+    finish_chart(fig, output_path, save, show, profile)
+
+def machine_pie_jobs(
+    df: pd.DataFrame,
+    folder_path: str,
+    threshold: float = 3,
+    save: bool = True,
+    show: bool = False,
+    profile: Optional[Dict[str, Any]] = None
+) -> List[RenderJob]:
+    """
+    Her tezgah için duruş nedenleri pasta grafiği işlerini oluşturur.
     
-    # Grafiği göster
-    if show:
-        plt.show()
+    Args:
+        df: Son hafta verisi veya duruş küpü dilimi
+        folder_path: Grafiklerin kaydedileceği klasör
+        threshold: Eşik değeri, bu değerden düşük yüzdeli duruşlar "Diğer" olarak gruplandırılır
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+        
+    Returns:
+        List[RenderJob]: Grafik işleri
+    """
+    ensure_dir(folder_path)
+    profile = profile or get_output_profile("pie")
     
-    # Grafiği kapat
-    plt.close()
+    # Tezgah verilerini tek geçişte bölümle
+    jobs = []
+    for machine_code, machine_data in partition_frame(df, "İş Merkezi Kodu ").items():
+        # ÇALIŞMA SÜRESİ dışındaki duruşları filtrele
+        machine_data = machine_data[machine_data["Duruş Adı"] != "ÇALIŞMA SÜRESİ"]
+        
+        # Toplam süresi olmayan tezgahlar için grafik oluşturma
+        if machine_data["Süre (Dakika)"].sum() <= 0:
+            continue
+        
+        # Duruş adlarına göre grupla ve süreleri topla
+        machine_stop_summary = machine_data.groupby("Duruş Adı", observed=True)["Süre (Dakika)"].sum().reset_index()
+        
+        baslik = f"{machine_code} Duruş Nedenleri"
+        jobs.append(RenderJob(
+            visualize_pie,
+            dict(
+                data=machine_stop_summary,
+                threshold=threshold,  # Eşikten küçük olanlar "Diğer" kategorisinde toplanır
+                baslik=baslik,
+                save=save,
+                show=show,
+                category_column="Duruş Adı",
+                custom_folder=folder_path,
+                profile=profile
+            ),
+            pie_output_path(baslik, folder_path, profile)
+        ))
+    
+    return jobs
 
-def visualize_weekly_comparison(
+def weekly_comparison_pivot(
+    df: pd.DataFrame,
+    gozlem: str,
+    weeks: List[int],
+    sort_week: Optional[int] = None,
+    sort_by_last_week: bool = True
+) -> Dict[Any, pd.DataFrame]:
+    """
+    4 haftalık karşılaştırma grafikleri için tüm kısım veya tezgahların süre tablosunu
+    tek gruplamayla oluşturur.
+    
+    Her kısım veya tezgah için satırları duruş adları (grafikteki sırayla), sütunları
+    haftalar olan bir tablo döndürülür; verisi olmayan hafta ve duruşlar 0'dır.
+    Duruşlar sort_week haftasındaki süreye göre azalan, o haftada olmayanlar verideki
+    sıralarıyla dizilir.
+    
+    Args:
+        df: Görselleştirilecek DataFrame
+        gozlem: Gruplandırma için kullanılacak sütun adı (KISIM veya İş Merkezi Kodu)
+        weeks: Tüm veri setindeki hafta numaraları (küçükten büyüğe)
+        sort_week: Sıralama için kullanılacak hafta numarası
+        sort_by_last_week: Son haftaya göre sıralama bayrağı
+    
+    Returns:
+        Dict[Any, pd.DataFrame]: Kısım veya tezgah -> duruş x hafta süre tablosu (dakika)
+    """
+    rows = df[[gozlem, 'Duruş Adı', 'Hafta', 'Süre (Dakika)']]
+    
+    # Tek gruplama: kısım/tezgah, duruş ve hafta başına süre (ilk kayıt)
+    pivot = (
+        rows.groupby([gozlem, 'Duruş Adı', 'Hafta'], observed=True, dropna=False, sort=False)['Süre (Dakika)']
+        .first()
+        .unstack('Hafta')
+        .reindex(columns=weeks)
+        .fillna(0)
+    )
+    
+    tables = {}
+    for gozlemlenen, data in rows.groupby(gozlem, observed=True):
+        # Duruşların verideki sırası
+        stops = list(pd.unique(data['Duruş Adı']))
+        
+        # Eğer belirli bir haftaya göre sıralama isteniyorsa hedef haftanın sürelerine göre sırala
+        if sort_by_last_week and sort_week:
+            sort_week_data = data[data['Hafta'] == sort_week]
+            if not sort_week_data.empty:
+                sorted_stops = list(sort_week_data.sort_values('Süre (Dakika)', ascending=False)['Duruş Adı'].unique())
+                stops = sorted_stops + [stop for stop in stops if stop not in sorted_stops]
+        
+        table = pivot.loc[gozlemlenen].reindex(stops).fillna(0)
+        table.columns.name = 'Hafta'
+        tables[gozlemlenen] = table
+    
+    return tables
+
+def plot_weekly_comparison_chart(
+    table: pd.DataFrame,
+    gozlemlenen: str,
+    folder_path: str,
+    egiklik: int = 75,
+    palet: str = "tab20",
+    save: bool = True,
+    show: bool = True,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Tek bir kısım veya tezgah için 4 haftalık duruş karşılaştırma grafiğini çizer.
+    
+    Args:
+        table: weekly_comparison_pivot tablosu (duruş x hafta, dakika)
+        gozlemlenen: Kısım veya tezgah adı
+        folder_path: Grafiğin kaydedileceği klasör
+        egiklik: Etiket metin açısı
+        palet: Renk paleti
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+    """
+    fig, ax = chart_figure("weekly_comparison", (14, 8), show)
+    
+    categories = list(table.index)
+    heights = table.to_numpy(dtype=float)
+    weeks = list(table.columns)
+    
+    # X ekseni etiketleri ve pozisyonları
+    x_positions = np.arange(len(categories))
+    
+    # Haftalara göre renk ata
+    colors = sns.color_palette(palet, len(weeks))
+    
+    # Her hafta için ayrı çubuk çiz
+    bar_width = 0.8 / len(weeks)  # Çubuk genişliği
+    
+    # Hafta başına çubuklar (haftalar küçükten büyüğe) ve değer etiketleri
+    for i, week in enumerate(weeks):
+        x_pos = x_positions - 0.4 + (i + 0.5) * bar_width
+        bars = ax.bar(x_pos, heights[:, i], width=bar_width, 
+                      color=colors[i], label=f'Hafta {week}')
+        ax.bar_label(bars, labels=[f'{height:.0f}' if height > 0 else '' for height in heights[:, i]],
+                     padding=2, fontsize=9, rotation=egiklik)
+    
+    # X ekseni etiketlerini ayarla
+    ax.set_xticks(x_positions, categories, rotation=45, ha='right')
+    
+    # Başlık ve açıklamalar
+    ax.set_title(f'{gozlemlenen} - 4 Haftalık En Büyük 10 Duruş Karşılaştırması')
+    ax.set_xlabel('Duruş Adı')
+    ax.set_ylabel('Süre (Dakika)')
+    ax.legend(title='Hafta')
+    
+    # Alt boşluğu artır
+    fig.subplots_adjust(bottom=0.3)
+    
+    finish_chart(fig, os.path.join(folder_path, f"{gozlemlenen} - 4 HAFTALIK.png"), save, show,
+                 profile or get_output_profile("weekly_comparison"))
+
+def weekly_comparison_jobs(
     df: pd.DataFrame, 
     gozlem: str = "KISIM", 
     egiklik: int = 75, 
     palet: str = "tab20",
     save: bool = True,
-    show: bool = True,
+    show: bool = False,
     sort_by_last_week: bool = True,
-    target_week: int = 9  # Hedef hafta parametresi ekledik
-) -> None:
+    target_week: int = 9,
+    profile: Optional[Dict[str, Any]] = None
+) -> List[RenderJob]:
     """
-    4 haftalık duruş karşılaştırmasını görselleştirir.
+    Her kısım veya tezgah için 4 haftalık karşılaştırma grafiği işlerini oluşturur.
     
     Args:
         df: Görselleştirilecek DataFrame
@@ -221,9 +571,11 @@ def visualize_weekly_comparison(
         show: Grafiği gösterme bayrağı
         sort_by_last_week: Son haftaya göre sıralama bayrağı
         target_week: Sıralama için kullanılacak hafta numarası (varsayılan: 9)
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+        
+    Returns:
+        List[RenderJob]: Grafik işleri
     """
-    logger.info(f"{gozlem} için 4 haftalık karşılaştırma grafikleri oluşturuluyor...")
-    
     if gozlem == "KISIM":
         # Klasör yolunu tanımlama
         folder_path = 'Raporlar/Kısımlar/4 haftalık'  # Klasör adı
@@ -231,6 +583,7 @@ def visualize_weekly_comparison(
         folder_path = 'Raporlar/Tezgahlar/4 haftalık'
     
     ensure_dir(folder_path)
+    profile = profile or get_output_profile("weekly_comparison")
     
     # Hafta listesini al
     weeks = sorted(df["Hafta"].unique())  # Reverse kaldırıldı, 9. hafta sonda olsun
@@ -243,94 +596,57 @@ def visualize_weekly_comparison(
         # Eğer hedef hafta yoksa, mevcut haftaları kullan
         sort_week = weeks[-1] if weeks else None
     
-    # Her gözlem değeri için grafik oluştur
-    for gozlemlenen, data in df.groupby(gozlem):
-        plt.figure(figsize=(14, 8))
-        
-        # Eğer belirli bir haftaya göre sıralama isteniyorsa
-        if sort_by_last_week and sort_week:
-            # Hedef haftaya ait veriyi al
-            sort_week_data = data[data['Hafta'] == sort_week]
-            
-            # Hedef haftaya göre duruş adlarını sırala
-            if not sort_week_data.empty:
-                sorted_stops = sort_week_data.sort_values('Süre (Dakika)', ascending=False)['Duruş Adı'].unique()
-                
-                # Tüm duruş adları içinde olmayanları ekle
-                all_stops = data['Duruş Adı'].unique()
-                for stop in all_stops:
-                    if stop not in sorted_stops:
-                        sorted_stops = np.append(sorted_stops, stop)
-                
-                # Kategorik ekseni oluştur
-                data = data.copy()  # Yeni bir kopya oluştur
-                data['Duruş Adı'] = pd.Categorical(data['Duruş Adı'], categories=sorted_stops, ordered=True)
-                
-                # Sıralı veriyi kullanarak grafik oluştur
-                data = data.sort_values('Duruş Adı')
-        
-        # Kategorik değişken olarak X ekseni için indeks oluştur
-        category_data = data.copy()
-        categories = category_data['Duruş Adı'].unique()
-        
-        # X ekseni etiketleri ve pozisyonları
-        x_positions = np.arange(len(categories))
-        
-        # Haftalara göre renk ata
-        colors = sns.color_palette(palet, len(weeks))
-        
-        # Her hafta için ayrı çubuk çiz
-        bar_width = 0.8 / len(weeks)  # Çubuk genişliği
-        
-        # Hafta başına çubuklar - Hafta sıralamasını değiştirdik
-        for i, week in enumerate(sorted(weeks)):  # Haftaları küçükten büyüğe sırala
-            week_data = category_data[category_data['Hafta'] == week]
-            
-            # Her kategori için değer bul
-            heights = []
-            for cat in categories:
-                cat_data = week_data[week_data['Duruş Adı'] == cat]
-                if not cat_data.empty:
-                    heights.append(cat_data['Süre (Dakika)'].iloc[0])
-                else:
-                    heights.append(0)
-            
-            # Çubukları çiz
-            x_pos = x_positions - 0.4 + (i + 0.5) * bar_width
-            bars = plt.bar(x_pos, heights, width=bar_width, 
-                         color=colors[i], label=f'Hafta {week}')
-            
-            # Değerleri çubukların üzerine ekle
-            for j, height in enumerate(heights):
-                if height > 0:
-                    plt.text(x_pos[j], height + 5, f'{height:.0f}', 
-                           ha='center', va='bottom', 
-                           fontsize=9, rotation=egiklik)
-        
-        # X ekseni etiketlerini ayarla
-        plt.xticks(x_positions, categories, rotation=45, ha='right')
-        
-        # Başlık ve açıklamalar
-        plt.title(f'{gozlemlenen} - 4 Haftalık En Büyük 10 Duruş Karşılaştırması')
-        plt.xlabel('Duruş Adı')
-        plt.ylabel('Süre (Dakika)')
-        plt.legend(title='Hafta')
-        
-        # Alt boşluğu artır
-        plt.subplots_adjust(bottom=0.3)
-        
-        if save:
-            plt.savefig(os.path.join(folder_path, f"{gozlemlenen} - 4 HAFTALIK.png"), dpi=300, bbox_inches='tight')
-            logger.info(f"Grafik kaydedildi: {os.path.join(folder_path, f'{gozlemlenen} - 4 HAFTALIK.png')}")
-        
-        if show:
-            plt.show()
-        
-        plt.close()
+    # Tüm gözlem değerlerinin tabloları tek gruplamayla hazırlanır; her grafik kendi tablosunu çizer
+    tables = weekly_comparison_pivot(df, gozlem, weeks, sort_week, sort_by_last_week)
+    
+    jobs = []
+    for gozlemlenen, table in tables.items():
+        jobs.append(RenderJob(
+            plot_weekly_comparison_chart,
+            dict(
+                table=table, gozlemlenen=gozlemlenen, folder_path=folder_path,
+                egiklik=egiklik, palet=palet, save=save, show=show, profile=profile
+            ),
+            profile_output_path(os.path.join(folder_path, f"{gozlemlenen} - 4 HAFTALIK.png"), profile)
+        ))
+    
+    return jobs
+
+def visualize_weekly_comparison(
+    df: pd.DataFrame, 
+    gozlem: str = "KISIM", 
+    egiklik: int = 75, 
+    palet: str = "tab20",
+    save: bool = True,
+    show: bool = True,
+    sort_by_last_week: bool = True,
+    target_week: int = 9,  # Hedef hafta parametresi ekledik
+    workers: Optional[int] = 1,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    4 haftalık duruş karşılaştırmasını görselleştirir.
+    
+    Args:
+        df: Görselleştirilecek DataFrame
+        gozlem: Gruplandırma için kullanılacak sütun adı (KISIM veya İş Merkezi Kodu)
+        egiklik: Etiket metin açısı
+        palet: Renk paleti
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        sort_by_last_week: Son haftaya göre sıralama bayrağı
+        target_week: Sıralama için kullanılacak hafta numarası (varsayılan: 9)
+        workers: Grafik süreç sayısı (gösterim açıksa grafikler sırayla çizilir)
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+    """
+    logger.info(f"{gozlem} için 4 haftalık karşılaştırma grafikleri oluşturuluyor...")
+    
+    jobs = weekly_comparison_jobs(df, gozlem, egiklik, palet, save, show, sort_by_last_week, target_week,
+                                  profile)
+    run_render_jobs(jobs, workers=1 if show else workers)
     
     logger.info(f"{gozlem} için 4 haftalık karşılaştırma grafikleri oluşturuldu.")
 
-    
 def visualize_bar(
     data: pd.DataFrame, 
     colors: str = "Accent", 
@@ -339,7 +655,8 @@ def visualize_bar(
     text: int = 1, 
     baslik: str = "Tüm İş Merkezleri",
     save: bool = True,
-    show: bool = True
+    show: bool = True,
+    profile: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Duruş sürelerini çubuk grafik olarak görselleştirir.
@@ -353,21 +670,17 @@ def visualize_bar(
         baslik: Grafik başlığı
         save: Grafiği kaydetme bayrağı
         show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
     """
     logger.info(f"Çubuk grafik oluşturuluyor: {baslik}")
     
     # Toplam süreyi hesapla
     total_time = data["Süre (Dakika)"].sum()
     
-    # Grafik oluşturma
-    plt.figure(figsize=(12, 8))
-
     # Klasör yolunu belirle
-    if " (Tezgah Başına)" in baslik:
-        folder_path = 'Raporlar/Kısımlar/Son Hafta Tezgah Başına Ortalama'
-    else:
-        folder_path = 'Raporlar/Genel'
-    ensure_dir(folder_path)
+    profile = profile or get_output_profile("bar")
+    output_path = bar_output_path(baslik, profile)
+    ensure_dir(os.path.dirname(output_path))
     
     # İndeksleri kontrol et
     if bundan is None:
@@ -389,43 +702,189 @@ def visualize_bar(
     # Yüzde hesapla
     filtered_data["Yüzde"] = (filtered_data["Süre (Dakika)"] / total_time) * 100
     
-    # X ekseni değerlerini merkeze hizala
-    plt.figure(figsize=(12, 8))
+    # Grafik oluşturma
+    fig, ax = chart_figure("bar", (12, 8), show)
     
     # Bar grafiği çizdir
-    bars = plt.bar(range(len(filtered_data)), filtered_data["Süre (Dakika)"], color=colors_palette)
+    bars = ax.bar(range(len(filtered_data)), filtered_data["Süre (Dakika)"], color=colors_palette)
     
     # X ekseni etiketlerini merkeze hizala
-    plt.xticks(range(len(filtered_data)), filtered_data["İş Merkezi Kodu "], rotation=45, ha='right')
+    ax.set_xticks(range(len(filtered_data)), filtered_data["İş Merkezi Kodu "], rotation=45, ha='right')
     
     if text:
         # Yüzdeleri her bir barın üstüne ekle
         for i, bar in enumerate(bars):
             height = bar.get_height()
             percentage = filtered_data["Yüzde"].iloc[i]  # Hesaplanmış yüzdeyi kullan
-            plt.text(
+            ax.text(
                 bar.get_x() + bar.get_width() / 2, height, 
                 f"{height} ({percentage:.1f}%)",  # Hem süre hem de yüzde gösterme
                 ha='center', va='bottom', fontsize=10, color='black', weight='bold'
             )
     
     # Grafik başlık ve eksen etiketleri
-    plt.title(f"{baslik}", fontsize=14, pad=15)
-    plt.xlabel("İş Merkezi Kodu", fontsize=12)
-    plt.ylabel("Süre (Dakika)", fontsize=12)
+    ax.set_title(f"{baslik}", fontsize=14, pad=15)
+    ax.set_xlabel("İş Merkezi Kodu", fontsize=12)
+    ax.set_ylabel("Süre (Dakika)", fontsize=12)
     
     # Boşlukları ayarla
-    plt.tight_layout()
+    fig.tight_layout()
     
-    if save:
-        plt.savefig(os.path.join(folder_path, f"{baslik}.png"), dpi=300, bbox_inches='tight')
-        logger.info(f"Grafik kaydedildi: {os.path.join(folder_path, f'{baslik}.png')}")
+    finish_chart(fig, output_path, save, show, profile)
     
-    if show:
-        plt.show()
+def plot_machine_bar(
+    machine_data: pd.DataFrame,
+    code: str,
+    folder_path: str,
+    stoppage_column: str = "Duruş Adı", 
+    duration_column: str = "Süre (Dakika)", 
+    threshold: float = 3,
+    save: bool = True,
+    show: bool = True,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Tek bir tezgahın duruş sürelerini çubuk grafik olarak çizer.
+    
+    Args:
+        machine_data: Tezgaha ait veri
+        code: Tezgah kodu
+        folder_path: Grafiğin kaydedileceği klasör
+        stoppage_column: Duruş adı sütunu adı
+        duration_column: Süre sütunu adı
+        threshold: Eşik değeri, bu değerden düşük yüzdeli duruşlar "Diğer" olarak gruplandırılır
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+    """
+    logger.info(f"Tezgah grafik oluşturuluyor: {code}")
+    
+    machine_data = machine_data.copy()
+    
+    # Toplam süreyi hesapla
+    total_duration = machine_data[duration_column].sum()
+    
+    # Eğer toplam süre 0 ise, bu makine için grafik oluşturma
+    if total_duration == 0:
+        logger.warning(f"Tezgah {code} için veri yok veya toplam süre 0.")
+        return
     
-    plt.close()
+    # Yüzdeleri hesapla
+    machine_data["Yüzde"] = (machine_data[duration_column] / total_duration) * 100
     
+    # Eşik değerinden küçük olanları "Diğer" olarak grupla
+    other_duration = machine_data[machine_data["Yüzde"] < threshold][duration_column].sum()
+    filtered_data = machine_data[machine_data["Yüzde"] >= threshold].copy()
+    
+    if other_duration > 0:
+        filtered_data = pd.concat([
+            filtered_data, 
+            pd.DataFrame({
+                stoppage_column: ["Diğer"], 
+                duration_column: [other_duration], 
+                "Yüzde": [(other_duration / total_duration) * 100]
+            })
+        ])
+    
+    # Süreye göre büyükten küçüğe sırala
+    filtered_data = filtered_data.sort_values(by=duration_column, ascending=False)
+    
+    # Grafik boyutunu artır
+    fig, ax = chart_figure("machine_bar", (14, 9), show)  # Daha geniş bir grafik
+    
+    # Renk paleti dinamik olarak oluştur
+    pastel_colors = sns.color_palette("pastel", n_colors=len(filtered_data))
+    
+    # X ekseni değerlerini hazırla
+    x_values = range(len(filtered_data))
+    
+    # Çubuk grafiğini çiz
+    bars = ax.bar(
+        x_values,
+        filtered_data[duration_column],
+        color=pastel_colors
+    )
+    
+    # X ekseni etiketlerini ayarla
+    ax.set_xticks(
+        x_values,
+        filtered_data[stoppage_column],
+        rotation=75,
+        ha='right'  # Sağa hizalama
+    )
+    
+    # Etiketleri ekle
+    for i, value in enumerate(filtered_data[duration_column]):
+        percentage = filtered_data["Yüzde"].iloc[i]
+        ax.text(
+            i, 
+            value + 5,  # Değerin biraz üzerine yerleştir
+            f'{value:.0f} dk\n({percentage:.1f}%)', 
+            ha='center',
+            fontsize=9
+        )
+    
+    # Başlık ve eksen etiketleri
+    ax.set_title(f"{code} - Duruş Süreleri", fontsize=14, pad=15)
+    ax.set_xlabel("Duruş Adı", fontsize=12)
+    ax.set_ylabel("Süre (Dakika)", fontsize=12)
+    
+    # Y ekseni üst sınırını ayarla
+    max_value = filtered_data[duration_column].max()
+    ax.set_ylim(0, max_value * 1.2)  # %20 margin ekle
+    
+    # Alt ve üst boşlukları ayarla
+    fig.subplots_adjust(bottom=0.3, top=0.9)  # Altta daha fazla boşluk bırak
+    
+    finish_chart(fig, os.path.join(folder_path, f"{code}.png"), save, show,
+                 profile or get_output_profile("machine_bar"))
+
+def plot_bar_jobs(
+    df: pd.DataFrame, 
+    machine_code_column: str = "İş Merkezi Kodu ", 
+    stoppage_column: str = "Duruş Adı", 
+    duration_column: str = "Süre (Dakika)", 
+    threshold: float = 3,
+    save: bool = True,
+    show: bool = False,
+    profile: Optional[Dict[str, Any]] = None
+) -> List[RenderJob]:
+    """
+    Her tezgah için duruş süreleri çubuk grafiği işlerini oluşturur.
+    
+    Args:
+        df: Görselleştirilecek DataFrame
+        machine_code_column: Makine kodu sütunu adı
+        stoppage_column: Duruş adı sütunu adı
+        duration_column: Süre sütunu adı
+        threshold: Eşik değeri, bu değerden düşük yüzdeli duruşlar "Diğer" olarak gruplandırılır
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+        
+    Returns:
+        List[RenderJob]: Grafik işleri
+    """
+    # Klasör yolunu tanımla
+    folder_path = 'Raporlar/Tezgahlar/Son Hafta'
+    ensure_dir(folder_path)
+    profile = profile or get_output_profile("machine_bar")
+    
+    # Makinelere ait verileri tek geçişte bölümle
+    jobs = []
+    for code, machine_data in partition_frame(df, machine_code_column).items():
+        jobs.append(RenderJob(
+            plot_machine_bar,
+            dict(
+                machine_data=machine_data, code=code, folder_path=folder_path,
+                stoppage_column=stoppage_column, duration_column=duration_column,
+                threshold=threshold, save=save, show=show, profile=profile
+            ),
+            profile_output_path(os.path.join(folder_path, f"{code}.png"), profile)
+        ))
+    
+    return jobs
+
 def plot_bar(
     df: pd.DataFrame, 
     machine_code_column: str = "İş Merkezi Kodu ", 
@@ -433,7 +892,9 @@ def plot_bar(
     duration_column: str = "Süre (Dakika)", 
     threshold: float = 3,
     save: bool = True,
-    show: bool = True
+    show: bool = True,
+    workers: Optional[int] = 1,
+    profile: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Her bir tezgah için duruş sürelerini çubuk grafik olarak görselleştirir.
@@ -446,118 +907,248 @@ def plot_bar(
         threshold: Eşik değeri, bu değerden düşük yüzdeli duruşlar "Diğer" olarak gruplandırılır
         save: Grafiği kaydetme bayrağı
         show: Grafiği gösterme bayrağı
+        workers: Grafik süreç sayısı (gösterim açıksa grafikler sırayla çizilir)
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
     """
     logger.info("Tezgah duruş grafikleri oluşturuluyor...")
     
-    # Unique makine kodlarını al
-    machine_codes = df[machine_code_column].unique()
+    jobs = plot_bar_jobs(df, machine_code_column, stoppage_column, duration_column, threshold, save, show,
+                         profile)
+    run_render_jobs(jobs, workers=1 if show else workers)
+    
+    logger.info("Tezgah duruş grafikleri oluşturuldu.")
 
-    # Klasör yolunu tanımla
-    folder_path = 'Raporlar/Tezgahlar/Son Hafta'
-    ensure_dir(folder_path)
+def stop_color_map(stop_names: Iterable[str], palette: str = "tab20") -> Dict[str, Tuple[float, float, float]]:
+    """
+    Duruş adlarına sabit renkler atar.
     
-    for code in machine_codes:
-        logger.info(f"Tezgah grafik oluşturuluyor: {code}")
-        
-        # Makineye ait verileri filtrele
-        machine_data = df[df[machine_code_column] == code].copy()
-        
-        # Toplam süreyi hesapla
-        total_duration = machine_data[duration_column].sum()
+    Adlar alfabetik sıraya göre renklendirildiğinden aynı duruş tüm panellerde
+    ve sayfalarda aynı renkle çizilir. "Diğer" her zaman gridir.
+    
+    Args:
+        stop_names: Duruş adları (tekrar edebilir)
+        palette: Renk paleti
+    
+    Returns:
+        Dict[str, Tuple[float, float, float]]: Duruş adı -> renk
+    """
+    names = sorted({str(name) for name in stop_names if pd.notna(name)} - {"Diğer"})
+    colors = dict(zip(names, sns.color_palette(palette, len(names))))
+    colors["Diğer"] = OTHER_COLOR
+    return colors
+
+def _grid_panel_summary(summary: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    """
+    Panel verisinde eşikten küçük yüzdeli duruşları "Diğer" satırında toplar.
+    
+    Args:
+        summary: "Duruş Adı" ve "Süre (Dakika)" sütunlu tezgah özeti
+        threshold: Eşik değeri (%)
+    
+    Returns:
+        pd.DataFrame: Süreye göre büyükten küçüğe sıralı panel verisi
+    """
+    total = summary["Süre (Dakika)"].sum()
+    small = summary["Süre (Dakika)"] / total * 100 < threshold
+    
+    panel = pd.DataFrame({
+        "Duruş Adı": summary.loc[~small, "Duruş Adı"].astype(str),
+        "Süre (Dakika)": summary.loc[~small, "Süre (Dakika)"]
+    })
+    other = summary.loc[small, "Süre (Dakika)"].sum()
+    if other > 0:
+        panel = pd.concat([panel, pd.DataFrame({"Duruş Adı": ["Diğer"], "Süre (Dakika)": [other]})])
+    
+    return panel.sort_values("Süre (Dakika)", ascending=False).reset_index(drop=True)
+
+def plot_machine_grid(
+    panels: List[Tuple[str, pd.DataFrame]],
+    kind: str,
+    title: str,
+    output_path: str,
+    colors: Dict[str, Tuple[float, float, float]],
+    ncols: int = 4,
+    save: bool = True,
+    show: bool = False,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Birden fazla tezgahın duruş dağılımını tek sayfada küçük grafikler olarak çizer.
+    
+    Args:
+        panels: (tezgah kodu, panel verisi) listesi
+        kind: "pie" (halka grafik) veya "bar" (yatay çubuk grafik)
+        title: Sayfa başlığı
+        output_path: Grafik dosyasının yolu
+        colors: Duruş adı -> renk (stop_color_map çıktısı)
+        ncols: Satır başına panel sayısı
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+    """
+    logger.info(f"Izgara grafik oluşturuluyor: {title}")
+    
+    profile = profile or get_output_profile("machine_grid")
+    ncols = max(1, min(ncols, len(panels)))
+    nrows = max(1, -(-len(panels) // ncols))
+    panel_width, panel_height = (4, 4) if kind == "pie" else (5, 3.5)
+    figsize = (panel_width * ncols, panel_height * nrows + 1)
+    
+    # Panel sayısı sayfadan sayfaya değiştiği için şablon şekil kullanılmaz
+    if show:
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    axes = fig.subplots(nrows, ncols, squeeze=False).ravel()
+    
+    for ax, (code, panel) in zip(axes, panels):
+        names = panel["Duruş Adı"].tolist()
+        values = panel["Süre (Dakika)"].tolist()
+        panel_colors = [colors.get(name, OTHER_COLOR) for name in names]
         
-        # Eğer toplam süre 0 ise, bu makine için grafik oluşturma
-        if total_duration == 0:
-            logger.warning(f"Tezgah {code} için veri yok veya toplam süre 0.")
-            continue
+        if kind == "pie":
+            ax.pie(
+                values,
+                colors=panel_colors,
+                startangle=90,
+                counterclock=False,
+                wedgeprops=dict(width=0.6, edgecolor="white"),
+                autopct=lambda pct: f"{pct:.0f}%" if pct >= 5 else "",
+                pctdistance=0.7,
+                textprops=dict(fontsize=8)
+            )
+            ax.axis('equal')
+            ax.set_title(f"{code}\n{sum(values):.0f} dk", fontsize=10)
+        else:
+            positions = range(len(values))
+            ax.barh(positions, values, color=panel_colors)
+            ax.set_yticks(positions, names, fontsize=7)
+            ax.invert_yaxis()  # En büyük duruş en üstte
+            for position, value in zip(positions, values):
+                ax.text(value, position, f" {value:.0f}", va='center', fontsize=7)
+            ax.set_xlim(0, max(values) * 1.25)
+            ax.tick_params(axis='x', labelsize=7)
+            ax.set_title(code, fontsize=10)
+    
+    # Kullanılmayan panelleri gizle
+    for ax in axes[len(panels):]:
+        ax.axis('off')
+    
+    # Sayfadaki tüm duruşlar için ortak açıklama (renkler tüm sayfalarda aynıdır)
+    page_names = {name for _, panel in panels for name in panel["Duruş Adı"]}
+    handles = [Patch(facecolor=color, label=name) for name, color in colors.items() if name in page_names]
+    fig.legend(handles=handles, loc="lower center", ncol=min(6, len(handles)), fontsize=9, frameon=False)
+    
+    fig.suptitle(title, fontsize=14)
+    fig.tight_layout(rect=(0, 0.8 / figsize[1], 1, 1 - 0.4 / figsize[1]))
+    
+    finish_chart(fig, output_path, save, show, profile)
+
+def machine_grid_jobs(
+    df: pd.DataFrame,
+    kind: str = "pie",
+    group_column: Optional[str] = "KISIM",
+    folder_path: str = "Raporlar/Tezgahlar/Son Hafta Izgara",
+    threshold: float = 3,
+    per_page: int = 16,
+    ncols: int = 4,
+    colors: Optional[Dict[str, Tuple[float, float, float]]] = None,
+    save: bool = True,
+    show: bool = False,
+    profile: Optional[Dict[str, Any]] = None
+) -> List[RenderJob]:
+    """
+    Tezgah başına pasta veya çubuk grafikleri yerine ızgara sayfası işlerini oluşturur.
+    
+    Her grup (kısım veya tüm tezgahlar) için tezgahlar per_page'lik sayfalara
+    bölünür ve her sayfa tek bir grafik dosyası olarak çizilir. Pasta panelleri
+    machine_pie_jobs, çubuk panelleri plot_bar_jobs ile aynı veriyi gösterir.
+    
+    Args:
+        df: Son hafta duruş küpü (tezgah, kısım, duruş adı, saniye ve dakika sütunlarıyla)
+        kind: "pie" veya "bar"
+        group_column: Sayfa grubu sütunu (None ise tüm tezgahlar tek grupta)
+        folder_path: Grafiklerin kaydedileceği klasör
+        threshold: Eşik değeri, bu değerden düşük yüzdeli duruşlar "Diğer" olarak gruplandırılır
+        per_page: Sayfa başına tezgah sayısı
+        ncols: Satır başına panel sayısı
+        colors: Duruş adı -> renk (None ise df'deki duruş adlarından oluşturulur)
+        save: Grafiği kaydetme bayrağı
+        show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+    
+    Returns:
+        List[RenderJob]: Grafik işleri
+    """
+    ensure_dir(folder_path)
+    profile = profile or get_output_profile("machine_grid")
+    colors = colors or stop_color_map(df["Duruş Adı"].unique())
+    
+    groups = partition_frame(df, group_column) if group_column else {"Tüm Tezgahlar": df}
+    label = "Duruş Nedenleri" if kind == "pie" else "Duruş Süreleri"
+    
+    jobs = []
+    for group, group_data in groups.items():
+        # Tezgah panellerini machine_pie_jobs / plot_bar_jobs ile aynı şekilde hazırla
+        panels = []
+        for code, machine_data in partition_frame(group_data, "İş Merkezi Kodu ").items():
+            if kind == "pie":
+                machine_data = machine_data[machine_data["Duruş Adı"] != "ÇALIŞMA SÜRESİ"]
+                summary = machine_data.groupby("Duruş Adı", observed=True)["Süre (Dakika)"].sum().reset_index()
+            else:
+                summary = machine_data.groupby("Duruş Adı", observed=True)["Süre (Saniye)"].sum().reset_index()
+                summary = second_to_minute(summary, copy=False)
             
-        # Yüzdeleri hesapla
-        machine_data["Yüzde"] = (machine_data[duration_column] / total_duration) * 100
-        
-        # Eşik değerinden küçük olanları "Diğer" olarak grupla
-        other_duration = machine_data[machine_data["Yüzde"] < threshold][duration_column].sum()
-        filtered_data = machine_data[machine_data["Yüzde"] >= threshold].copy()
-        
-        if other_duration > 0:
-            filtered_data = pd.concat([
-                filtered_data, 
-                pd.DataFrame({
-                    stoppage_column: ["Diğer"], 
-                    duration_column: [other_duration], 
-                    "Yüzde": [(other_duration / total_duration) * 100]
-                })
-            ])
-        
-        # Süreye göre büyükten küçüğe sırala
-        filtered_data = filtered_data.sort_values(by=duration_column, ascending=False)
-        
-        # Grafik boyutunu artır
-        plt.figure(figsize=(14, 9))  # Daha geniş bir grafik
-        
-        # Renk paleti dinamik olarak oluştur
-        pastel_colors = sns.color_palette("pastel", n_colors=len(filtered_data))
-        
-        # X ekseni değerlerini hazırla
-        x_values = range(len(filtered_data))
+            if summary["Süre (Dakika)"].sum() <= 0:
+                continue
+            panels.append((code, _grid_panel_summary(summary, threshold)))
         
-        # Çubuk grafiğini çiz
-        bars = plt.bar(
-            x_values,
-            filtered_data[duration_column],
-            color=pastel_colors
-        )
+        # Tezgahları sayfalara böl
+        pages = [panels[i:i + per_page] for i in range(0, len(panels), per_page)]
+        for page_number, page_panels in enumerate(pages, start=1):
+            suffix = f" ({page_number}-{len(pages)})" if len(pages) > 1 else ""
+            title = f"{group} - {label}{suffix}"
+            output_path = profile_output_path(os.path.join(folder_path, f"{title}.png"), profile)
+            jobs.append(RenderJob(
+                plot_machine_grid,
+                dict(
+                    panels=page_panels, kind=kind, title=title, output_path=output_path,
+                    colors=colors, ncols=ncols, save=save, show=show, profile=profile
+                ),
+                output_path
+            ))
+    
+    return jobs
 
-        # X ekseni etiketlerini ayarla
-        plt.xticks(
-            x_values,
-            filtered_data[stoppage_column],
-            rotation=75,
-            ha='right'  # Sağa hizalama
-        )
+# OEE kartı boyutları (piksel)
+OEE_CARD_SIZE = (230, 240)
 
-        # Etiketleri ekle
-        for i, value in enumerate(filtered_data[duration_column]):
-            percentage = filtered_data["Yüzde"].iloc[i]
-            plt.text(
-                i, 
-                value + 5,  # Değerin biraz üzerine yerleştir
-                f'{value:.0f} dk\n({percentage:.1f}%)', 
-                ha='center',
-                fontsize=9
-            )
-        
-        # Başlık ve eksen etiketleri
-        plt.title(f"{code} - Duruş Süreleri", fontsize=14, pad=15)
-        plt.xlabel("Duruş Adı", fontsize=12)
-        plt.ylabel("Süre (Dakika)", fontsize=12)
-        
-        # Y ekseni üst sınırını ayarla
-        max_value = filtered_data[duration_column].max()
-        plt.ylim(0, max_value * 1.2)  # %20 margin ekle
-        
-        # Alt ve üst boşlukları ayarla
-        plt.subplots_adjust(bottom=0.3, top=0.9)  # Altta daha fazla boşluk bırak
-        
-        if save:
-            plt.savefig(os.path.join(folder_path, f"{code}.png"), dpi=300, bbox_inches='tight')
-            logger.info(f"Grafik kaydedildi: {os.path.join(folder_path, f'{code}.png')}")
-        
-        if show:
-            plt.show()
-        
-        plt.close()
+@lru_cache(maxsize=None)
+def load_card_fonts() -> Tuple[Any, Any]:
+    """
+    OEE kartlarının büyük ve orta boy fontlarını süreç başına bir kez yükler.
     
-    logger.info("Tezgah duruş grafikleri oluşturuldu.")
+    Returns:
+        Tuple[Any, Any]: Büyük ve orta boy font
+    """
+    try:
+        # Font yükleme (TTF formatında bir yazı tipi dosyası kullanmanız gerekir)
+        return ImageFont.truetype("arial.ttf", 30), ImageFont.truetype("arial.ttf", 12)
+    except OSError:
+        # Font yüklenemezse, varsayılan fontları kullan
+        logger.warning("Arial fontu yüklenemedi, varsayılan font kullanılıyor.")
+        return ImageFont.load_default(), ImageFont.load_default()
 
-def means2png(
+def draw_oee_card(
     title: str, 
     oee: float = None, 
     performans: float = None, 
     kullanılabilirlik: float = None, 
-    kalite: float = None, 
-    path: str = None
-) -> None:
+    kalite: float = None
+) -> Image.Image:
     """
-    OEE ve ilgili metrik değerlerini içeren bir görsel oluşturur.
+    OEE ve ilgili metrik değerlerini içeren kart görselini bellekte çizer.
     
     Args:
         title: Görsel başlığı
@@ -565,103 +1156,209 @@ def means2png(
         performans: Performans değeri (0-1 aralığında)
         kullanılabilirlik: Kullanılabilirlik değeri (0-1 aralığında)
         kalite: Kalite değeri (0-1 aralığında)
-        path: Kaydedilecek dosya yolu
-    """
-    logger.info(f"OEE görselleştirmesi oluşturuluyor: {title}")
     
+    Returns:
+        Image.Image: Kart görseli
+    """
     # Sayısal değerleri yüzdelik formatta göstermek için yuvarlama
     try:
         oee = round(oee * 100)
         performans = round(performans * 100)
         kullanılabilirlik = round(kullanılabilirlik * 100)
         kalite = round(kalite * 100)
-    except:
+    except (TypeError, ValueError):
         oee, performans, kullanılabilirlik, kalite = "sayısal", "bir", "veri", "yoktur"
         logger.warning(f"{title} için sayısal veriler hesaplanamadı.")
     
-    # Görsel boyutları
-    width, height = 230, 240
-
     # Görsel oluştur
-    image = Image.new("RGB", (width, height), "white")
+    image = Image.new("RGB", OEE_CARD_SIZE, "white")
     draw = ImageDraw.Draw(image)
-
-    try:
-        # Font yükleme (TTF formatında bir yazı tipi dosyası kullanmanız gerekir)
-        font_large = ImageFont.truetype("arial.ttf", 30)
-        font_medium = ImageFont.truetype("arial.ttf", 12)
-    except:
-        # Font yüklenemezse, varsayılan fontları kullan
-        logger.warning("Arial fontu yüklenemedi, varsayılan font kullanılıyor.")
-        font_large = ImageFont.load_default()
-        font_medium = ImageFont.load_default()
-
+    font_large, font_medium = load_card_fonts()
+    
     # Başlık ve metrikleri çiz
     draw.text((20, 15), title, fill="black", font=font_large)
     draw.text((20, 70), f"TOPLAM TEE\nORANI : %{oee}", fill="black", font=font_large, spacing=5)
     draw.text((20, 175), 
               f"PERFORMANS ORANI : %{performans}\nKULLANILABİLİRLİK ORANI : %{kullanılabilirlik}\nKALİTE ORANI : %{kalite}",
               fill="black", font=font_medium, spacing=5)
+    
+    return image
 
+def means2png(
+    title: str, 
+    oee: float = None, 
+    performans: float = None, 
+    kullanılabilirlik: float = None, 
+    kalite: float = None, 
+    path: str = None,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    OEE ve ilgili metrik değerlerini içeren bir görsel oluşturur.
+    
+    Args:
+        title: Görsel başlığı
+        oee: OEE değeri (0-1 aralığında)
+        performans: Performans değeri (0-1 aralığında)
+        kullanılabilirlik: Kullanılabilirlik değeri (0-1 aralığında)
+        kalite: Kalite değeri (0-1 aralığında)
+        path: Kaydedilecek dosya yolu
+        profile: Çıktı profili (vektör profillerde görsel PNG kaydedilir)
+    """
+    logger.info(f"OEE görselleştirmesi oluşturuluyor: {title}")
+    
+    image = draw_oee_card(title, oee, performans, kullanılabilirlik, kalite)
+    
     # Dosya yolunu oluştur
     if path:
-        full_path = os.path.join("Raporlar/Tee/", path)
+        # Kart piksel tabanlı olduğundan vektör profillerde PNG kaydedilir
+        profile = profile or get_output_profile("oee_card")
+        full_path = image_output_path(os.path.join("Raporlar/Tee/", path), profile)
         directory = os.path.dirname(full_path)
         
         # Dizin yoksa oluştur
         ensure_dir(directory)
         
         # Görseli kaydet
-        image.save(full_path)
+        if profile.get("capture"):
+            capture_page(image)
+            return
+        image.save(full_path, **(profile.get("pil_kwargs") or {}))
         logger.info(f"OEE görseli kaydedildi: {full_path}")
 
-def combine_images_horizontal(
-    image1_path: str, 
-    image2_path: str, 
-    output_path: str
+def build_mosaic(
+    images: List[Image.Image],
+    ncols: Optional[int] = None,
+    gap: int = 0,
+    background: Tuple[int, int, int] = (0, 0, 0)
+) -> Image.Image:
+    """
+    Bellekteki görselleri satır satır bir ızgarada birleştirir.
+    
+    Sütun genişliği sütundaki en geniş, satır yüksekliği satırdaki en yüksek
+    görsele göre belirlenir; görseller hücrelerin sol üst köşesine yerleştirilir.
+    
+    Args:
+        images: Birleştirilecek görseller
+        ncols: Satır başına görsel sayısı (None ise tümü tek satırda)
+        gap: Görseller arasındaki ve kenarlardaki boşluk (piksel)
+        background: Boşlukların ve boş hücrelerin rengi
+    
+    Returns:
+        Image.Image: Birleştirilmiş görsel
+    """
+    ncols = max(1, min(ncols or len(images), len(images)))
+    nrows = -(-len(images) // ncols)
+    rows = [images[row * ncols:(row + 1) * ncols] for row in range(nrows)]
+    
+    col_widths = [max(image.width for image in images[col::ncols]) for col in range(ncols)]
+    row_heights = [max(image.height for image in row) for row in rows]
+    
+    mosaic = Image.new(
+        "RGB",
+        (sum(col_widths) + gap * (ncols + 1), sum(row_heights) + gap * (nrows + 1)),
+        background
+    )
+    y = gap
+    for row, row_height in zip(rows, row_heights):
+        x = gap
+        for image, col_width in zip(row, col_widths):
+            mosaic.paste(image, (x, y))
+            x += col_width + gap
+        y += row_height + gap
+    
+    return mosaic
+
+def render_oee_cards(
+    cards: List[Dict[str, Any]],
+    sheet_path: Optional[str] = None,
+    write_cards: bool = True,
+    ncols: int = 8,
+    profile: Optional[Dict[str, Any]] = None
 ) -> None:
     """
-    İki resmi yatay olarak birleştirir.
+    Bir hafta ve seviyenin OEE kartlarını tek seferde çizer.
+    
+    Fontlar süreç başına bir kez yüklenir. Kartlar ayrı dosyalara ve/veya tek bir
+    ızgara görseline (contact sheet) kaydedilir. Sayfa yakalayan (capture)
+    profillerde yalnızca ızgara görseli PDF raporu için yakalanır.
     
     Args:
-        image1_path: İlk resmin dosya yolu
-        image2_path: İkinci resmin dosya yolu
-        output_path: Çıktı dosyasının yolu
+        cards: Kart bilgileri (title, oee, performans, kullanılabilirlik, kalite, path)
+        sheet_path: Izgara görselinin yolu (None ise oluşturulmaz)
+        write_cards: Kartları ayrı dosyalara kaydetme bayrağı
+        ncols: Izgara görselinde satır başına kart sayısı
+        profile: Çıktı profili (vektör profillerde kartlar PNG kaydedilir)
     """
-    try:
-        logger.info(f"Resimler birleştiriliyor: {image1_path} ve {image2_path}")
-        
-        # Resimleri yükle
-        image1 = Image.open(image1_path)
-        image2 = Image.open(image2_path)
-        
-        # Yeni resmin boyutları
-        new_width = image1.width + image2.width
-        new_height = max(image1.height, image2.height)
-        
-        # Yeni bir boş resim oluştur
-        combined_image = Image.new("RGB", (new_width, new_height))
-        
-        # Resimleri birleştir
-        combined_image.paste(image1, (0, 0))
-        combined_image.paste(image2, (image1.width, 0))
-        
-        # Çıktı dizinini kontrol et
-        output_dir = os.path.dirname(output_path)
-        ensure_dir(output_dir)
-        
-        # Yeni resmi kaydet
-        combined_image.save(output_path)
-        logger.info(f"Birleştirilmiş resim kaydedildi: {output_path}")
-    except Exception as e:
-        logger.error(f"Resim birleştirme hatası: {str(e)}")
+    profile = profile or get_output_profile("oee_card")
+    save_kwargs = profile.get("pil_kwargs") or {}
+    if profile.get("capture"):
+        write_cards = False
+    
+    images = []
+    for card in cards:
+        image = draw_oee_card(
+            card["title"], card["oee"], card["performans"], card["kullanılabilirlik"], card["kalite"]
+        )
+        if write_cards:
+            full_path = image_output_path(os.path.join("Raporlar/Tee/", card["path"]), profile)
+            ensure_dir(os.path.dirname(full_path))
+            image.save(full_path, **save_kwargs)
+        if sheet_path:
+            images.append(image)
+    
+    if sheet_path and images and profile.get("capture"):
+        capture_page(build_mosaic(images, ncols, gap=2, background=(210, 210, 210)))
+    elif sheet_path and images:
+        sheet_path = image_output_path(sheet_path, profile)
+        ensure_dir(os.path.dirname(sheet_path))
+        build_mosaic(images, ncols, gap=2, background=(210, 210, 210)).save(sheet_path, **save_kwargs)
+        logger.info(f"OEE kart görseli kaydedildi: {sheet_path}")
+    
+    logger.info(f"{len(cards)} OEE kartı oluşturuldu"
+                f"{'' if write_cards else ' (yalnızca ızgara görseli)'}.")
+
+def render_oee_mosaic(
+    cards: List[Dict[str, Any]],
+    output_path: str,
+    ncols: Optional[int] = None,
+    profile: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    OEE kartlarını bellekte çizip diskten okumadan tek bir mozaik görselde birleştirir.
+    
+    Args:
+        cards: Kart bilgileri (title, oee, performans, kullanılabilirlik, kalite)
+        output_path: Mozaik görselinin yolu
+        ncols: Satır başına kart sayısı (None ise tümü tek satırda)
+        profile: Çıktı profili (vektör profillerde mozaik PNG kaydedilir)
+    """
+    profile = profile or get_output_profile("oee_card")
+    
+    images = [
+        draw_oee_card(card["title"], card["oee"], card["performans"], card["kullanılabilirlik"], card["kalite"])
+        for card in cards
+    ]
+    
+    if profile.get("capture"):
+        capture_page(build_mosaic(images, ncols))
+        return
+    
+    output_path = image_output_path(output_path, profile)
+    ensure_dir(os.path.dirname(output_path))
+    build_mosaic(images, ncols).save(output_path, **(profile.get("pil_kwargs") or {}))
+    logger.info(f"OEE mozaiği kaydedildi: {output_path}")
+
+# visualize_top_bottom_machines grafiğinin dosya yolu
+TOP_BOTTOM_OUTPUT_PATH = "Raporlar/Genel/İlk ve Son Tezgah.png"
 
 def visualize_top_bottom_machines(
     df: pd.DataFrame,
     top_count: int = 7,
     bottom_count: int = 7,
     save: bool = True,
-    show: bool = True
+    show: bool = True,
+    profile: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     En çok ve en az duruşa sahip tezgahları görselleştirir.
@@ -672,6 +1369,7 @@ def visualize_top_bottom_machines(
         bottom_count: En az duruşa sahip tezgah sayısı
         save: Grafiği kaydetme bayrağı
         show: Grafiği gösterme bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
     """
     logger.info(f"En çok ve en az duruşa sahip tezgahlar grafiği oluşturuluyor...")
     
@@ -697,41 +1395,206 @@ def visualize_top_bottom_machines(
     colors = ['#2ca02c'] * len(bottom) + ['#d62728'] * len(top)
 
     # Bar grafiği oluşturma
-    plt.figure(figsize=(12, 8))
+    fig, ax = chart_figure("top_bottom", (12, 8), show)
 
     # Bar grafiği çizdir
-    bars = plt.bar(selected_data["İş Merkezi Kodu "], selected_data["Süre (Dakika)"], color=colors)
+    bars = ax.bar(selected_data["İş Merkezi Kodu "], selected_data["Süre (Dakika)"], color=colors)
 
     # Yüzdeleri her bir barın üstüne ekleme
     for bar in bars:
         height = bar.get_height()
         percentage = (height / total_time) * 100  # Yüzde hesaplama
-        plt.text(
+        ax.text(
             bar.get_x() + bar.get_width() / 2, height, 
             f"{height}\n({percentage:.1f}%)",  # Hem süre hem de yüzde gösterme
             ha='center', va='bottom', fontsize=10, color='black', weight='bold'
         )
 
     # Grafik başlık ve eksen etiketleri
-    plt.title(f"İş Merkezi Koduna Göre Süre (Dakika) - İlk {bottom_count} Yeşil, Son {top_count} Kırmızı", fontsize=14, pad=15)
-    plt.xlabel("İş Merkezi Kodu", fontsize=12)
-    plt.ylabel("Süre (Dakika)", fontsize=12)
+    ax.set_title(f"İş Merkezi Koduna Göre Süre (Dakika) - İlk {bottom_count} Yeşil, Son {top_count} Kırmızı", fontsize=14, pad=15)
+    ax.set_xlabel("İş Merkezi Kodu", fontsize=12)
+    ax.set_ylabel("Süre (Dakika)", fontsize=12)
 
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+    fig.tight_layout()
     
-    if save:
-        plt.savefig("Raporlar/Genel/İlk ve Son Tezgah.png", dpi=300, bbox_inches='tight')
-        logger.info("Grafik kaydedildi: Raporlar/Genel/İlk ve Son Tezgah.png")
+    finish_chart(fig, TOP_BOTTOM_OUTPUT_PATH, save, show, profile or get_output_profile("top_bottom"))
     
-    if show:
-        plt.show()
+def _oee_card(row: Dict[str, Any], title: Optional[str] = None, path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    OEE tablosu satırından kart bilgilerini oluşturur.
+    
+    Args:
+        row: calculate_oee_table satırı
+        title: Kart başlığı (None ise genel seviyede hafta, diğerlerinde varlık adı)
+        path: Kartın Raporlar/Tee/ altındaki yolu
+    
+    Returns:
+        Dict[str, Any]: Kart bilgileri
+    """
+    if title is None:
+        title = f"{row['Hafta']}. Hafta" if row["Seviye"] == "Genel" else f"{row['Varlık']}"
+    return dict(
+        title=title,
+        oee=row["Oee"], 
+        performans=row["Performans"],
+        kullanılabilirlik=row["Kullanılabilirlik"], 
+        kalite=row["Kalite"], 
+        path=path
+    )
+
+def oee_card_jobs(
+    oee_table: pd.DataFrame,
+    profile: Optional[Dict[str, Any]] = None,
+    sheets: Optional[str] = None
+) -> List[RenderJob]:
+    """
+    OEE tablosunun satırları (hafta, kısım, tezgah) için OEE görseli işlerini oluşturur.
+    
+    Her hafta ve seviye için tek bir toplu iş oluşturulur. sheets verilirse kısım ve
+    tezgah seviyelerinin kartları ayrıca hafta başına tek bir ızgara görselinde
+    toplanır; genel kartlar haftalık karşılaştırma için her zaman ayrı kaydedilir.
+    
+    Sayfa yakalayan (capture) profillerde her iş tek bir ızgara sayfası üretir:
+    kısım ve tezgah kartları hafta başına, genel kartlar tüm haftalar için tek sayfada.
+    
+    Args:
+        oee_table: calculate_oee_table çıktısı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+        sheets: None (yalnızca kartlar), "ek" (kartlar ve ızgara görselleri) veya
+            "yalniz" (kısım/tezgah kartları yerine yalnızca ızgara görselleri)
     
-    plt.close()
+    Returns:
+        List[RenderJob]: Görsel işleri
+    """
+    # Seviyelere göre görsel yolları
+    path_templates = {
+        "Genel": "Genel/{week} Hafta.png",
+        "KISIM": "Kısımlar/{week} Hafta/{entity}.png",
+        "Tezgah": "Tezgahlar/{week} Hafta/{entity}.png"
+    }
+    
+    # Seviyelere göre ızgara görseli yolları
+    sheet_templates = {
+        "Genel": "Raporlar/Tee/Genel/Tüm Haftalar.png",
+        "KISIM": "Raporlar/Tee/Kısımlar/{week} Hafta - Tümü.png",
+        "Tezgah": "Raporlar/Tee/Tezgahlar/{week} Hafta - Tümü.png"
+    }
+    
+    resolved_profile = profile or get_output_profile("oee_card")
+    capture = bool(resolved_profile.get("capture"))
+    
+    # Kartları hafta ve seviyeye göre topla (tablo hafta sırasına göre dizilidir)
+    batches: Dict[Tuple[Any, str], List[Dict[str, Any]]] = {}
+    for row in oee_table.to_dict("records"):
+        week, entity, level = row["Hafta"], row["Varlık"], row["Seviye"]
+        # PDF sayfası için genel kartlar tüm haftalarda tek grupta toplanır
+        batch_week = None if capture and level == "Genel" else week
+        batches.setdefault((batch_week, level), []).append(
+            _oee_card(row, path=path_templates[level].format(week=week, entity=entity))
+        )
     
+    # Her hafta ve seviye için tek iş
+    jobs = []
+    for (week, level), cards in batches.items():
+        if capture:
+            sheet_path = sheet_templates[level].format(week=week)
+        elif sheets and level != "Genel":
+            sheet_path = image_output_path(sheet_templates[level].format(week=week), resolved_profile)
+        else:
+            sheet_path = None
+        write_cards = not (sheets == "yalniz" and sheet_path)
+        # Önbellek denetimi için işin yazdığı tüm kart dosyaları
+        card_paths = ()
+        if write_cards and not capture:
+            card_paths = tuple(
+                image_output_path(os.path.join("Raporlar/Tee/", card["path"]), resolved_profile) for card in cards
+            )
+        jobs.append(RenderJob(
+            render_oee_cards,
+            dict(cards=cards, sheet_path=sheet_path, write_cards=write_cards, profile=profile),
+            sheet_path or image_output_path(os.path.join("Raporlar/Tee/", cards[-1]["path"]), resolved_profile),
+            card_paths
+        ))
+    
+    return jobs
+
+# Trend şeritlerinin seviyelere göre klasörleri
+OEE_TREND_FOLDERS = {
+    "KISIM": "Raporlar/Tee/Trendler/Kısımlar",
+    "Tezgah": "Raporlar/Tee/Trendler/Tezgahlar"
+}
+
+def oee_mosaic_jobs(
+    oee_table: pd.DataFrame,
+    weeks: List[int],
+    trends: bool = False,
+    profile: Optional[Dict[str, Any]] = None
+) -> List[RenderJob]:
+    """
+    OEE tablosundan, kart dosyalarını yeniden okumadan çizilen mozaik işlerini oluşturur.
+    
+    Son iki haftanın genel kartları yan yana tek bir görselde birleştirilir.
+    trends açıksa her kısım ve tezgah için tüm haftaların kartları eskiden yeniye
+    tek bir trend şeridinde toplanır.
+    
+    Args:
+        oee_table: calculate_oee_table çıktısı
+        weeks: Sıralanmış hafta numaraları listesi (son hafta ilk sırada)
+        trends: Kısım ve tezgah trend şeritlerini oluşturma bayrağı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+    
+    Returns:
+        List[RenderJob]: Görsel işleri
+    """
+    jobs = []
+    resolved_profile = profile or get_output_profile("oee_card")
+    
+    # Ardışık iki haftanın karşılaştırması
+    if len(weeks) >= 2:
+        second_week, last_week = weeks[1], weeks[0]
+        general = {row["Hafta"]: row for row in oee_table[oee_table["Seviye"] == "Genel"].to_dict("records")}
+        if second_week in general and last_week in general:
+            output_path = image_output_path(f"Raporlar/Tee/Genel/{second_week}-{last_week} Hafta.png",
+                                            resolved_profile)
+            jobs.append(RenderJob(
+                render_oee_mosaic,
+                dict(cards=[_oee_card(general[second_week]), _oee_card(general[last_week])],
+                     output_path=output_path, profile=profile),
+                output_path
+            ))
+    
+    if not trends:
+        return jobs
+    
+    # Varlık başına trend şeritleri (eskiden yeniye)
+    week_order = {week: position for position, week in enumerate(reversed(weeks))}
+    strips: Dict[Tuple[str, Any], List[Dict[str, Any]]] = {}
+    for row in oee_table[oee_table["Seviye"].isin(list(OEE_TREND_FOLDERS))].to_dict("records"):
+        if row["Hafta"] in week_order:
+            strips.setdefault((row["Seviye"], row["Varlık"]), []).append(row)
+    
+    for (level, entity), rows in strips.items():
+        rows.sort(key=lambda row: week_order[row["Hafta"]])
+        output_path = image_output_path(os.path.join(OEE_TREND_FOLDERS[level], f"{entity}.png"), resolved_profile)
+        jobs.append(RenderJob(
+            render_oee_mosaic,
+            dict(cards=[_oee_card(row, title=f"{row['Hafta']}. Hafta") for row in rows],
+                 output_path=output_path, profile=profile),
+            output_path
+        ))
+    
+    return jobs
+
 def generate_oee_visuals(
     df: pd.DataFrame, 
-    weeks: List[int]
+    weeks: List[int],
+    oee_table: Optional[pd.DataFrame] = None,
+    workers: Optional[int] = 1,
+    profile: Optional[Dict[str, Any]] = None,
+    sheets: Optional[str] = None
 ) -> None:
     """
     OEE, performans, kullanılabilirlik ve kalite değerlerini görselleştirir.
@@ -739,88 +1602,19 @@ def generate_oee_visuals(
     Args:
         df: İşlenecek DataFrame
         weeks: Hafta numaraları listesi
+        oee_table: calculate_oee_table çıktısı (None ise df'den hesaplanır)
+        workers: Görsel süreç sayısı
+        profile: Çıktı profili (None ise ailenin varsayılan profili)
+        sheets: Izgara görseli modu (bkz. oee_card_jobs)
     """
     logger.info("OEE görselleri oluşturuluyor...")
     
-    # Her hafta için
-    for week in weeks:
-        week_df = df[df["Hafta"] == week]
-        
-        # Genel ortalama
-        oee_general = week_df["Oee"].mean()
-        performans_general = week_df["Performans"].mean()
-        kullanılabilirlik_general = week_df["Kullanılabilirlik"].mean()
-        kalite_general = week_df["Kalite"].mean()
-        
-        path = f"Genel/{week} Hafta.png"
-        title = f"{week}. Hafta"
-        means2png(
-            title=title, 
-            oee=oee_general, 
-            performans=performans_general,
-            kullanılabilirlik=kullanılabilirlik_general, 
-            kalite=kalite_general, 
-            path=path
-        )
-
-        # Kısımlara göre
-        for kisim in week_df["KISIM"].unique():
-            if kisim == "Diğer":
-                continue
-                
-            kisim_df = week_df[week_df["KISIM"] == kisim]
-            
-            if len(kisim_df) == 0:
-                continue
-                
-            oee_part = kisim_df["Oee"].mean()
-            performans_part = kisim_df["Performans"].mean()
-            kullanılabilirlik_part = kisim_df["Kullanılabilirlik"].mean()
-            kalite_part = kisim_df["Kalite"].mean()
-            
-            path = f"Kısımlar/{week} Hafta/{kisim}.png"
-            title = f"{kisim}"
-            means2png(
-                title=title, 
-                oee=oee_part, 
-                performans=performans_part, 
-                kullanılabilirlik=kullanılabilirlik_part, 
-                kalite=kalite_part, 
-                path=path
-            )
-
-        # Tezgahlara göre
-        for machine in week_df["İş Merkezi Kodu "].unique():
-            machine_df = week_df[week_df["İş Merkezi Kodu "] == machine]
-            
-            if len(machine_df) == 0:
-                continue
-                
-            oee_machine = machine_df["Oee"].mean()
-            performans_machine = machine_df["Performans"].mean()
-            kullanılabilirlik_machine = machine_df["Kullanılabilirlik"].mean()
-            kalite_machine = machine_df["Kalite"].mean()
-            
-            path = f"Tezgahlar/{week} Hafta/{machine}.png"
-            title = f"{machine}"
-            means2png(
-                title=title, 
-                oee=oee_machine, 
-                performans=performans_machine,
-                kullanılabilirlik=kullanılabilirlik_machine, 
-                kalite=kalite_machine, 
-                path=path
-            )
+    if oee_table is None:
+        oee_table = calculate_oee_table(df, weeks)
     
-    # Ardışık iki haftanın karşılaştırmasını yap
-    if len(weeks) >= 2:
-        second_week = weeks[1]  # İkinci en son hafta
-        last_week = weeks[0]  # En son hafta
-        
-        image1_path = f"Raporlar/Tee/Genel/{second_week} Hafta.png"
-        image2_path = f"Raporlar/Tee/Genel/{last_week} Hafta.png"
-        output_path = f"Raporlar/Tee/Genel/{second_week}-{last_week} Hafta.png"
-        
-        combine_images_horizontal(image1_path, image2_path, output_path)
+    run_render_jobs(
+        oee_card_jobs(oee_table, profile, sheets) + oee_mosaic_jobs(oee_table, weeks, profile=profile),
+        workers=workers
+    )
     
-    logger.info("OEE görselleri oluşturuldu.")
\ No newline at end of file
+    logger.info("OEE görselleri oluşturuldu.")
@@ -0,0 +1,130 @@
+"""
+Ayrıştırılmış girdi önbelleğinin geçersizleştirme kurallarını doğrulayan testler.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src import cache
+
+class CountingBuilder:
+    """
+    Kaynak dosyadan DataFrame üreten ve kaç kez çağrıldığını sayan builder.
+    """
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self, source_path: str) -> pd.DataFrame:
+        self.calls += 1
+        with open(source_path, 'r', encoding='utf-8') as f:
+            return pd.DataFrame({'Satır': f.read().splitlines()})
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "durus.txt"
+    path.write_text("A\nB\n", encoding='utf-8')
+    return str(path)
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    # Testler gerçek tezgah kaydından bağımsız olsun
+    monkeypatch.setattr(cache, "config_hash", lambda: "config-1")
+    return str(tmp_path / "cache")
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """
+    file_content_hash çağrılarını sayar.
+    """
+    calls = []
+    original = cache.file_content_hash
+    
+    def counting_hash(file_path, *args, **kwargs):
+        calls.append(file_path)
+        return original(file_path, *args, **kwargs)
+    
+    monkeypatch.setattr(cache, "file_content_hash", counting_hash)
+    return calls
+
+def set_mtime(path: str, offset: float) -> None:
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + offset))
+
+def test_unchanged_source_uses_mtime_and_size_shortcut(source, cache_dir, hash_calls):
+    builder = CountingBuilder()
+    first = cache.load_with_cache(source, "durus", builder, cache_dir)
+    hash_calls.clear()
+    
+    second = cache.load_with_cache(source, "durus", builder, cache_dir)
+    
+    assert builder.calls == 1
+    assert hash_calls == []
+    pd.testing.assert_frame_equal(second, first)
+
+def test_touched_source_with_same_content_is_rehashed_once(source, cache_dir, hash_calls):
+    builder = CountingBuilder()
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    set_mtime(source, 10)
+    hash_calls.clear()
+    
+    assert cache.get_cached_frame(source, "durus", cache_dir) is not None
+    assert hash_calls == [source]
+    
+    # Kayıt yeni mtime ile güncellendiği için ikinci okumada özetleme yapılmaz
+    assert cache.get_cached_frame(source, "durus", cache_dir) is not None
+    assert hash_calls == [source]
+    assert builder.calls == 1
+
+def test_content_change_forces_rebuild(source, cache_dir):
+    builder = CountingBuilder()
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    
+    # Aynı boyutta farklı içerik; yalnızca içerik özeti farkı yakalayabilir
+    with open(source, 'w', encoding='utf-8') as f:
+        f.write("C\nD\n")
+    set_mtime(source, 10)
+    
+    assert cache.get_cached_frame(source, "durus", cache_dir) is None
+    df = cache.load_with_cache(source, "durus", builder, cache_dir)
+    assert builder.calls == 2
+    assert df['Satır'].tolist() == ["C", "D"]
+
+def test_config_fingerprint_change_forces_rebuild(source, cache_dir, monkeypatch):
+    builder = CountingBuilder()
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    
+    monkeypatch.setattr(cache, "config_hash", lambda: "config-2")
+    
+    assert cache.get_cached_frame(source, "durus", cache_dir) is None
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    assert builder.calls == 2
+    assert cache.get_cached_frame(source, "durus", cache_dir) is not None
+
+def test_cache_version_change_forces_rebuild(source, cache_dir, monkeypatch):
+    builder = CountingBuilder()
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    
+    monkeypatch.setattr(cache, "CACHE_VERSION", cache.CACHE_VERSION + 1)
+    
+    assert cache.get_cached_frame(source, "durus", cache_dir) is None
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    assert builder.calls == 2
+
+def test_rebuild_replaces_the_old_data_file(source, cache_dir, monkeypatch):
+    builder = CountingBuilder()
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    monkeypatch.setattr(cache, "config_hash", lambda: "config-2")
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    
+    data_files = [name for name in os.listdir(cache_dir) if not name.endswith(".json")]
+    assert len(data_files) == 1
+
+def test_rebuild_flag_ignores_valid_cache(source, cache_dir):
+    builder = CountingBuilder()
+    cache.load_with_cache(source, "durus", builder, cache_dir)
+    cache.load_with_cache(source, "durus", builder, cache_dir, rebuild=True)
+    
+    assert builder.calls == 2
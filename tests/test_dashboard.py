@@ -0,0 +1,107 @@
+"""
+Rapor panosuna gömülen sıkıştırılmış verinin duruş küpü ve OEE tablosuyla
+tutarlı olduğunu doğrulayan testler.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations import build_stop_cube
+from src.dashboard import build_dashboard_data, render_dashboard_html
+from src.data_processing import optimize_dtypes
+from src.stop_categories import STOP_CATEGORY_COLUMN, assign_stop_category
+
+WEEKS = [11, 10]
+
+def stop_cube() -> pd.DataFrame:
+    """
+    İki rapor haftası ve pencere dışında kalan bir eski hafta içeren küçük küp oluşturur.
+    
+    M3 yalnızca çalışma süresi satırlarında, M4 kısımsız olarak yer alır; M2'nin
+    duruşlarının çoğu KISIM 2'dedir.
+    """
+    rows = [
+        # (tezgah, kısım, hafta, duruş, saniye)
+        ("M1", "KISIM 1", 10, "ARIZA", 600),
+        ("M1", "KISIM 1", 10, "ARIZA", 300),
+        ("M1", "KISIM 1", 11, "SMED HAZIRLIK", 1200),
+        ("M1", "KISIM 1", 11, "ÇALIŞMA SÜRESİ", 30000),
+        ("M2", "KISIM 1", 11, "ARIZA", 120),
+        ("M2", "KISIM 2", 11, "MALZEME BEKLEME", 900),
+        ("M2", "KISIM 2", 10, "YEMEK MOLASI 2", 1800),
+        ("M3", "KISIM 2", 11, "ÇALIŞMA SÜRESİ", 25000),
+        ("M4", None, 10, "ARIZA", 240),
+        ("M1", "KISIM 1", 8, "BAKIM", 3000),
+    ]
+    df = pd.DataFrame(rows, columns=["İş Merkezi Kodu ", "KISIM", "Hafta", "Duruş Adı", "Süre (Saniye)"])
+    df["Süre (Dakika)"] = (df["Süre (Saniye)"] / 60).astype(int)
+    df = optimize_dtypes(df)
+    df[STOP_CATEGORY_COLUMN] = assign_stop_category(df["Duruş Adı"])
+    return build_stop_cube(df)
+
+def oee_table() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Hafta": [11, 10, 10, 11, 8],
+        "Seviye": ["Genel", "Genel", "Tezgah", "Tezgah", "Genel"],
+        "Varlık": ["Genel", "Genel", "M1", "M1", "Genel"],
+        "Oee": [0.61234, 0.55, 0.4, np.nan, 0.9],
+        "Performans": [0.8, 0.75, 0.7, 0.65, 0.9],
+        "Kullanılabilirlik": [0.85, 0.8, 0.6, 0.7, 0.9],
+        "Kalite": [0.9, 0.92, 0.95, 0.97, 0.9],
+    })
+
+@pytest.fixture(scope="module")
+def data():
+    return build_dashboard_data(stop_cube(), oee_table(), WEEKS, {"KISIM 1": 2, "KISIM 2": 1})
+
+def decoded_stops(data) -> set:
+    """
+    Duruş satırlarını indekslerden çözülmüş (hafta, tezgah, duruş, dakika) kümesine çevirir.
+    """
+    return {
+        (data["haftalar"][week], data["tezgahlar"][tezgah][0], data["duruslar"][durus], minutes)
+        for week, tezgah, durus, minutes in data["duruslar_veri"]
+    }
+
+def test_weeks_are_ordered_oldest_first(data):
+    assert data["haftalar"] == [10, 11]
+
+def test_working_time_and_other_weeks_are_left_out(data):
+    assert "ÇALIŞMA SÜRESİ" not in data["duruslar"]
+    assert "BAKIM" not in data["duruslar"]
+    # M3'ün yalnızca çalışma süresi vardır
+    assert [code for code, _ in data["tezgahlar"]] == ["M1", "M2", "M4"]
+
+def test_stop_rows_index_into_lookup_lists(data):
+    assert data["kisimlar"] == ["Diğer", "KISIM 1", "KISIM 2"]
+    assert data["duruslar"] == sorted(data["duruslar"])
+    assert decoded_stops(data) == {
+        (10, "M1", "ARIZA", 15.0),
+        (11, "M1", "AYAR", 20.0),
+        (11, "M2", "ARIZA", 2.0),
+        (11, "M2", "MALZEME BEKLEME", 15.0),
+        (10, "M2", "YEMEK MOLASI", 30.0),
+        (10, "M4", "ARIZA", 4.0),
+    }
+    # Satırlar hafta, tezgah ve duruş indeksine göre sıralıdır
+    keys = [row[:3] for row in data["duruslar_veri"]]
+    assert keys == sorted(keys)
+
+def test_machines_belong_to_their_largest_part(data):
+    kisim_of = {code: data["kisimlar"][kisim] for code, kisim in data["tezgahlar"]}
+    assert kisim_of == {"M1": "KISIM 1", "M2": "KISIM 2", "M4": "Diğer"}
+
+def test_oee_values_are_listed_per_week(data):
+    assert data["oee"] == {
+        "Genel": {"Genel": [[0.55, 0.75, 0.8, 0.92], [0.6123, 0.8, 0.85, 0.9]]},
+        "Tezgah": {"M1": [[0.4, 0.7, 0.6, 0.95], [None, 0.65, 0.7, 0.97]]},
+    }
+    assert data["tezgah_sayilari"] == {"KISIM 1": 2, "KISIM 2": 1}
+
+def test_rendered_html_embeds_json_safely():
+    data = build_dashboard_data(stop_cube(), oee_table(), WEEKS, title="</script><b>Pano</b>")
+    html = render_dashboard_html(data)
+    
+    assert "</script><b>" not in html
+    assert "&lt;/script>&lt;b>Pano" in html
@@ -0,0 +1,114 @@
+"""
+Geçmiş deposunun tekrar eden dışa aktarımları tekilleştirmesini ve hafta
+penceresi seçimini doğrulayan testler.
+"""
+
+import pandas as pd
+import pytest
+
+from src.data_processing import add_week_info
+from src.history import (
+    HISTORY_START_COLUMN,
+    list_history_partitions,
+    load_history_window,
+    update_history_store,
+)
+
+def export_frame(stops, work_minutes=None) -> pd.DataFrame:
+    """
+    prepare_data_for_analysis'in depoya verdiği biçimde birleşik veri oluşturur.
+    
+    Args:
+        stops: (tezgah, duruş, başlangıç, bitiş) dörtlüleri
+        work_minutes: (tezgah, gün) -> çalışma süresi (dakika)
+    """
+    start = pd.to_datetime([stop[2] for stop in stops])
+    end = pd.to_datetime([stop[3] for stop in stops])
+    seconds = (end - start).total_seconds().astype(int)
+    durus_df = pd.DataFrame({
+        'İş Merkezi Kodu ': [stop[0] for stop in stops],
+        'Duruş Adı': [stop[1] for stop in stops],
+        'Duruş Başlangıç Tarih': start.normalize(),
+        'Duruş Bitiş Tarih': end,
+        'Süre (Saniye)': seconds,
+        'Süre (Dakika)': seconds // 60,
+        HISTORY_START_COLUMN: start,
+    })
+    
+    work = work_minutes or {}
+    calisma_df = pd.DataFrame({
+        'İş Merkezi Kodu ': [machine for machine, _ in work],
+        'Duruş Adı': "ÇALIŞMA SÜRESİ",
+        'Duruş Başlangıç Tarih': pd.to_datetime([day for _, day in work]),
+        'Süre (Dakika)': list(work.values()),
+        'Süre (Saniye)': [minutes * 60 for minutes in work.values()],
+    })
+    
+    return add_week_info(pd.concat([durus_df, calisma_df], ignore_index=True))
+
+FIRST_EXPORT = [
+    ("M1", "ARIZA", "2024-03-04 08:00:00", "2024-03-04 08:30:00"),
+    ("M1", "ARIZA", "2024-03-05 09:00:00", "2024-03-05 09:20:00"),
+    ("M2", "SMED HAZIRLIK", "2024-03-05 10:00:00", "2024-03-05 10:45:00"),
+]
+
+def stop_rows(window: pd.DataFrame) -> pd.DataFrame:
+    return window[window['Duruş Adı'] != "ÇALIŞMA SÜRESİ"]
+
+def test_overlapping_reexport_does_not_duplicate_rows(tmp_path):
+    store = str(tmp_path)
+    update_history_store(export_frame(FIRST_EXPORT, {("M1", "2024-03-05"): 400}), store)
+    
+    # Son gün (5 Mart) yeniden gelir; çalışma süresi güncellenmiş, yeni bir gün eklenmiştir
+    second_export = FIRST_EXPORT + [("M2", "ARIZA", "2024-03-06 11:00:00", "2024-03-06 11:10:00")]
+    update_history_store(export_frame(second_export, {("M1", "2024-03-05"): 450}), store)
+    
+    window = load_history_window(store)
+    assert len(stop_rows(window)) == 4
+    work = window[window['Duruş Adı'] == "ÇALIŞMA SÜRESİ"]
+    assert work['Süre (Dakika)'].tolist() == [450]
+
+def test_corrected_end_time_replaces_the_stored_stop(tmp_path):
+    store = str(tmp_path)
+    update_history_store(export_frame(FIRST_EXPORT), store)
+    
+    corrected = FIRST_EXPORT[:2] + [("M2", "SMED HAZIRLIK", "2024-03-05 10:00:00", "2024-03-05 11:00:00")]
+    update_history_store(export_frame(corrected), store)
+    
+    stops = stop_rows(load_history_window(store))
+    smed = stops[stops['Duruş Adı'] == "SMED HAZIRLIK"]
+    assert len(stops) == 3
+    assert smed['Süre (Saniye)'].tolist() == [3600]
+    assert smed['Duruş Bitiş Tarih'].tolist() == [pd.Timestamp("2024-03-05 11:00:00")]
+
+def test_same_day_stops_with_different_starts_are_kept(tmp_path):
+    store = str(tmp_path)
+    same_day = FIRST_EXPORT + [("M1", "ARIZA", "2024-03-05 15:00:00", "2024-03-05 15:20:00")]
+    update_history_store(export_frame(same_day), store)
+    update_history_store(export_frame(same_day), store)
+    
+    assert len(stop_rows(load_history_window(store))) == 4
+
+def test_partitions_without_start_column_match_by_end_minus_duration(tmp_path):
+    store = str(tmp_path)
+    # Başlangıç anı sütunu eklenmeden önce yazılmış bölüm
+    update_history_store(export_frame(FIRST_EXPORT).drop(columns=[HISTORY_START_COLUMN]), store)
+    update_history_store(export_frame(FIRST_EXPORT), store)
+    
+    assert len(stop_rows(load_history_window(store))) == 3
+
+def test_load_history_window_selects_latest_weeks(tmp_path):
+    store = str(tmp_path)
+    stops = [("M1", "ARIZA", f"2024-03-{day:02d} 08:00:00", f"2024-03-{day:02d} 08:30:00") for day in (4, 11, 18)]
+    update_history_store(export_frame(stops), store)
+    
+    assert len(list_history_partitions(store)) == 3
+    assert sorted(load_history_window(store, n_weeks=2)['Hafta'].unique()) == [11, 12]
+    assert load_history_window(store, year_weeks=["2024-10"])['Hafta'].unique().tolist() == [10]
+
+@pytest.mark.parametrize("n_weeks", [0, -1])
+def test_load_history_window_with_no_weeks_is_empty(tmp_path, n_weeks):
+    store = str(tmp_path)
+    update_history_store(export_frame(FIRST_EXPORT), store)
+    
+    assert load_history_window(store, n_weeks=n_weeks).empty
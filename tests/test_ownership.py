@@ -0,0 +1,110 @@
+"""
+copy bayraklarının sahiplik sözleşmesini doğrulayan testler.
+
+copy=True çağıranın DataFrame'ini değiştirmemeli; copy=False ise DataFrame'i
+sahiplenip yerinde güncellemelidir.
+"""
+
+import pandas as pd
+import pytest
+
+from src.data_processing import (
+    add_week_info,
+    calculate_durations,
+    clean_last_rows,
+    filter_by_arizali_tezgahlar,
+    prepare_data_for_analysis,
+    process_calisma_data,
+)
+
+def durus_frame() -> pd.DataFrame:
+    """
+    Son iki satırı tezgaha ait olmayan küçük bir duruş verisi oluşturur.
+    """
+    return pd.DataFrame({
+        'İş Merkezi Kodu ': ['CT.D01', 'CT.D02', 'CT.D01', 'Toplam', None],
+        'Duruş Adı': ['ARIZA', 'SMED', 'MALZEME BEKLEME', None, None],
+        'Duruş Başlangıç Tarih': ['04.03.2024 08:00:00', '04.03.2024 09:00:00',
+                                  '05.03.2024 10:00:00', None, None],
+        'Duruş Bitiş Tarih': ['04.03.2024 08:30:00', '04.03.2024 09:45:00',
+                              '05.03.2024 10:20:00', None, None],
+    })
+
+def calisma_frame() -> pd.DataFrame:
+    """
+    Küçük bir çalışma süresi verisi oluşturur.
+    """
+    return pd.DataFrame({
+        'Makina Kodu': ['CT.D01', 'CT.D02', 'CT.D01'],
+        'Tarih': ['04.03.2024', '04.03.2024', '05.03.2024'],
+        'Çalışma Zamanı': [480, 480, 480],
+        'Planlı Duruş': [30, 45, 0],
+        'Plansız Duruş': [30, 0, 20],
+        'Oee': [0.8, 0.7, 0.9],
+        'Performans': [0.9, 0.8, 0.95],
+        'Kullanılabilirlik': [0.9, 0.9, 0.95],
+        'Kalite': [1.0, 1.0, 1.0],
+    })
+
+def cleaned_durus_frame() -> pd.DataFrame:
+    return clean_last_rows(durus_frame(), 'İş Merkezi Kodu ')
+
+def timed_durus_frame() -> pd.DataFrame:
+    return calculate_durations(cleaned_durus_frame())
+
+OWNERSHIP_CASES = [
+    pytest.param(durus_frame, lambda df, copy: clean_last_rows(df, 'İş Merkezi Kodu ', copy=copy),
+                 id="clean_last_rows"),
+    pytest.param(cleaned_durus_frame, lambda df, copy: calculate_durations(df, copy=copy),
+                 id="calculate_durations"),
+    pytest.param(calisma_frame, lambda df, copy: process_calisma_data(df, copy=copy),
+                 id="process_calisma_data"),
+    pytest.param(timed_durus_frame, lambda df, copy: add_week_info(df, copy=copy),
+                 id="add_week_info"),
+    pytest.param(timed_durus_frame, lambda df, copy: filter_by_arizali_tezgahlar(df, ['CT.D02'], copy=copy),
+                 id="filter_by_arizali_tezgahlar"),
+]
+
+@pytest.mark.parametrize("make_frame, func", OWNERSHIP_CASES)
+def test_copy_true_leaves_caller_frame_unchanged(make_frame, func):
+    df = make_frame()
+    original = df.copy()
+    
+    result = func(df, True)
+    
+    assert result is not df
+    pd.testing.assert_frame_equal(df, original)
+
+@pytest.mark.parametrize("make_frame, func", OWNERSHIP_CASES)
+def test_copy_false_updates_frame_in_place(make_frame, func):
+    df = make_frame()
+    original = df.copy()
+    
+    result = func(df, False)
+    
+    assert result is df
+    assert not df.equals(original)
+
+def test_clean_last_rows_removes_trailing_non_machine_rows():
+    result = clean_last_rows(durus_frame(), 'İş Merkezi Kodu ')
+    
+    assert result['İş Merkezi Kodu '].tolist() == ['CT.D01', 'CT.D02', 'CT.D01']
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_prepare_data_for_analysis_does_not_modify_loaded_inputs(tmp_path, use_cache):
+    durus_file = tmp_path / "durus.xlsx"
+    calisma_file = tmp_path / "calisma.xlsx"
+    durus_frame().to_excel(durus_file, index=False)
+    calisma_frame().to_excel(calisma_file, index=False)
+    durus_before = pd.read_excel(durus_file)
+    
+    # İkinci çalıştırma önbellekten okur; yerinde güncellemeler önbelleğe sızmamalı
+    runs = [
+        prepare_data_for_analysis(str(durus_file), str(calisma_file), use_cache=use_cache,
+                                  cache_dir=str(tmp_path / "cache"))
+        for _ in range(2)
+    ]
+    
+    pd.testing.assert_frame_equal(runs[0][0], runs[1][0])
+    assert runs[0][2] == runs[1][2]
+    pd.testing.assert_frame_equal(pd.read_excel(durus_file), durus_before)
@@ -0,0 +1,136 @@
+"""
+PDF raporunun sayfa sırasını, içindekiler numaralarını ve başarısız grafikler
+için yer tutucu sayfaları doğrulayan testler.
+"""
+
+import re
+
+import pytest
+from matplotlib.figure import Figure
+from PIL import Image
+
+from src import pdf_report
+from src.pdf_report import _toc_lines, order_report_jobs, write_pdf_report
+from src.rendering import RenderJob, capture_page
+
+def draw_page(label: str) -> None:
+    """
+    Sayfa yakalayan profildeki bir grafik gibi tek sayfa ekler.
+    """
+    fig = Figure(figsize=(4, 3))
+    fig.text(0.5, 0.5, label)
+    capture_page(fig)
+
+def draw_card(label: str) -> None:
+    """
+    OEE kartları gibi PIL görseli olarak sayfa ekler.
+    """
+    capture_page(Image.new("RGB", (200, 120), "white"))
+
+def fail_page(label: str) -> None:
+    raise ValueError(f"{label} için veri bozuk")
+
+def job(func, output_path: str) -> RenderJob:
+    return RenderJob(func, {"label": output_path}, output_path)
+
+# Bölümleri karışık sırada verilen işler
+JOBS = [
+    job(draw_page, "Raporlar/Tezgahlar/M1 Duruşları.png"),
+    job(draw_page, "Raporlar/Genel/Haftalık Toplam.png"),
+    job(draw_page, "Raporlar/Kısımlar/KISIM 1 Duruşları.png"),
+    job(fail_page, "Raporlar/Tezgahlar/M2 Duruşları.png"),
+    job(draw_card, "Raporlar/Tee/Genel/OEE.png"),
+    job(draw_page, "Raporlar/Kısımlar/KISIM 2 Duruşları.png"),
+]
+
+EXPECTED_ORDER = [
+    ("Genel", "Genel / Haftalık Toplam"),
+    ("Genel", "Tee / Genel / OEE"),
+    ("Kısımlar", "Kısımlar / KISIM 1 Duruşları"),
+    ("Kısımlar", "Kısımlar / KISIM 2 Duruşları"),
+    ("Tezgahlar", "Tezgahlar / M1 Duruşları"),
+    ("Tezgahlar", "Tezgahlar / M2 Duruşları"),
+]
+
+class RecordingPdfPages(pdf_report.PdfPages):
+    """
+    Her sayfadaki metinleri kaydeden PdfPages.
+    """
+    pages = []
+    
+    def savefig(self, figure=None, **kwargs):
+        RecordingPdfPages.pages.append([text.get_text() for text in figure.texts])
+        super().savefig(figure, **kwargs)
+
+@pytest.fixture
+def recorded_pages(monkeypatch):
+    RecordingPdfPages.pages = []
+    monkeypatch.setattr(pdf_report, "PdfPages", RecordingPdfPages)
+    return RecordingPdfPages.pages
+
+def pdf_page_count(path: str) -> int:
+    with open(path, 'rb') as f:
+        return len(re.findall(rb"/Type /Page\b(?!s)", f.read()))
+
+def test_order_report_jobs_groups_sections_and_keeps_job_order():
+    entries = order_report_jobs(JOBS)
+    
+    assert [(section, pdf_report.entry_title(job.output_path)) for section, job in entries] == EXPECTED_ORDER
+
+def test_toc_lines_number_pages_from_first_chart_page():
+    lines = _toc_lines(order_report_jobs(JOBS), first_page=2)
+    
+    assert lines[:3] == [
+        ("Genel", "2", True),
+        ("Genel / Haftalık Toplam", "2", False),
+        ("Tee / Genel / OEE", "3", False),
+    ]
+    assert [line for line in lines if line[2]] == [
+        ("Genel", "2", True), ("Kısımlar", "4", True), ("Tezgahlar", "6", True)
+    ]
+    assert lines[-1] == ("Tezgahlar / M2 Duruşları", "7", False)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_write_pdf_report_pages_match_table_of_contents(tmp_path, recorded_pages, workers):
+    output_path = str(tmp_path / "Rapor.pdf")
+    path, results = write_pdf_report(JOBS, output_path=output_path, workers=workers)
+    
+    assert path == output_path
+    assert pdf_page_count(path) == 1 + len(JOBS)
+    assert len(recorded_pages) == 1 + len(JOBS)
+    
+    # Sonuçlar rapor sırasındadır ve sayfaları bellekte tutulmaz
+    assert [pdf_report.entry_title(result.output_path) for result in results] == [
+        title for _, title in EXPECTED_ORDER
+    ]
+    assert all(result.pages == () for result in results)
+    assert [bool(result.error) for result in results] == [False] * 5 + [True]
+    
+    # İçindekilerdeki her numara, o grafiğin gerçekten yazıldığı sayfadır
+    toc = recorded_pages[0]
+    for page_number, (_, title) in enumerate(EXPECTED_ORDER, start=2):
+        entry = toc.index(title)
+        assert toc[entry + 1] == str(page_number)
+        assert f"Sayfa {page_number}" in recorded_pages[page_number - 1]
+    
+    assert "Haftalık Toplam" in " ".join(recorded_pages[1])
+    assert "KISIM 1" in " ".join(recorded_pages[3])
+
+def test_failed_chart_gets_placeholder_page(tmp_path, recorded_pages):
+    write_pdf_report(JOBS, output_path=str(tmp_path / "Rapor.pdf"), workers=1)
+    
+    placeholder = recorded_pages[-1]
+    assert "Tezgahlar / M2 Duruşları" in placeholder
+    assert "ValueError: Raporlar/Tezgahlar/M2 Duruşları.png için veri bozuk" in placeholder
+    assert "Sayfa 7" in placeholder
+
+def test_long_table_of_contents_shifts_chart_pages(tmp_path, recorded_pages, monkeypatch):
+    # 6 grafik + 3 bölüm başlığı = 9 satır, sayfa başına 4 satırla 3 içindekiler sayfası
+    monkeypatch.setattr(pdf_report, "TOC_LINES_PER_PAGE", 4)
+    path, _ = write_pdf_report(JOBS, output_path=str(tmp_path / "Rapor.pdf"), workers=1)
+    
+    assert pdf_page_count(path) == 3 + len(JOBS)
+    assert "İçindekiler (devam)" in recorded_pages[2]
+    assert "4" in recorded_pages[0]
+    assert "Sayfa 4" in recorded_pages[3]
+    assert "Sayfa 9" in recorded_pages[-1]
@@ -0,0 +1,201 @@
+"""
+Duruş küpü üzerinden yapılan hesaplamaların eski satır bazlı gruplamalarla
+aynı sonucu verdiğini doğrulayan testler.
+
+legacy_* fonksiyonları küp öncesi hesaplamaların kopyasıdır; yalnızca duruş
+kategorisi tablosuyla birleştirilen iki tutarsızlık (tezgah duruş tipi
+görünümündeki "TASARIM DURUŞU" etiketi ve en büyük 10 duruş görünümünde
+birleştirilmeyen SMED duruşları) ortak kurala göre yazılmıştır.
+"""
+
+import pandas as pd
+import pytest
+
+from src.calculations import (
+    build_stop_cube,
+    calculate_all_part_average_stop_times,
+    calculate_machine_stop_times,
+    calculate_machine_stop_type_times,
+    calculate_stop_time_sum,
+    filter_sort_top_stops,
+    select_top_stops,
+    second_to_minute,
+)
+from src.data_processing import get_latest_week_data, optimize_dtypes
+from src.stop_categories import STOP_CATEGORY_COLUMN, assign_stop_category
+
+KISIM_TEZGAH_SAYILARI = {"KISIM 1": 3, "KISIM 2": 2, "KISIM 3": 4}
+WEEKS = [11, 10]
+
+def legacy_calculate_stop_time_sum(df: pd.DataFrame) -> pd.DataFrame:
+    toplam_sureler = df.groupby("Duruş Adı")["Süre (Saniye)"].sum().reset_index()
+    toplam_sureler = toplam_sureler.sort_values(by="Süre (Saniye)", ascending=False)
+    
+    yemek_molasi = toplam_sureler[toplam_sureler['Duruş Adı'].str.contains("YEMEK MOLASI", case=False)]
+    tasarim_duruslari = toplam_sureler[toplam_sureler['Duruş Adı'].str.contains("TASARIM", case=False)]
+    smed_duruslari = toplam_sureler[toplam_sureler['Duruş Adı'].str.contains("SMED", case=False)]
+    
+    new_df = pd.DataFrame({
+        'Duruş Adı': ['YEMEK MOLASI', 'TASARIM DURUŞLARI', 'AYAR'],
+        'Süre (Saniye)': [yemek_molasi['Süre (Saniye)'].sum(), tasarim_duruslari['Süre (Saniye)'].sum(),
+                          smed_duruslari['Süre (Saniye)'].sum()]
+    })
+    toplam_sureler = toplam_sureler[
+        ~toplam_sureler['Duruş Adı'].str.contains("YEMEK MOLASI|TASARIM|SMED", case=False)
+    ]
+    toplam_sureler = pd.concat([toplam_sureler, new_df], ignore_index=True)
+    toplam_sureler = toplam_sureler.sort_values(by="Süre (Saniye)", ascending=False).reset_index(drop=True)
+    return second_to_minute(toplam_sureler)
+
+def legacy_calculate_machine_stop_times(df: pd.DataFrame) -> pd.DataFrame:
+    filtered_df = df[df['Duruş Adı'] != 'ÇALIŞMA SÜRESİ']
+    tezgah_sureleri = filtered_df.groupby("İş Merkezi Kodu ")["Süre (Saniye)"].sum().reset_index()
+    tezgah_sureleri = second_to_minute(tezgah_sureleri)
+    return tezgah_sureleri.sort_values(by="Süre (Dakika)", ascending=True)
+
+def legacy_calculate_machine_stop_type_times(df: pd.DataFrame) -> pd.DataFrame:
+    ozet = df.groupby(["İş Merkezi Kodu ", "Duruş Adı"])["Süre (Saniye)"].sum().reset_index()
+    
+    merged = []
+    for mask, label in [
+        (ozet['Duruş Adı'].str.startswith("YEMEK MOLASI"), "YEMEK MOLASI"),
+        (ozet['Duruş Adı'].str.startswith("TASARIM"), "TASARIM DURUŞLARI"),
+        (ozet['Duruş Adı'].str.contains("SMED", case=False), "AYAR"),
+    ]:
+        toplam = ozet[mask].groupby("İş Merkezi Kodu ")['Süre (Saniye)'].sum().reset_index()
+        toplam['Duruş Adı'] = label
+        merged.append(toplam)
+    
+    ozet = ozet[~ozet['Duruş Adı'].str.startswith("YEMEK MOLASI")]
+    ozet = ozet[~ozet['Duruş Adı'].str.startswith("TASARIM")]
+    ozet = ozet[~ozet['Duruş Adı'].str.contains("SMED")]
+    return second_to_minute(pd.concat([ozet] + merged, ignore_index=True))
+
+def legacy_filter_sort_top_stops(df: pd.DataFrame, max_week: int, gozlemlenecek: str) -> pd.DataFrame:
+    grouped_df = df.groupby([gozlemlenecek, 'Hafta', 'Duruş Adı'])['Süre (Saniye)'].sum().reset_index()
+    if gozlemlenecek == 'KISIM':
+        grouped_df = grouped_df[grouped_df[gozlemlenecek] != 'Diğer']
+    
+    grouped_df['Duruş Adı'] = grouped_df['Duruş Adı'].apply(
+        lambda x: 'YEMEK MOLASI' if 'YEMEK MOLASI' in x
+        else ('TASARIM DURUŞLARI' if 'TASARIM' in x else ('AYAR' if 'SMED' in x else x))
+    )
+    grouped_df = grouped_df.groupby([gozlemlenecek, 'Hafta', 'Duruş Adı'], as_index=False)['Süre (Saniye)'].sum()
+    
+    latest_week_df = grouped_df[grouped_df['Hafta'] == max_week]
+    top10 = (
+        latest_week_df.sort_values([gozlemlenecek, 'Süre (Saniye)'], ascending=[True, False])
+        .groupby(gozlemlenecek)
+        .head(10)
+        .reset_index(drop=True)
+    )
+    filtered_df = grouped_df.merge(top10[[gozlemlenecek, 'Duruş Adı']], on=[gozlemlenecek, 'Duruş Adı'])
+    filtered_df = filtered_df.sort_values(by='Süre (Saniye)', ascending=False)
+    return second_to_minute(filtered_df)
+
+def legacy_calculate_part_average_stop_times(df: pd.DataFrame, kisim: str) -> pd.DataFrame:
+    kisim_for_avg = df[df["KISIM"] == kisim].copy()
+    tezgah_sayisi = KISIM_TEZGAH_SAYILARI.get(kisim, 1)
+    kisim_for_avg['Süre (Saniye)'] = (kisim_for_avg['Süre (Saniye)'] / tezgah_sayisi).astype(int)
+    return legacy_calculate_stop_time_sum(kisim_for_avg)
+
+def raw_frame() -> pd.DataFrame:
+    """
+    Birden çok satırı aynı anahtara düşen, iki haftalık küçük bir analiz veri seti oluşturur.
+    
+    M1 tezgahında son haftada 12 farklı duruş vardır (en büyük 10 seçimi sınanır);
+    AYAR BEKLEME adı SMED içermediği için birleştirilmemelidir.
+    """
+    machines = {"M1": "KISIM 1", "M2": "KISIM 1", "M3": "KISIM 2", "M4": "Diğer"}
+    names = ["ARIZA", "YEMEK MOLASI", "YEMEK MOLASI 2", "TASARIM ONAY", "SMED HAZIRLIK",
+             "AYAR BEKLEME", "MALZEME BEKLEME", "OPERATÖR YOK", "KALİTE KONTROL",
+             "BAKIM", "TEMİZLİK", "EĞİTİM", "ÇALIŞMA SÜRESİ"]
+    
+    rows = []
+    seed = 7
+    for week in WEEKS:
+        for m, (machine, kisim) in enumerate(machines.items()):
+            for n, name in enumerate(names if machine == "M1" else names[m:m + 7]):
+                for repeat in range(2):
+                    # Eşit toplamlar oluşmaması için farklı süreler
+                    seed = (seed * 7919 + 104729) % 100003
+                    seconds = 60 * (5 + n) + seed % 3000 + repeat * 17
+                    rows.append((machine, kisim, week, name, seconds))
+    
+    df = pd.DataFrame(rows, columns=["İş Merkezi Kodu ", "KISIM", "Hafta", "Duruş Adı", "Süre (Saniye)"])
+    df["Süre (Dakika)"] = (df["Süre (Saniye)"] / 60).astype(int)
+    return df
+
+def plain(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Karşılaştırma için kategorik sütunları metne çevirip indeksi sıfırlar.
+    """
+    df = df.reset_index(drop=True)
+    return df.astype({col: object for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)})
+
+@pytest.fixture(scope="module")
+def frames():
+    raw = raw_frame()
+    # Analiz veri seti prepare_data_for_analysis'teki gibi kategorik sütunlar taşır
+    df = optimize_dtypes(raw)
+    df[STOP_CATEGORY_COLUMN] = assign_stop_category(df["Duruş Adı"])
+    
+    cube = build_stop_cube(df, KISIM_TEZGAH_SAYILARI)
+    return {
+        "raw": raw,
+        "raw_latest": get_latest_week_data(raw, WEEKS),
+        "cube": cube,
+        "cube_latest": get_latest_week_data(cube, WEEKS),
+    }
+
+def test_cube_is_smaller_than_raw_frame(frames):
+    assert len(frames["cube"]) < len(frames["raw"])
+
+def test_stop_time_sum_matches_legacy(frames):
+    expected = legacy_calculate_stop_time_sum(frames["raw_latest"])
+    result = calculate_stop_time_sum(frames["cube_latest"])
+    
+    pd.testing.assert_frame_equal(plain(result), plain(expected), check_dtype=False)
+    assert "AYAR BEKLEME" in result["Duruş Adı"].tolist()
+
+def test_stop_time_sum_keeps_zero_rows_for_missing_categories(frames):
+    latest = frames["cube_latest"]
+    result = calculate_stop_time_sum(latest[latest["Duruş Adı"] != "AYAR"])
+    
+    assert result.loc[result["Duruş Adı"] == "AYAR", "Süre (Saniye)"].tolist() == [0]
+
+def test_machine_stop_times_match_legacy(frames):
+    expected = legacy_calculate_machine_stop_times(frames["raw_latest"])
+    result = calculate_machine_stop_times(frames["cube_latest"])
+    
+    pd.testing.assert_frame_equal(plain(result), plain(expected), check_dtype=False)
+
+def test_machine_stop_type_times_match_legacy(frames):
+    # Eski hesaplama birleşik satırları sona ekliyordu; grafikler tezgah başına süreye göre
+    # sıraladığı için satır sırası anlamsızdır ve karşılaştırmadan önce sabitlenir
+    keys = ["İş Merkezi Kodu ", "Duruş Adı"]
+    expected = plain(legacy_calculate_machine_stop_type_times(frames["raw_latest"])).sort_values(keys)
+    result = plain(calculate_machine_stop_type_times(frames["cube_latest"])).sort_values(keys)
+    
+    pd.testing.assert_frame_equal(plain(result), plain(expected), check_dtype=False)
+
+@pytest.mark.parametrize("level", ["KISIM", "İş Merkezi Kodu "])
+def test_top_stops_match_legacy(frames, level):
+    expected = legacy_filter_sort_top_stops(frames["raw"], WEEKS[0], level)
+    combined = select_top_stops(frames["cube"], levels=["KISIM", "İş Merkezi Kodu "], n=10,
+                                reference_week=WEEKS[0])[level]
+    single = filter_sort_top_stops(frames["cube"], max_week=WEEKS[0], gozlemlenecek=level)
+    
+    pd.testing.assert_frame_equal(plain(combined), plain(expected), check_dtype=False)
+    pd.testing.assert_frame_equal(plain(single), plain(expected), check_dtype=False)
+    if level == "İş Merkezi Kodu ":
+        assert combined.loc[combined["Hafta"] == WEEKS[0], level].eq("M1").sum() == 10
+
+def test_part_average_stop_times_match_legacy(frames):
+    results = calculate_all_part_average_stop_times(frames["cube_latest"], KISIM_TEZGAH_SAYILARI)
+    
+    # KISIM 3'ün verisi yoktur; eski hesaplama yalnızca sıfır süreli birleşik satırları döndürür
+    assert list(results) == list(KISIM_TEZGAH_SAYILARI)
+    for kisim, result in results.items():
+        expected = legacy_calculate_part_average_stop_times(frames["raw_latest"], kisim)
+        pd.testing.assert_frame_equal(plain(result), plain(expected), check_dtype=False)
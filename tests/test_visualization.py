@@ -0,0 +1,115 @@
+"""
+Yeniden kullanılan grafik şablon şekillerinin önceki grafikten durum taşımadığını,
+OEE kartlarının çıktı profilinin biçimiyle kaydedildiğini ve mozaik yerleşimini
+doğrulayan testler.
+"""
+
+import matplotlib as mpl
+import pandas as pd
+import pytest
+from matplotlib.patches import Patch
+from PIL import Image
+
+from src.rendering import get_output_profile, job_outputs, run_render_jobs
+from src.visualization import (
+    SUBPLOT_PARAMS, build_mosaic, chart_figure, finish_chart, oee_card_jobs, oee_mosaic_jobs
+)
+
+FIGSIZE = (6, 4)
+
+def decorate(fig, ax, title: str) -> None:
+    """
+    Eksen dışındaki şekil durumunu değiştiren bir grafik gibi çizer.
+    """
+    ax.bar(["A", "B"], [1, 2])
+    fig.legend(handles=[Patch(label="A")], loc="lower center")
+    fig.suptitle(title)
+    fig.text(0.01, 0.01, "not")
+    fig.subplots_adjust(bottom=0.3, top=0.8)
+
+def assert_clean(fig, ax) -> None:
+    assert fig.legends == []
+    assert fig.texts == []
+    assert len(ax.patches) == 0
+    for name in SUBPLOT_PARAMS:
+        assert getattr(fig.subplotpars, name) == mpl.rcParams[f"figure.subplot.{name}"]
+    assert tuple(ax.get_position().bounds) == tuple(ax.get_subplotspec().get_position(fig).bounds)
+
+def test_finish_chart_resets_template_figure(tmp_path):
+    fig, ax = chart_figure("test-finish", FIGSIZE)
+    decorate(fig, ax, "İlk")
+    finish_chart(fig, str(tmp_path / "ilk.png"), save=False)
+    
+    again, ax = chart_figure("test-finish", FIGSIZE)
+    assert again is fig
+    assert_clean(again, ax)
+    
+    # Sıfırlanan başlık sonraki grafikte yeniden oluşturulabilir
+    title = again.suptitle("İkinci")
+    assert title in again.texts
+
+def test_template_is_reset_after_failed_chart():
+    # Grafik finish_chart'a ulaşmadan hata vermiş gibi
+    fig, ax = chart_figure("test-failed", FIGSIZE)
+    decorate(fig, ax, "Yarım")
+    fig.tight_layout()
+    
+    again, ax = chart_figure("test-failed", FIGSIZE)
+    assert again is fig
+    assert_clean(again, ax)
+
+def test_reused_template_saves_same_image_as_new_figure(tmp_path):
+    fig, ax = chart_figure("test-same", FIGSIZE)
+    ax.bar(["A", "B"], [1, 2])
+    fig.savefig(tmp_path / "ilk.png", dpi=50)
+    decorate(fig, ax, "Başka")
+    finish_chart(fig, str(tmp_path / "baska.png"), save=False)
+    
+    fig, ax = chart_figure("test-same", FIGSIZE)
+    ax.bar(["A", "B"], [1, 2])
+    fig.savefig(tmp_path / "ikinci.png", dpi=50)
+    
+    assert (tmp_path / "ilk.png").read_bytes() == (tmp_path / "ikinci.png").read_bytes()
+
+def oee_rows() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Hafta": [10, 11, 10, 11],
+        "Seviye": ["Genel", "Genel", "Tezgah", "Tezgah"],
+        "Varlık": ["Genel", "Genel", "M1", "M1"],
+        "Oee": [0.5, 0.6, 0.4, 0.45],
+        "Performans": [0.8, 0.8, 0.7, 0.7],
+        "Kullanılabilirlik": [0.7, 0.75, 0.6, 0.65],
+        "Kalite": [0.9, 0.95, 0.95, 0.98],
+    })
+
+@pytest.mark.parametrize("profile_name, extension", [("preview", ".webp"), ("print", ".png"), ("vector", ".png")])
+def test_oee_cards_follow_raster_profile_format(tmp_path, monkeypatch, profile_name, extension):
+    monkeypatch.chdir(tmp_path)
+    profile = get_output_profile("oee_card", profile_name)
+    jobs = oee_card_jobs(oee_rows(), profile, sheets="ek") + oee_mosaic_jobs(oee_rows(), [11, 10], True, profile)
+    
+    results = run_render_jobs(jobs, workers=1)
+    
+    assert not any(result.error for result in results)
+    outputs = [path for job in jobs for path in job_outputs(job)]
+    assert len(set(outputs)) == 8
+    for path in outputs:
+        assert path.endswith(extension)
+        with Image.open(path) as image:
+            assert image.format == extension[1:].upper()
+
+def test_build_mosaic_places_images_in_grid():
+    images = [Image.new("RGB", size, color) for size, color in [
+        ((30, 20), "red"), ((10, 40), "green"), ((20, 10), "blue")
+    ]]
+    
+    row = build_mosaic(images[:2])
+    assert row.size == (40, 40)
+    assert row.getpixel((0, 0)) == (255, 0, 0)
+    assert row.getpixel((30, 0)) == (0, 128, 0)
+    assert row.getpixel((0, 30)) == (0, 0, 0)
+    
+    grid = build_mosaic(images, ncols=2, gap=2, background=(210, 210, 210))
+    assert grid.size == (30 + 10 + 3 * 2, 40 + 10 + 3 * 2)
+    assert grid.getpixel((2, 44)) == (0, 0, 255)
+    assert grid.getpixel((34, 44)) == (210, 210, 210)